@@ -0,0 +1,179 @@
+"""
+Strategy Pattern - adaptacyjny wybór strategii według opóźnień
+
+AdaptiveTaskManager sam wybiera strategię dla każdego zadania zamiast
+ręcznego set_strategy(). Dla każdej zarejestrowanej strategii śledzi EWMA
+i opóźnienie ogonowe (p99) z processing_time, a zadanie kieruje do
+najtańszej strategii, która mieści się w budżecie opóźnienia dla jego
+priorytetu. Strategia, która się zdegradowała, jest pomijana - co
+probe_every pominięć dostaje jedno zadanie próbne. Próba w budżecie
+zaczyna okno od nowa, więc strategia wraca od razu, bez wypychania
+całego okna złych próbek.
+
+>>> from starter import TaskProcessor
+>>> class Fixed(TaskProcessor):
+...     def __init__(self, name, latency):
+...         self.name, self.latency = name, latency
+...     def process_task(self, task):
+...         return {"status": "completed", "processing_time": self.latency,
+...                 "strategy_used": self.name}
+>>> manager = AdaptiveTaskManager(budgets={TaskPriority.URGENT: 0.05}, min_samples=1)
+>>> manager.register(Fixed("cheap", 0.5), cost=1)
+>>> manager.register(Fixed("fast", 0.01), cost=10)
+>>> task = WorkflowTask("Breach", TaskPriority.URGENT, "Fix")
+>>> manager.execute_task(task)["strategy_used"]  # brak danych - najtańsza
+'cheap'
+>>> manager.execute_task(task)["strategy_used"]  # cheap przekracza budżet
+'fast'
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from starter import TaskManager, TaskPriority, TaskProcessor, WorkflowTask
+
+
+# Domyślne budżety opóźnienia (s) - odpowiadają czasom strategii z laba
+DEFAULT_BUDGETS: Dict[TaskPriority, float] = {
+    TaskPriority.URGENT: 0.05,
+    TaskPriority.HIGH: 1.5,
+    TaskPriority.MEDIUM: 1.5,
+    TaskPriority.LOW: 5.0,
+}
+
+
+class LatencyTracker:
+    """EWMA i percentyl ogonowy z okna ostatnich próbek"""
+
+    def __init__(self, alpha: float = 0.2, window: int = 256, quantile: float = 0.99):
+        self.alpha = alpha
+        self.quantile = quantile
+        self.ewma: Optional[float] = None
+        self.samples = 0
+        self._window: Deque[float] = deque(maxlen=window)
+        self._tail: Optional[float] = None
+
+    def record(self, latency: float) -> None:
+        self.ewma = latency if self.ewma is None else self.alpha * latency + (1 - self.alpha) * self.ewma
+        self.samples += 1
+        self._window.append(latency)
+        self._tail = None  # Przelicz leniwie przy następnym odczycie
+
+    def restart(self, latency: float) -> None:
+        """Zacznij okno i EWMA od jednej próbki (np. po udanym zadaniu próbnym)"""
+        self._window.clear()
+        self.ewma = None
+        self.record(latency)
+
+    def tail(self) -> Optional[float]:
+        """Percentyl `quantile` z okna (nearest-rank), None gdy brak próbek"""
+        if self._tail is None and self._window:
+            ordered = sorted(self._window)
+            self._tail = ordered[max(0, math.ceil(self.quantile * len(ordered)) - 1)]
+        return self._tail
+
+
+class _Candidate:
+    """Zarejestrowana strategia z kosztem i statystykami"""
+
+    def __init__(self, name: str, processor: TaskProcessor, cost: float,
+                 priorities: Optional[List[TaskPriority]], tracker: LatencyTracker):
+        self.name = name
+        self.processor = processor
+        self.cost = cost
+        self.priorities = set(priorities) if priorities else set(TaskPriority)
+        self.tracker = tracker
+        self.skipped = 0
+
+
+class AdaptiveTaskManager(TaskManager):
+    """
+    TaskManager z automatycznym wyborem strategii
+
+    Bez zarejestrowanych strategii działa jak zwykły TaskManager
+    (ręczne set_strategy() + execute_task())
+    """
+
+    def __init__(self, budgets: Optional[Dict[TaskPriority, float]] = None,
+                 alpha: float = 0.2, window: int = 256,
+                 min_samples: int = 5, probe_every: int = 50):
+        super().__init__()
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+        self.budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self.alpha = alpha
+        self.window = window
+        self.min_samples = min_samples
+        self.probe_every = probe_every
+        self._candidates: List[_Candidate] = []
+        self._lock = threading.Lock()
+
+    def register(self, processor: TaskProcessor, cost: float,
+                 priorities: Optional[List[TaskPriority]] = None,
+                 name: Optional[str] = None) -> None:
+        """
+        Zarejestruj strategię do wyboru adaptacyjnego
+
+        cost - względny koszt strategii (tańsza wybierana pierwsza)
+        priorities - priorytety, które strategia może obsłużyć (domyślnie wszystkie)
+        """
+        candidate = _Candidate(name or type(processor).__name__, processor, cost,
+                               priorities, LatencyTracker(self.alpha, self.window))
+        with self._lock:
+            self._candidates.append(candidate)
+            self._candidates.sort(key=lambda c: c.cost)
+
+    def select_strategy(self, task: WorkflowTask) -> TaskProcessor:
+        """Najtańsza strategia, której p99 mieści się w budżecie priorytetu zadania"""
+        return self._select(task)[0].processor
+
+    def execute_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        if not self._candidates:
+            return super().execute_task(task)
+        candidate, probe = self._select(task)
+        start_time = time.time()
+        try:
+            result = candidate.processor.process_task(task)
+        except Exception:
+            self._record(candidate, time.time() - start_time)
+            raise
+        latency = result.get("processing_time", time.time() - start_time)
+        self._record(candidate, latency, probe and latency <= self.budgets[task.priority])
+        return result
+
+    def latency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """EWMA, p99 i liczba próbek per strategia"""
+        with self._lock:
+            return {
+                c.name: {"ewma": c.tracker.ewma, "p99": c.tracker.tail(), "samples": c.tracker.samples}
+                for c in self._candidates
+            }
+
+    def _select(self, task: WorkflowTask) -> Tuple[_Candidate, bool]:
+        """(strategia, czy to zadanie próbne zdegradowanej strategii)"""
+        budget = self.budgets[task.priority]
+        with self._lock:
+            eligible = [c for c in self._candidates if task.priority in c.priorities]
+            if not eligible:
+                raise ValueError(f"No strategy registered for priority: {task.priority}")
+            for candidate in eligible:
+                tracker = candidate.tracker
+                if tracker.samples < self.min_samples or tracker.tail() <= budget:
+                    return candidate, False
+                # Zdegradowana strategia - co probe_every pominięć jedno zadanie próbne
+                candidate.skipped += 1
+                if candidate.skipped >= self.probe_every:
+                    candidate.skipped = 0
+                    return candidate, True
+            # Nikt nie mieści się w budżecie - najszybsza według EWMA
+            return min(eligible, key=lambda c: c.tracker.ewma), False
+
+    def _record(self, candidate: _Candidate, latency: float, recovered: bool = False) -> None:
+        with self._lock:
+            if recovered:
+                candidate.tracker.restart(latency)
+            else:
+                candidate.tracker.record(latency)
@@ -0,0 +1,157 @@
+"""
+Strategy Pattern - asynchroniczne strategie przetwarzania zadań
+
+Wersja dla serwisów opartych o asyncio: time.sleep() blokuje całą pętlę
+zdarzeń, asyncio.sleep() nie. Wszystkie zadania w locie obsługuje jeden wątek.
+
+>>> import asyncio
+>>> manager = AsyncTaskManager(AsyncUrgentTaskProcessor())
+>>> task = WorkflowTask("Security breach", TaskPriority.URGENT, "Critical fix needed")
+>>> result = asyncio.run(manager.execute_task(task))
+>>> result["status"], result["strategy_used"]
+('completed', 'urgent')
+
+>>> # Zmiana strategii w runtime - jak w TaskManager
+>>> manager.set_strategy(AsyncBackgroundTaskProcessor())
+>>> tasks = [WorkflowTask(f"Docs {i}", TaskPriority.LOW, "Update") for i in range(3)]
+>>> results = asyncio.run(manager.execute_many(tasks))
+>>> [r["strategy_used"] for r in results]
+['background', 'background', 'background']
+"""
+
+import asyncio
+import time
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+from starter import TaskPriority, WorkflowTask
+
+
+# %% Async Strategy Interface
+# WZORZEC: Strategy - ten sam kontrakt co TaskProcessor, ale process_task() jest awaitable
+
+class AsyncTaskProcessor(ABC):
+    """Interface dla asynchronicznych strategii przetwarzania zadań"""
+
+    name: str = ""
+
+    @abstractmethod
+    async def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        """Przetworz zadanie i zwróć wynik"""
+        pass
+
+    def _result(self, start_time: float, validation_passed: bool) -> Dict[str, Any]:
+        return {
+            "status": "completed",
+            "processing_time": time.time() - start_time,
+            "strategy_used": self.name,
+            "validation_passed": validation_passed,
+        }
+
+
+# %% Concrete Async Strategies
+
+class AsyncUrgentTaskProcessor(AsyncTaskProcessor):
+    """Natychmiastowe przetwarzanie - walidacja: priority == URGENT i jest opis"""
+
+    name = "urgent"
+
+    async def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        start_time = time.time()
+        validation_passed = task.priority == TaskPriority.URGENT and bool(task.description)
+        task.mark_completed()
+        return self._result(start_time, validation_passed)
+
+
+class AsyncStandardTaskProcessor(AsyncTaskProcessor):
+    """Normalne przetwarzanie (~1s) - walidacja: tytuł ma przynajmniej 3 znaki"""
+
+    name = "standard"
+    delay = 1.0
+
+    async def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        start_time = time.time()
+        validation_passed = len(task.title) >= 3
+        await asyncio.sleep(self.delay)
+        task.mark_completed()
+        return self._result(start_time, validation_passed)
+
+
+class AsyncBackgroundTaskProcessor(AsyncTaskProcessor):
+    """Przetwarzanie w tle (~0.1s) - walidacja: priority != URGENT"""
+
+    name = "background"
+    delay = 0.1
+
+    async def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        start_time = time.time()
+        validation_passed = task.priority != TaskPriority.URGENT
+        await asyncio.sleep(self.delay)
+        task.mark_completed()
+        return self._result(start_time, validation_passed)
+
+
+# %% Async Context
+# WZORZEC: Context - deleguje do strategii, dodatkowo ogranicza współbieżność
+
+class AsyncTaskManager:
+    """
+    Asynchroniczny TaskManager z limitem współbieżności per strategia
+
+    KLUCZOWE: każda strategia (po nazwie) ma własny semafor - zalew zadań jednej
+    strategii nie zajmuje slotów pozostałych. Zadania ponad limit czekają
+    na semaforze (koszt: jedna korutyna, nie wątek)
+    """
+
+    def __init__(self, strategy: Optional[AsyncTaskProcessor] = None,
+                 max_concurrency: int = 100,
+                 limits: Optional[Dict[str, int]] = None):
+        self.strategy = strategy
+        self.max_concurrency = max_concurrency
+        # Limity nadpisane dla konkretnych strategii, po AsyncTaskProcessor.name
+        self.limits = dict(limits or {})
+        # pętla -> {nazwa strategii: semafor}. Semafor jest związany z pętlą zdarzeń,
+        # więc każda pętla ma własne - manager działa w kolejnych asyncio.run()
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._in_flight: Dict[str, int] = {}
+
+    def set_strategy(self, strategy: AsyncTaskProcessor) -> None:
+        """Ustawia nową strategię przetwarzania"""
+        self.strategy = strategy
+
+    def in_flight(self, name: str) -> int:
+        """Ile zadań danej strategii jest teraz przetwarzanych"""
+        return self._in_flight.get(name, 0)
+
+    async def execute_task(self, task: WorkflowTask,
+                           strategy: Optional[AsyncTaskProcessor] = None) -> Dict[str, Any]:
+        """Deleguje do strategii (domyślnie bieżącej) w ramach jej limitu"""
+        strategy = strategy or self.strategy
+        if strategy is None:
+            raise ValueError("No strategy set")
+        async with self._semaphore(strategy):
+            self._in_flight[strategy.name] = self._in_flight.get(strategy.name, 0) + 1
+            try:
+                return await strategy.process_task(task)
+            finally:
+                self._in_flight[strategy.name] -= 1
+
+    async def execute_many(self, tasks: Iterable[WorkflowTask]) -> List[Dict[str, Any]]:
+        """Wykonaj zadania współbieżnie bieżącą strategią - wyniki w kolejności zadań"""
+        if self.strategy is None:
+            raise ValueError("No strategy set")
+        strategy = self.strategy
+        return await asyncio.gather(*(self.execute_task(task, strategy) for task in tasks))
+
+    def _semaphore(self, strategy: AsyncTaskProcessor) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._semaphores[loop] = {}
+        # Po nazwie, jak limits i in_flight - nowa instancja tej samej strategii dzieli limit
+        semaphore = semaphores.get(strategy.name)
+        if semaphore is None:
+            limit = self.limits.get(strategy.name, self.max_concurrency)
+            semaphore = semaphores[strategy.name] = asyncio.Semaphore(limit)
+        return semaphore
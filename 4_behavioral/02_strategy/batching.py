@@ -0,0 +1,99 @@
+"""
+Strategy Pattern - strategia zbierająca zadania w paczki
+
+BackgroundTaskProcessor płaci stały koszt (symulowane 0.1s) za każde
+zadanie. BatchTaskProcessor buforuje zadania, aż paczka osiągnie
+max_batch albo najstarsze zadanie poczeka max_wait sekund, i przetwarza
+całą paczkę jednym przebiegiem - stały koszt dzielony jest na wszystkie
+zadania w paczce. To nadal zwykła strategia: process_task(task) -> dict.
+
+>>> processor = BatchTaskProcessor(max_batch=3, fixed_cost=0.01)
+>>> tasks = [WorkflowTask(f"Cleanup {i}", TaskPriority.LOW, "Old files") for i in range(3)]
+>>> results = processor.process_batch(tasks)
+>>> [r["batch_size"] for r in results]
+[3, 3, 3]
+>>> results[0]["strategy_used"], results[0]["validation_passed"]
+('batch', True)
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+from starter import TaskPriority, TaskProcessor, WorkflowTask
+
+
+class _Batch:
+    """Zadania zebrane do jednego przebiegu"""
+
+    def __init__(self):
+        self.tasks: List[WorkflowTask] = []
+        self.enqueued_at: List[float] = []
+        self.results: List[Dict[str, Any]] = []
+        self.done = threading.Event()
+
+
+class BatchTaskProcessor(TaskProcessor):
+    """
+    Strategia dla zadań w tle przetwarzająca je paczkami
+
+    KLUCZOWE: process_task() blokuje wywołującego do czasu przetworzenia
+    jego paczki. Paczkę przetwarza wątek, który ją zapełnił, albo - gdy
+    zadań jest mało - pierwsze zadanie paczki po upływie max_wait
+    """
+
+    def __init__(self, max_batch: int = 32, max_wait: float = 0.05, fixed_cost: float = 0.1):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Symulowany stały koszt jednego przebiegu (jak time.sleep(0.1) w BackgroundTaskProcessor)
+        self.fixed_cost = fixed_cost
+        self._lock = threading.Lock()
+        self._current = _Batch()
+
+    def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        with self._lock:
+            batch = self._current
+            position = len(batch.tasks)
+            batch.tasks.append(task)
+            batch.enqueued_at.append(time.time())
+            full = len(batch.tasks) >= self.max_batch
+            if full:
+                self._current = _Batch()
+
+        if full:
+            self._run(batch)
+        elif position == 0 and not batch.done.wait(self.max_wait):
+            # Pierwsze zadanie paczki pilnuje limitu czasu
+            with self._lock:
+                expired = self._current is batch
+                if expired:
+                    self._current = _Batch()
+            if expired:
+                self._run(batch)
+        batch.done.wait()
+        return batch.results[position]
+
+    def process_batch(self, tasks: List[WorkflowTask]) -> List[Dict[str, Any]]:
+        """Przetwórz gotową listę zadań jednym przebiegiem (bez buforowania)"""
+        batch = _Batch()
+        batch.tasks = list(tasks)
+        batch.enqueued_at = [time.time()] * len(batch.tasks)
+        self._run(batch)
+        return batch.results
+
+    def _run(self, batch: _Batch) -> None:
+        validation = [task.priority != TaskPriority.URGENT for task in batch.tasks]
+        time.sleep(self.fixed_cost)  # Jeden stały koszt na całą paczkę
+        finished_at = time.time()
+        size = len(batch.tasks)
+        for task, enqueued_at, validation_passed in zip(batch.tasks, batch.enqueued_at, validation):
+            task.mark_completed()
+            batch.results.append({
+                "status": "completed",
+                # Czas od wejścia do bufora - obejmuje czekanie na paczkę
+                "processing_time": finished_at - enqueued_at,
+                "strategy_used": "batch",
+                "validation_passed": validation_passed,
+                "batch_size": size,
+            })
+        batch.done.set()
@@ -0,0 +1,294 @@
+"""
+Benchmark - rozszerzenia Strategy Pattern
+
+Podkomendy:
+- stealing: przepustowość WorkStealingRuntime przy skośnym ruchu
+  (work stealing vs statyczny podział zadań między managery)
+- wheel: koszt wstawienia, anulowania i wygaszenia n timerów
+  (HierarchicalTimingWheel vs kopiec heapq z leniwym anulowaniem)
+- compact: zadania/s i bajty na zadanie - WorkflowTask z __dict__ i
+  datetime.now() vs slotowy WorkflowTask z wynikiem dict albo TaskResult
+- tracing: narzut TracedTaskManager dla różnych sample_rate względem TaskManager
+
+Uruchomienie (po zaimplementowaniu TaskManager):
+    python benchmark.py stealing
+    python benchmark.py stealing --managers 8 --tasks 2000 --skew 0.9 --delay 0.001
+    python benchmark.py wheel --timers 1000000
+    python benchmark.py compact --tasks 200000
+    python benchmark.py tracing --work 0.0001 --rates 0 0.01 1
+"""
+
+import argparse
+import heapq
+import itertools
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from starter import TaskManager, TaskPriority, TaskProcessor, TaskResult, WorkflowTask
+from timing_wheel import HierarchicalTimingWheel
+from tracing import Tracer, TracedTaskManager
+from work_stealing import WorkStealingRuntime
+
+
+class SleepTaskProcessor(TaskProcessor):
+    """Strategia symulująca pracę I/O (time.sleep zwalnia GIL)"""
+
+    def __init__(self, name: str, delay: float):
+        self.name = name
+        self.delay = delay
+
+    def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        time.sleep(self.delay)
+        task.mark_completed()
+        return {"status": "completed", "processing_time": self.delay,
+                "strategy_used": self.name, "validation_passed": True}
+
+
+# %% Work stealing
+
+def skewed_assignment(tasks: int, managers: int, skew: float, seed: int) -> List[int]:
+    """Manager docelowy każdego zadania: udział skew trafia do managera 0, reszta losowo"""
+    rng = random.Random(seed)
+    return [0 if rng.random() < skew else rng.randrange(managers) for _ in range(tasks)]
+
+
+def run_stealing(assignment: List[int], managers: int, delay: float, steal: bool) -> Dict[str, Any]:
+    runtime_managers = []
+    for index in range(managers):
+        manager = TaskManager()
+        manager.set_strategy(SleepTaskProcessor(f"tenant-{index}", delay))
+        runtime_managers.append(manager)
+    runtime = WorkStealingRuntime(runtime_managers, steal=steal)
+    futures = [runtime.submit(index, WorkflowTask(f"Task {i}", TaskPriority.MEDIUM, "Load"))
+               for i, index in enumerate(assignment)]
+
+    start = time.perf_counter()
+    runtime.start()
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - start
+    runtime.stop()
+
+    stats = runtime.stats()
+    return {
+        "elapsed": elapsed,
+        "throughput": len(assignment) / elapsed,
+        "executed": [s["executed"] for s in stats],
+        "stolen": sum(s["stolen"] for s in stats),
+    }
+
+
+def bench_stealing(args: argparse.Namespace) -> None:
+    assignment = skewed_assignment(args.tasks, args.managers, args.skew, args.seed)
+    print(f"{args.tasks} tasks, {args.managers} managers, skew={args.skew}, delay={args.delay}s")
+    print(f"{'mode':>8} | {'tasks/s':>10} | {'elapsed s':>10} | {'stolen':>7} | executed per manager")
+    for mode, steal in (("static", False), ("stealing", True)):
+        result = run_stealing(assignment, args.managers, args.delay, steal)
+        print(f"{mode:>8} | {result['throughput']:>10.0f} | {result['elapsed']:>10.3f} | "
+              f"{result['stolen']:>7} | {result['executed']}")
+
+
+# %% Koło czasowe
+
+def run_wheel(delays: List[int], cancel_every: int) -> Dict[str, float]:
+    wheel = HierarchicalTimingWheel(wheel_size=256, levels=4)
+    start = time.perf_counter()
+    timers = [wheel.schedule(delay, None) for delay in delays]
+    inserted = time.perf_counter()
+    for timer in timers[::cancel_every]:
+        wheel.cancel(timer)
+    cancelled = time.perf_counter()
+    fired = 0
+    while len(wheel):
+        fired += len(wheel.advance(1))
+    return {"insert": inserted - start, "cancel": cancelled - inserted,
+            "expire": time.perf_counter() - cancelled, "fired": fired}
+
+
+def run_heap(delays: List[int], cancel_every: int) -> Dict[str, float]:
+    heap: List[list] = []
+    sequence = itertools.count()
+    start = time.perf_counter()
+    entries = []
+    for delay in delays:
+        entry = [delay, next(sequence), True]
+        heapq.heappush(heap, entry)
+        entries.append(entry)
+    inserted = time.perf_counter()
+    for entry in entries[::cancel_every]:
+        entry[2] = False  # Leniwe anulowanie - wpis zostaje w kopcu
+    cancelled = time.perf_counter()
+    fired = 0
+    while heap:
+        fired += heapq.heappop(heap)[2]
+    return {"insert": inserted - start, "cancel": cancelled - inserted,
+            "expire": time.perf_counter() - cancelled, "fired": fired}
+
+
+def bench_wheel(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    delays = [rng.randint(1, args.horizon) for _ in range(args.timers)]
+    print(f"{args.timers} timers, delay 1..{args.horizon} ticks, cancel every {args.cancel_every}th")
+    print(f"{'variant':>8} | {'insert ns':>10} | {'cancel ns':>10} | {'expire ns':>10} | "
+          f"{'total s':>8} | {'fired':>9}")
+    for name, run in (("heap", run_heap), ("wheel", run_wheel)):
+        result = run(delays, args.cancel_every)
+        cancelled = len(delays[::args.cancel_every])
+        print(f"{name:>8} | {result['insert'] / len(delays) * 1e9:>10.0f} | "
+              f"{result['cancel'] / cancelled * 1e9:>10.0f} | "
+              f"{result['expire'] / len(delays) * 1e9:>10.0f} | "
+              f"{result['insert'] + result['cancel'] + result['expire']:>8.2f} | {result['fired']:>9}")
+
+
+# %% Kompaktowe zadania i wyniki
+
+class LegacyWorkflowTask:
+    """Dawny WorkflowTask: __dict__ i dwa wywołania datetime.now()"""
+
+    def __init__(self, title: str, priority: TaskPriority, description: str,
+                 idempotency_key: Optional[str] = None, deadline: Optional[datetime] = None):
+        self.title = title
+        self.priority = priority
+        self.description = description
+        self.idempotency_key = idempotency_key
+        self.deadline = deadline
+        self.cancelled = False
+        self.created_at = datetime.now()
+        self.completed_at = None
+
+    def mark_completed(self):
+        self.completed_at = datetime.now()
+
+
+def process_dict(task) -> Dict[str, Any]:
+    task.mark_completed()
+    return {"status": "completed", "processing_time": 0.0,
+            "strategy_used": "bench", "validation_passed": True}
+
+
+def process_result(task) -> TaskResult:
+    task.mark_completed()
+    return TaskResult("completed", 0.0, "bench", True)
+
+
+COMPACT_VARIANTS: Dict[str, tuple] = {
+    "legacy+dict": (LegacyWorkflowTask, process_dict),
+    "slots+dict": (WorkflowTask, process_dict),
+    "slots+result": (WorkflowTask, process_result),
+}
+
+
+def run_compact(task_class: type, process: Callable, tasks: int) -> float:
+    """Zadania/s: utworzenie zadania, przetworzenie, odczyt result["status"]"""
+    completed = 0
+    start = time.perf_counter()
+    for _ in range(tasks):
+        task = task_class("Ingest", TaskPriority.MEDIUM, "payload")
+        completed += process(task)["status"] == "completed"
+    return completed / (time.perf_counter() - start)
+
+
+def bytes_per_task(task_class: type, process: Callable, tasks: int) -> float:
+    """Pamięć żywych zadań razem z ich wynikami (tracemalloc)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = []
+    for _ in range(tasks):
+        task = task_class("Ingest", TaskPriority.MEDIUM, "payload")
+        kept.append((task, process(task)))
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / tasks
+
+
+def bench_compact(args: argparse.Namespace) -> None:
+    print(f"{args.tasks} tasks (best of {args.repeat})")
+    print(f"{'variant':>13} | {'tasks/s':>10} | {'bytes/task':>10}")
+    for name, (task_class, process) in COMPACT_VARIANTS.items():
+        rate = max(run_compact(task_class, process, args.tasks) for _ in range(args.repeat))
+        size = bytes_per_task(task_class, process, min(args.tasks, 50_000))
+        print(f"{name:>13} | {rate:>10.0f} | {size:>10.0f}")
+
+
+# %% Tracing
+
+class BusyTaskProcessor(TaskProcessor):
+    """Strategia zajmująca CPU przez work sekund (bez sleep - mierzymy czysty narzut)"""
+
+    def __init__(self, work: float):
+        self.work = work
+
+    def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        end = time.perf_counter() + self.work
+        while time.perf_counter() < end:
+            pass
+        task.mark_completed()
+        return {"status": "completed", "processing_time": self.work,
+                "strategy_used": "busy", "validation_passed": True}
+
+
+def run_tracing(manager: TaskManager, tasks: int) -> float:
+    start = time.perf_counter()
+    for _ in range(tasks):
+        manager.execute_task(WorkflowTask("Traced", TaskPriority.MEDIUM, "payload"))
+    return time.perf_counter() - start
+
+
+def bench_tracing(args: argparse.Namespace) -> None:
+    processor = BusyTaskProcessor(args.work)
+    baseline = TaskManager()
+    baseline.set_strategy(processor)
+    base = min(run_tracing(baseline, args.tasks) for _ in range(args.repeat))
+    print(f"{args.tasks} tasks, work={args.work}s per task (best of {args.repeat})")
+    print(f"{'sample_rate':>11} | {'tasks/s':>10} | {'overhead %':>10}")
+    print(f"{'baseline':>11} | {args.tasks / base:>10.0f} | {0.0:>10.2f}")
+    with tempfile.TemporaryDirectory() as directory:
+        for rate in args.rates:
+            with Tracer(os.path.join(directory, f"trace-{rate}.json"), sample_rate=rate) as tracer:
+                manager = TracedTaskManager(processor, tracer)
+                elapsed = min(run_tracing(manager, args.tasks) for _ in range(args.repeat))
+            print(f"{rate:>11} | {args.tasks / elapsed:>10.0f} | {(elapsed / base - 1) * 100:>10.2f}")
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark rozszerzeń Strategy Pattern")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stealing = commands.add_parser("stealing", help="work stealing vs statyczny podział")
+    stealing.add_argument("--managers", type=int, default=4)
+    stealing.add_argument("--tasks", type=int, default=1_000)
+    stealing.add_argument("--skew", type=float, default=0.8, help="udział zadań managera 0")
+    stealing.add_argument("--delay", type=float, default=0.002, help="czas pracy strategii (s)")
+    stealing.add_argument("--seed", type=int, default=42)
+    stealing.set_defaults(run=bench_stealing)
+
+    wheel = commands.add_parser("wheel", help="koło czasowe vs kopiec")
+    wheel.add_argument("--timers", type=int, default=200_000)
+    wheel.add_argument("--horizon", type=int, default=10_000, help="maksymalne opóźnienie (ticki)")
+    wheel.add_argument("--cancel-every", type=int, default=10)
+    wheel.add_argument("--seed", type=int, default=42)
+    wheel.set_defaults(run=bench_wheel)
+
+    compact = commands.add_parser("compact", help="kompaktowe zadania i wyniki")
+    compact.add_argument("--tasks", type=int, default=200_000)
+    compact.add_argument("--repeat", type=int, default=3)
+    compact.set_defaults(run=bench_compact)
+
+    tracing = commands.add_parser("tracing", help="narzut spanów")
+    tracing.add_argument("--tasks", type=int, default=20_000)
+    tracing.add_argument("--work", type=float, default=0.0001, help="czas pracy strategii (s)")
+    tracing.add_argument("--rates", type=float, nargs="+", default=[0.0, 0.01, 0.1, 1.0])
+    tracing.add_argument("--repeat", type=int, default=3)
+    tracing.set_defaults(run=bench_tracing)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Strategy Pattern - terminy zadań (EDF), limity czasu i anulowanie
+
+WorkflowTask może mieć deadline. DeadlineScheduler to PriorityTaskScheduler
+w trybie earliest-deadline-first: z kopca wychodzi zadanie z najbliższym
+terminem (zadania bez terminu na końcu, FIFO). Przed uruchomieniem:
+- zadanie po terminie jest odrzucane ("expired") - nie zajmuje workera
+- zadanie anulowane (task.cancel()) jest pomijane ("cancelled")
+W trakcie: strategia dostaje najwyżej timeout sekund (i nie dłużej niż do
+terminu). Po przekroczeniu worker idzie dalej ("timeout"), a zadanie
+dostaje task.cancel() - strategia może to sprawdzić i przerwać pracę.
+Timeout jedzie we wpisie kopca razem z zadaniem. Zadania z limitem czasu
+wykonuje stała pula timeout_threads wątków (nie wątek na zadanie) - czas
+czekania na wolny wątek wlicza się do limitu.
+Każdy wynik ma "deadline_missed" - tylko expired, timeout albo
+ukończenie po terminie (błąd zadania bez terminu to nie spóźnienie).
+
+>>> from datetime import datetime, timedelta
+>>> from starter import TaskProcessor
+>>> class Echo(TaskProcessor):
+...     def process_task(self, task):
+...         task.mark_completed()
+...         return {"status": "completed", "strategy_used": "echo"}
+>>> scheduler = DeadlineScheduler({priority: Echo() for priority in TaskPriority})
+>>> now = datetime.now()
+>>> later = scheduler.submit(WorkflowTask("Later", TaskPriority.URGENT, "x", deadline=now + timedelta(minutes=5)))
+>>> sooner = scheduler.submit(WorkflowTask("Sooner", TaskPriority.LOW, "x", deadline=now + timedelta(minutes=1)))
+>>> stale = scheduler.submit(WorkflowTask("Stale", TaskPriority.URGENT, "x", deadline=now - timedelta(seconds=1)))
+>>> scheduler.run_pending()
+3
+>>> stale.result()["status"], sooner.result()["status"], later.result()["deadline_missed"]
+('expired', 'completed', False)
+"""
+
+import math
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from scheduler import PriorityTaskScheduler
+from starter import TaskPriority, TaskProcessor, WorkflowTask
+
+
+class DeadlineScheduler(PriorityTaskScheduler):
+    """
+    Kolejka EDF z limitami czasu i kooperacyjnym anulowaniem
+
+    default_timeout - limit czasu strategii dla zadań bez własnego timeout
+    timeout_threads - ile strategii może naraz działać pod limitem czasu
+    (także tych porzuconych po przekroczeniu, dopóki się nie skończą)
+    """
+
+    def __init__(self, processors: Dict[TaskPriority, TaskProcessor],
+                 default_timeout: Optional[float] = None, timeout_threads: int = 8):
+        super().__init__(processors)
+        self.default_timeout = default_timeout
+        self.timeout_threads = timeout_threads
+        self._timed_pool = _TimedPool(timeout_threads)
+        # Wątki puli nie trzymają schedulera - zamykają się, gdy ten zniknie
+        weakref.finalize(self, self._timed_pool.shutdown)
+        self.deadline_stats = {"completed": 0, "expired": 0, "cancelled": 0, "timeout": 0, "missed": 0}
+        self._stats_lock = threading.Lock()
+
+    def submit(self, task: WorkflowTask, timeout: Optional[float] = None) -> Future:
+        """Wstaw zadanie; timeout nadpisuje default_timeout dla tego zadania"""
+        return self._push(task, self.default_timeout if timeout is None else timeout)
+
+    def _key(self, task: WorkflowTask, enqueued_at: float) -> float:
+        # EDF: najbliższy termin pierwszy; bez terminu - na końcu (remis rozstrzyga kolejność zgłoszeń)
+        return task.deadline.timestamp() if task.deadline else math.inf
+
+    def stop(self, wait: bool = True) -> None:
+        super().stop(wait)
+        self._timed_pool.shutdown()
+
+    def _execute(self, task: WorkflowTask, timeout: Optional[float] = None) -> Dict[str, Any]:
+        if task.cancelled:
+            return self._finish(task, self._skipped("cancelled"))
+        remaining = self._remaining(task)
+        if remaining is not None and remaining <= 0:
+            return self._finish(task, self._skipped("expired"))
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        processor = self.processors[task.priority]
+        if timeout is None:
+            return self._finish(task, processor.process_task(task))
+        return self._finish(task, self._run_with_timeout(processor, task, timeout))
+
+    def _run_with_timeout(self, processor: TaskProcessor, task: WorkflowTask,
+                          timeout: float) -> Dict[str, Any]:
+        """Strategia w wątku z puli - worker czeka najwyżej timeout sekund"""
+        start_time = time.time()
+        outcome = self._timed_pool.submit(processor, task)
+        try:
+            return outcome.result(timeout=timeout)
+        except TimeoutError:
+            outcome.cancel()  # Jeszcze czeka na wątek - nie zostanie uruchomione
+            task.cancel()  # Kooperacyjnie: strategia może sprawdzić task.cancelled
+            result = self._skipped("timeout")
+            result["processing_time"] = time.time() - start_time
+            return result
+
+    @staticmethod
+    def _remaining(task: WorkflowTask) -> Optional[float]:
+        if task.deadline is None:
+            return None
+        return (task.deadline - datetime.now()).total_seconds()
+
+    @staticmethod
+    def _skipped(status: str) -> Dict[str, Any]:
+        return {"status": status, "processing_time": 0.0, "strategy_used": None,
+                "validation_passed": False}
+
+    def _finish(self, task: WorkflowTask, result: Dict[str, Any]) -> Dict[str, Any]:
+        remaining = self._remaining(task)
+        # Tylko termin decyduje - błąd albo anulowanie zadania bez terminu to nie spóźnienie
+        result["deadline_missed"] = (result["status"] in ("expired", "timeout")
+                                     or (remaining is not None and remaining < 0))
+        with self._stats_lock:
+            status = result["status"]
+            self.deadline_stats[status] = self.deadline_stats.get(status, 0) + 1
+            self.deadline_stats["missed"] += result["deadline_missed"]
+        return result
+
+
+
+class _TimedPool:
+    """
+    Ograniczona pula wątków (demonów) dla strategii z limitem czasu
+
+    Wątki startują leniwie - nowy tylko wtedy, gdy wszystkie są zajęte,
+    najwyżej size. Strategia porzucona po przekroczeniu limitu zajmuje
+    wątek, dopóki sama się nie skończy
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._queue: "queue.SimpleQueue[Optional[Tuple[TaskProcessor, WorkflowTask, Future]]]" = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._unfinished = 0
+
+    def submit(self, processor: TaskProcessor, task: WorkflowTask) -> Future:
+        outcome: Future = Future()
+        with self._lock:
+            self._unfinished += 1
+            if self._unfinished > len(self._threads) and len(self._threads) < self.size:
+                thread = threading.Thread(target=self._run, name=f"deadline-{len(self._threads)}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self._queue.put((processor, task, outcome))
+        return outcome
+
+    def shutdown(self) -> None:
+        """Zakończ wątki po bieżących zadaniach (pula może wystartować je ponownie)"""
+        with self._lock:
+            for _ in self._threads:
+                self._queue.put(None)
+            self._threads.clear()
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            processor, task, outcome = entry
+            try:
+                if not outcome.set_running_or_notify_cancel():
+                    continue  # Limit czasu minął, zanim zadanie dostało wątek
+                try:
+                    outcome.set_result(processor.process_task(task))
+                except Exception as error:
+                    outcome.set_exception(error)
+            finally:
+                with self._lock:
+                    self._unfinished -= 1
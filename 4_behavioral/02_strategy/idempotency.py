@@ -0,0 +1,140 @@
+"""
+Strategy Pattern - idempotentne wykonanie zadań
+
+Klienci ponawiają execute_task() dla tego samego logicznego zadania, a
+każda próba uruchamia strategię od nowa. IdempotentTaskManager liczy klucz
+zadania (jawny idempotency_key albo skrót title/description/priority):
+- duplikat w locie czeka na wynik pierwszego wykonania
+- wynik ukończonego zadania jest zwracany z ograniczonej pamięci TTL (LRU)
+- hit_rate() i stats() pokazują skuteczność
+
+>>> from starter import TaskPriority, TaskProcessor
+>>> class Counting(TaskProcessor):
+...     calls = 0
+...     def process_task(self, task):
+...         Counting.calls += 1
+...         task.mark_completed()
+...         return {"status": "completed", "strategy_used": "counting"}
+>>> manager = IdempotentTaskManager(ttl=60)
+>>> manager.set_strategy(Counting())
+>>> task = WorkflowTask("Invoice 42", TaskPriority.HIGH, "Send invoice")
+>>> retry = WorkflowTask("Invoice 42", TaskPriority.HIGH, "Send invoice")
+>>> manager.execute_task(task) == manager.execute_task(retry)
+True
+>>> Counting.calls, manager.stats()["hits"]
+(1, 1)
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+from starter import TaskManager, WorkflowTask
+
+
+def task_key(task: WorkflowTask) -> str:
+    """Klucz idempotencji: jawny task.idempotency_key albo skrót treści zadania"""
+    if task.idempotency_key:
+        return task.idempotency_key
+    content = "\x1f".join((task.title, task.description, task.priority.value))
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class IdempotentTaskManager(TaskManager):
+    """
+    TaskManager wykonujący każde logiczne zadanie najwyżej raz w oknie TTL
+
+    Nieudane wykonania (wyjątek albo status inny niż "completed") nie są
+    zapamiętywane - ponowienie uruchamia strategię jeszcze raz. Duplikaty
+    czekające na pierwsze wykonanie dostają ten sam wyjątek lub wynik.
+    Każdy wywołujący dostaje własną kopię wyniku - zmiana zwróconego
+    słownika nie psuje pamięci podręcznej
+    """
+
+    def __init__(self, strategy=None, ttl: float = 300.0, max_entries: int = 10_000):
+        super().__init__()
+        self.strategy = strategy
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._completed: "OrderedDict[str, tuple]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._hits = self._joins = self._misses = 0
+
+    def execute_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        key = task_key(task)
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is not None:
+                self._hits += 1
+                task.mark_completed()
+                return dict(cached)
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._joins += 1
+                leader = False
+            else:
+                self._misses += 1
+                future = self._in_flight[key] = Future()
+                leader = True
+
+        if not leader:
+            result = future.result()
+            task.mark_completed()
+            return dict(result)
+
+        try:
+            result = super().execute_task(task)
+        except BaseException as error:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(error)
+            raise
+        stored = dict(result)
+        with self._lock:
+            del self._in_flight[key]
+            if stored.get("status") == "completed":
+                self._store(key, stored)
+        future.set_result(stored)
+        return result
+
+    def invalidate(self, task: WorkflowTask) -> None:
+        """Usuń zapamiętany wynik zadania"""
+        with self._lock:
+            self._completed.pop(task_key(task), None)
+
+    def hit_rate(self) -> float:
+        """Udział wywołań obsłużonych bez uruchamiania strategii"""
+        total = self._hits + self._joins + self._misses
+        return (self._hits + self._joins) / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "joins": self._joins,
+                "misses": self._misses,
+                "hit_rate": self.hit_rate(),
+                "entries": len(self._completed),
+                "in_flight": len(self._in_flight),
+            }
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._completed.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._completed[key]
+            return None
+        self._completed.move_to_end(key)
+        return result
+
+    def _store(self, key: str, result: Dict[str, Any]) -> None:
+        self._completed[key] = (time.monotonic() + self.ttl, result)
+        self._completed.move_to_end(key)
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
@@ -0,0 +1,323 @@
+"""
+Generator obciążenia i benchmark potoku zadań Strategy Pattern
+
+Generuje syntetyczny strumień WorkflowTask (mieszanka priorytetów,
+przybycia Poissona albo paczkami, skalowanie time.sleep w strategiach),
+przepuszcza go przez wybrane strategie i tryb wykonania, a na wyjściu
+drukuje JSON: przepustowość, opóźnienia p50/p95/p99 (od planowanego
+przybycia do wyniku - razem z kolejką) i zużycie CPU. Te same argumenty
+i --seed dają ten sam strumień, więc tryby można porównywać na jednej maszynie.
+
+Tryby wykonania:
+- sync       - jeden wątek, execute_task() po kolei
+- threads    - pula wątków (--workers), TaskManager per strategia
+- scheduler  - PriorityTaskScheduler z --workers wątkami
+- async      - AsyncTaskManager i asynchroniczne odpowiedniki strategii
+
+Uruchomienie (po zaimplementowaniu strategii i TaskManager):
+    python loadgen.py --mode threads --workers 16 --tasks 2000 --rate 500 --sleep-scale 0.01
+    python loadgen.py --mode scheduler --arrival bursty --burst 50 --mix urgent=1,low=3
+    python loadgen.py --mode async --strategy priority --output async.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from async_strategy import (
+    AsyncBackgroundTaskProcessor, AsyncStandardTaskProcessor, AsyncTaskManager,
+    AsyncTaskProcessor, AsyncUrgentTaskProcessor,
+)
+from metrics import LatencyHistogram
+from scheduler import PriorityTaskScheduler
+from starter import (
+    BackgroundTaskProcessor, StandardTaskProcessor, TaskManager, TaskPriority,
+    TaskProcessor, UrgentTaskProcessor, WorkflowTask,
+)
+
+
+MODES = ("sync", "threads", "scheduler", "async")
+
+DEFAULT_MIX = {TaskPriority.URGENT: 0.1, TaskPriority.HIGH: 0.2,
+               TaskPriority.MEDIUM: 0.3, TaskPriority.LOW: 0.4}
+
+# Strategia "priority" - każdy priorytet do swojej strategii
+PRIORITY_STRATEGIES = {
+    TaskPriority.URGENT: "urgent",
+    TaskPriority.HIGH: "standard",
+    TaskPriority.MEDIUM: "standard",
+    TaskPriority.LOW: "background",
+}
+
+SYNC_STRATEGIES: Dict[str, Callable[[], TaskProcessor]] = {
+    "urgent": UrgentTaskProcessor,
+    "standard": StandardTaskProcessor,
+    "background": BackgroundTaskProcessor,
+}
+
+ASYNC_STRATEGIES: Dict[str, type] = {
+    "urgent": AsyncUrgentTaskProcessor,
+    "standard": AsyncStandardTaskProcessor,
+    "background": AsyncBackgroundTaskProcessor,
+}
+
+
+# %% Strumień zadań
+
+def parse_mix(text: str) -> Dict[TaskPriority, float]:
+    """"urgent=1,low=3" -> udziały priorytetów (znormalizowane)"""
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        weights[TaskPriority(name.strip().lower())] = float(weight or 1)
+    total = sum(weights.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError("mix weights must be positive")
+    return {priority: weight / total for priority, weight in weights.items()}
+
+
+def arrivals(count: int, rate: float, pattern: str, burst: int, rng: random.Random) -> List[float]:
+    """
+    Przesunięcia przybyć (s od startu)
+
+    rate <= 0 - wszystko od razu; poisson - wykładnicze odstępy o średniej
+    1/rate; bursty - paczki po burst zadań co burst/rate sekund (ta sama
+    średnia częstość, ale skoki kolejki)
+    """
+    if rate <= 0:
+        return [0.0] * count
+    if pattern == "poisson":
+        offsets, now = [], 0.0
+        for _ in range(count):
+            now += rng.expovariate(rate)
+            offsets.append(now)
+        return offsets
+    return [(index // burst) * burst / rate for index in range(count)]
+
+
+def generate(args: argparse.Namespace) -> List[Tuple[float, WorkflowTask]]:
+    """Deterministyczny (--seed) strumień par (przesunięcie przybycia, zadanie)"""
+    rng = random.Random(args.seed)
+    priorities, weights = zip(*args.mix.items())
+    offsets = arrivals(args.tasks, args.rate, args.arrival, args.burst, rng)
+    stream = []
+    for index, offset in enumerate(offsets):
+        priority = rng.choices(priorities, weights)[0]
+        stream.append((offset, WorkflowTask(f"Task {index}", priority, f"Synthetic load {index}")))
+    return stream
+
+
+# %% Skalowanie sleep
+
+class _ScaledTime:
+    """Moduł time widziany przez strategie - sleep() razy factor"""
+
+    def __init__(self, factor: float):
+        self.factor = factor
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds * self.factor)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(time, name)
+
+
+@contextmanager
+def scaled_sleep(factor: float) -> Iterator[None]:
+    """
+    Na czas pomiaru skróć (factor < 1) albo wydłuż time.sleep() w strategiach
+
+    Podmienia nazwę time w module, w którym zdefiniowano process_task
+    każdej strategii (zwykle starter.py)
+    """
+    namespaces = {}
+    for cls in SYNC_STRATEGIES.values():
+        process_task = getattr(cls, "process_task", None)
+        namespace = getattr(process_task, "__globals__", {})
+        if namespace.get("time") is time:
+            namespaces[id(namespace)] = namespace
+    for namespace in namespaces.values():
+        namespace["time"] = _ScaledTime(factor)
+    try:
+        yield
+    finally:
+        for namespace in namespaces.values():
+            namespace["time"] = time
+
+
+# %% Pomiar
+
+class _Recorder:
+    """Histogramy opóźnień (ogółem i per priorytet) oraz licznik błędów"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.total = LatencyHistogram()
+        self.by_priority = {priority: LatencyHistogram() for priority in TaskPriority}
+        self.errors = 0
+
+    def record(self, task: WorkflowTask, arrived: float, result: Optional[Dict[str, Any]]) -> None:
+        latency = time.perf_counter() - arrived
+        with self.lock:
+            self.total.record(latency)
+            self.by_priority[task.priority].record(latency)
+            self.errors += result is None or result.get("status") != "completed"
+
+
+def _strategy_name(args: argparse.Namespace, priority: TaskPriority) -> str:
+    return PRIORITY_STRATEGIES[priority] if args.strategy == "priority" else args.strategy
+
+
+def _wait_until(moment: float) -> None:
+    delay = moment - time.perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def run_sync(args, stream, recorder: _Recorder, start: float) -> None:
+    managers = _managers(args)
+    for offset, task in stream:
+        _wait_until(start + offset)
+        recorder.record(task, start + offset, _safe(managers[task.priority].execute_task, task))
+
+
+def run_threads(args, stream, recorder: _Recorder, start: float) -> None:
+    managers = _managers(args)
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        for offset, task in stream:
+            _wait_until(start + offset)
+            pool.submit(lambda t=task, a=start + offset:
+                        recorder.record(t, a, _safe(managers[t.priority].execute_task, t)))
+
+
+def run_scheduler(args, stream, recorder: _Recorder, start: float) -> None:
+    processors = {priority: SYNC_STRATEGIES[_strategy_name(args, priority)]() for priority in TaskPriority}
+    scheduler = PriorityTaskScheduler(processors)
+    scheduler.start(workers=args.workers)
+    for offset, task in stream:
+        _wait_until(start + offset)
+        future = scheduler.submit(task)
+        future.add_done_callback(lambda f, t=task, a=start + offset:
+                                 recorder.record(t, a, None if f.exception() else f.result()))
+    scheduler.stop(wait=True)
+
+
+def run_async(args, stream, recorder: _Recorder, start: float) -> None:
+    async def main():
+        strategies: Dict[str, AsyncTaskProcessor] = {}
+        for name, cls in ASYNC_STRATEGIES.items():
+            strategies[name] = cls()
+            if hasattr(cls, "delay"):
+                strategies[name].delay = cls.delay * args.sleep_scale
+        manager = AsyncTaskManager(max_concurrency=args.workers)
+
+        async def one(offset: float, task: WorkflowTask):
+            await asyncio.sleep(max(0.0, start + offset - time.perf_counter()))
+            try:
+                result = await manager.execute_task(task, strategies[_strategy_name(args, task.priority)])
+            except Exception:
+                result = None
+            recorder.record(task, start + offset, result)
+
+        await asyncio.gather(*(one(offset, task) for offset, task in stream))
+
+    asyncio.run(main())
+
+
+def _managers(args: argparse.Namespace) -> Dict[TaskPriority, TaskManager]:
+    """TaskManager per priorytet (ze strategią tego priorytetu)"""
+    managers = {}
+    for priority in TaskPriority:
+        manager = TaskManager()
+        manager.set_strategy(SYNC_STRATEGIES[_strategy_name(args, priority)]())
+        managers[priority] = manager
+    return managers
+
+
+def _safe(execute: Callable[[WorkflowTask], Dict[str, Any]], task: WorkflowTask) -> Optional[Dict[str, Any]]:
+    try:
+        return execute(task)
+    except Exception:
+        return None
+
+
+RUNNERS = {"sync": run_sync, "threads": run_threads, "scheduler": run_scheduler, "async": run_async}
+
+
+def _latency_ms(histogram: LatencyHistogram) -> Dict[str, float]:
+    return {
+        "count": histogram.total,
+        "p50": round(histogram.percentile(50) * 1000, 3),
+        "p95": round(histogram.percentile(95) * 1000, 3),
+        "p99": round(histogram.percentile(99) * 1000, 3),
+        "max": round(histogram.max * 1000, 3),
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Wygeneruj strumień, przepuść go przez tryb args.mode i zwróć raport"""
+    stream = generate(args)
+    recorder = _Recorder()
+    with scaled_sleep(args.sleep_scale):
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        RUNNERS[args.mode](args, stream, recorder, start)
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+    return {
+        "mode": args.mode,
+        "strategy": args.strategy,
+        "workers": args.workers,
+        "tasks": args.tasks,
+        "arrival": args.arrival if args.rate > 0 else "all-at-once",
+        "rate": args.rate,
+        "sleep_scale": args.sleep_scale,
+        "mix": {priority.value: round(share, 4) for priority, share in args.mix.items()},
+        "elapsed_s": round(elapsed, 4),
+        "throughput": round(args.tasks / elapsed, 2),
+        "errors": recorder.errors,
+        "latency_ms": _latency_ms(recorder.total),
+        "latency_ms_by_priority": {priority.value: _latency_ms(histogram)
+                                   for priority, histogram in recorder.by_priority.items()
+                                   if histogram.total},
+        "cpu_s": round(cpu, 4),
+        "cpu_percent": round(cpu / elapsed * 100, 1),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generator obciążenia dla strategii TaskManager")
+    parser.add_argument("--mode", choices=MODES, default="threads")
+    parser.add_argument("--strategy", choices=["priority", *SYNC_STRATEGIES], default="priority",
+                        help="priority: strategia wg priorytetu zadania")
+    parser.add_argument("--workers", type=int, default=8, help="wątki (threads/scheduler) albo limit współbieżności (async)")
+    parser.add_argument("--tasks", type=int, default=1_000)
+    parser.add_argument("--rate", type=float, default=0.0, help="średnio zadań/s (0 - wszystkie od razu)")
+    parser.add_argument("--arrival", choices=["poisson", "bursty"], default="poisson")
+    parser.add_argument("--burst", type=int, default=20, help="rozmiar paczki dla --arrival bursty")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="udziały priorytetów, np. urgent=1,high=2,medium=3,low=4")
+    parser.add_argument("--sleep-scale", type=float, default=0.01, help="mnożnik time.sleep w strategiach")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="zapisz JSON do pliku zamiast na stdout")
+    return parser
+
+
+def main(argv: List[str] = None) -> None:
+    args = build_parser().parse_args(argv)
+    report = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
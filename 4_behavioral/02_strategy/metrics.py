@@ -0,0 +1,263 @@
+"""
+Strategy Pattern - metryki wydajności per strategia i priorytet
+
+MeteredTaskManager to TaskManager, który przy każdym execute_task()
+zapisuje: histogram opóźnień (HDR - kubełki log-liniowe, ~1% precyzji),
+liczbę zadań, błędy i liczbę zadań w locie. Seria metryk to para
+(strategia, priorytet). Zapis to jedna blokada i kilka inkrementacji.
+
+>>> from starter import TaskProcessor
+>>> class Echo(TaskProcessor):
+...     name = "echo"
+...     def process_task(self, task):
+...         return {"status": "completed", "strategy_used": "echo"}
+>>> manager = MeteredTaskManager()
+>>> manager.set_strategy(Echo())
+>>> for _ in range(3):
+...     _ = manager.execute_task(WorkflowTask("Docs", TaskPriority.LOW, "Update"))
+>>> snapshot = manager.metrics()
+>>> snapshot["by_strategy"]["echo"]["count"], snapshot["by_priority"]["low"]["errors"]
+(3, 0)
+>>> 'task_requests_total{strategy="echo",priority="low"} 3' in manager.render_metrics()
+True
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from starter import TaskManager, TaskPriority, WorkflowTask
+
+
+# Granice kubełków (s) w formacie tekstowym - jak domyślne kubełki Prometheusa
+EXPOSITION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """
+    Histogram w stylu HDR: kubełki log-liniowe po mikrosekundach
+
+    Wartości < 2^precision_bits mają własne kubełki, większe dzielą każdą
+    potęgę dwójki na 2^(precision_bits-1) kubełków - błąd względny
+    ~1/2^(precision_bits-1) przy pamięci rosnącej logarytmicznie
+    """
+
+    def __init__(self, precision_bits: int = 7):
+        self._bits = precision_bits
+        self._half = 1 << (precision_bits - 1)
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = int(seconds * 1_000_000)
+        shift = micros.bit_length() - self._bits
+        index = micros if shift <= 0 else (shift * self._half) + (micros >> shift)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def _upper_bound(self, index: int) -> float:
+        """Górna granica kubełka (s)"""
+        if index < 2 * self._half:
+            return (index + 1) / 1_000_000
+        shift = index // self._half - 1
+        return (((index - shift * self._half) + 1) << shift) / 1_000_000
+
+    def percentile(self, percent: float) -> float:
+        if not self.total:
+            return 0.0
+        rank = percent / 100 * self.total
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def cumulative(self, bounds: Tuple[float, ...]) -> List[int]:
+        """Liczba próbek <= każdej granicy (przybliżenie z górnych granic kubełków)"""
+        ordered = sorted((self._upper_bound(index), count) for index, count in self.counts.items())
+        result, seen, position = [], 0, 0
+        for bound in bounds:
+            while position < len(ordered) and ordered[position][0] <= bound:
+                seen += ordered[position][1]
+                position += 1
+            result.append(seen)
+        return result
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "mean": self.sum / self.total if self.total else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max,
+        }
+
+
+class _Series:
+    """Metryki jednej pary (strategia, priorytet)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histogram = LatencyHistogram()
+        self.count = 0
+        self.errors = 0
+        self.in_flight = 0
+
+
+def strategy_label(strategy: Any) -> str:
+    """Nazwa strategii w metrykach - atrybut name albo nazwa klasy"""
+    return getattr(strategy, "name", None) or type(strategy).__name__
+
+
+class TaskMetrics:
+    """Rejestr serii metryk z migawką i formatem tekstowym"""
+
+    def __init__(self):
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def series(self, strategy: str, priority: TaskPriority) -> _Series:
+        key = (strategy, priority.value)
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(key, _Series())
+        return series
+
+    def start(self, series: _Series) -> None:
+        with series.lock:
+            series.in_flight += 1
+
+    def finish(self, series: _Series, seconds: float, failed: bool) -> None:
+        with series.lock:
+            series.in_flight -= 1
+            series.count += 1
+            series.errors += failed
+            series.histogram.record(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Migawka: każda seria oraz agregaty per strategia i per priorytet"""
+        merged: Dict[str, Dict[str, _Series]] = {"by_strategy": {}, "by_priority": {}}
+        series_list = []
+        for (strategy, priority), series in sorted(self._series.items()):
+            with series.lock:
+                copy = _Series()
+                copy.histogram.merge(series.histogram)
+                copy.count, copy.errors, copy.in_flight = series.count, series.errors, series.in_flight
+            series_list.append({"strategy": strategy, "priority": priority, **self._describe(copy)})
+            for group, label in (("by_strategy", strategy), ("by_priority", priority)):
+                total = merged[group].setdefault(label, _Series())
+                total.histogram.merge(copy.histogram)
+                total.count += copy.count
+                total.errors += copy.errors
+                total.in_flight += copy.in_flight
+        return {
+            "series": series_list,
+            "by_strategy": {k: self._describe(v) for k, v in merged["by_strategy"].items()},
+            "by_priority": {k: self._describe(v) for k, v in merged["by_priority"].items()},
+        }
+
+    def render(self) -> str:
+        """Format tekstowy w stylu Prometheusa"""
+        lines = [
+            "# TYPE task_requests_total counter",
+            "# TYPE task_errors_total counter",
+            "# TYPE task_in_flight gauge",
+            "# TYPE task_latency_seconds histogram",
+        ]
+        for (strategy, priority), series in sorted(self._series.items()):
+            labels = f'strategy="{strategy}",priority="{priority}"'
+            with series.lock:
+                count, errors, in_flight = series.count, series.errors, series.in_flight
+                buckets = series.histogram.cumulative(EXPOSITION_BUCKETS)
+                total_seconds = series.histogram.sum
+            lines.append(f"task_requests_total{{{labels}}} {count}")
+            lines.append(f"task_errors_total{{{labels}}} {errors}")
+            lines.append(f"task_in_flight{{{labels}}} {in_flight}")
+            for bound, cumulative in zip(EXPOSITION_BUCKETS, buckets):
+                lines.append(f'task_latency_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'task_latency_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"task_latency_seconds_sum{{{labels}}} {total_seconds}")
+            lines.append(f"task_latency_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _describe(series: _Series) -> Dict[str, Any]:
+        return {
+            "count": series.count,
+            "errors": series.errors,
+            "error_rate": series.errors / series.count if series.count else 0.0,
+            "in_flight": series.in_flight,
+            "latency": series.histogram.summary(),
+        }
+
+
+class MeteredTaskManager(TaskManager):
+    """
+    TaskManager zapisujący metryki każdego execute_task()
+
+    Błąd to wyjątek strategii albo status różny od "completed".
+    execute_many() (GOTOWE w TaskManager) też przechodzi przez execute_task()
+    """
+
+    def __init__(self, strategy=None, registry: Optional[TaskMetrics] = None):
+        super().__init__()
+        self.strategy = strategy
+        self.registry = registry or TaskMetrics()
+
+    def execute_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        if self.strategy is None:
+            return super().execute_task(task)
+        series = self.registry.series(strategy_label(self.strategy), task.priority)
+        self.registry.start(series)
+        start_time = time.perf_counter()
+        failed = True
+        try:
+            result = super().execute_task(task)
+            failed = result.get("status") != "completed"
+            return result
+        finally:
+            self.registry.finish(series, time.perf_counter() - start_time, failed)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Migawka metryk (zob. TaskMetrics.snapshot)"""
+        return self.registry.snapshot()
+
+    def render_metrics(self) -> str:
+        """Metryki w formacie tekstowym dla lokalnego scrapera"""
+        return self.registry.render()
+
+
+def serve_metrics(registry: TaskMetrics, host: str = "127.0.0.1", port: int = 9108) -> ThreadingHTTPServer:
+    """Wystaw registry.render() pod http://host:port/metrics (wątek w tle)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = registry.render().encode()
+            self.send_response(200 if self.path == "/metrics" else 404)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.end_headers()
+            if self.path == "/metrics":
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,135 @@
+"""
+Strategy Pattern - strategia uruchamiana w puli procesów
+
+Strategie wykonujące prawdziwą pracę CPU nie zyskują na wątkach (GIL).
+ProcessPoolTaskProcessor opakowuje dowolną picklowalną strategię i
+uruchamia ją w procesach roboczych - dla TaskManager to nadal zwykły
+TaskProcessor.
+
+Koszt IPC jest mały:
+- strategia trafia do procesu raz, w initializerze puli (nie z każdym zadaniem)
+- zadanie jedzie jako krotka (title, priority, description, created_at,
+  idempotency_key, deadline, cancelled), a wraca wynik i znacznik
+  completed_at - nie cały obiekt WorkflowTask
+- cancelled to stan z chwili wysłania - cancel() wywołane później
+  nie dociera do procesu roboczego
+- process_many() wysyła zadania paczkami (chunksize)
+
+>>> with ProcessPoolTaskProcessor(CpuTaskProcessor(rounds=1000), max_workers=2) as processor:
+...     task = WorkflowTask("Checksum", TaskPriority.MEDIUM, "payload")
+...     result = processor.process_task(task)
+>>> result["strategy_used"], task.completed_at is not None
+('cpu', True)
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from starter import TaskPriority, TaskProcessor, WorkflowTask
+
+
+# Kompaktowy rekord zadania przesyłany między procesami
+TaskRecord = Tuple[str, str, str, float, Optional[str], Optional[float], bool]
+
+
+def to_record(task: WorkflowTask) -> TaskRecord:
+    deadline = None if task.deadline is None else task.deadline.timestamp()
+    return (task.title, task.priority.value, task.description, task.created_at.timestamp(),
+            task.idempotency_key, deadline, task.cancelled)
+
+
+def from_record(record: TaskRecord) -> WorkflowTask:
+    title, priority, description, created_at, idempotency_key, deadline, cancelled = record
+    task = WorkflowTask(title, TaskPriority(priority), description, idempotency_key=idempotency_key,
+                        deadline=None if deadline is None else datetime.fromtimestamp(deadline))
+    task.created_at = datetime.fromtimestamp(created_at)
+    task.cancelled = cancelled
+    return task
+
+
+# %% Strona procesu roboczego
+
+_worker_processor: Optional[TaskProcessor] = None
+
+
+def _init_worker(processor: TaskProcessor) -> None:
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _run_record(record: TaskRecord) -> Tuple[Dict[str, Any], Optional[float]]:
+    task = from_record(record)
+    result = _worker_processor.process_task(task)
+    completed_at = task.completed_at.timestamp() if task.completed_at else None
+    return result, completed_at
+
+
+# %% Strategie
+
+class CpuTaskProcessor(TaskProcessor):
+    """Przykładowa strategia CPU-bound: rounds iteracji SHA-256 po opisie zadania"""
+
+    def __init__(self, rounds: int = 200_000):
+        self.rounds = rounds
+
+    def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        start_time = time.time()
+        digest = task.description.encode()
+        for _ in range(self.rounds):
+            digest = hashlib.sha256(digest).digest()
+        task.mark_completed()
+        return {
+            "status": "completed",
+            "processing_time": time.time() - start_time,
+            "strategy_used": "cpu",
+            "validation_passed": bool(task.description),
+            "checksum": digest.hex()[:16],
+            "worker_pid": os.getpid(),
+        }
+
+
+class ProcessPoolTaskProcessor(TaskProcessor):
+    """
+    Opakowanie strategii uruchamiające ją w puli procesów
+
+    Stan zadania zmieniany w procesie roboczym (completed_at) jest
+    przepisywany z powrotem na obiekt zadania w procesie rodzica
+    """
+
+    def __init__(self, processor: TaskProcessor, max_workers: Optional[int] = None):
+        self.processor = processor
+        self._pool = ProcessPoolExecutor(max_workers=max_workers,
+                                         initializer=_init_worker, initargs=(processor,))
+
+    def process_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        result, completed_at = self._pool.submit(_run_record, to_record(task)).result()
+        self._sync(task, completed_at)
+        return result
+
+    def process_many(self, tasks: Iterable[WorkflowTask], chunksize: int = 16) -> List[Dict[str, Any]]:
+        """Przetwórz wiele zadań - rekordy wysyłane paczkami, wyniki w kolejności zadań"""
+        tasks = list(tasks)
+        outputs = self._pool.map(_run_record, map(to_record, tasks), chunksize=chunksize)
+        results = []
+        for task, (result, completed_at) in zip(tasks, outputs):
+            self._sync(task, completed_at)
+            results.append(result)
+        return results
+
+    def shutdown(self) -> None:
+        self._pool.shutdown()
+
+    def __enter__(self) -> "ProcessPoolTaskProcessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    @staticmethod
+    def _sync(task: WorkflowTask, completed_at: Optional[float]) -> None:
+        if completed_at is not None:
+            task.completed_at = datetime.fromtimestamp(completed_at)
@@ -0,0 +1,216 @@
+"""
+Strategy Pattern - limity przepustowości i backpressure per strategia
+
+Zalew zadań URGENT przeciąża systemy za UrgentTaskProcessor, a nic nie
+spowalnia producentów. RateLimitedTaskManager daje każdej strategii
+token bucket (rate zadań/s + burst) i ograniczoną kolejkę przyjęć:
+- block - czekaj na token (najwyżej max_queue oczekujących, potem odrzuć)
+- reject - brak tokenu od razu kończy się TaskRejected
+- execute_task_async() - czekanie na token bez blokowania pętli asyncio
+Stan limiterów jest częścią metrics() i render_metrics().
+
+>>> bucket = TokenBucket(rate=1.0, burst=2)
+>>> bucket.try_acquire(), bucket.try_acquire(), bucket.try_acquire()
+(True, True, False)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from metrics import MeteredTaskManager, strategy_label
+from starter import TaskProcessor, WorkflowTask
+
+
+class TaskRejected(Exception):
+    """Zadanie odrzucone przez limiter (brak tokenu lub pełna kolejka przyjęć)"""
+
+
+class TokenBucket:
+    """Token bucket: rate tokenów na sekundę, najwyżej burst w zapasie"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Weź token, jeśli jest - nie czeka"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def wait_time(self) -> float:
+        """Ile sekund do następnego tokenu (0 gdy jest dostępny)"""
+        with self._lock:
+            self._refill()
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Czekaj na token najwyżej timeout sekund (None - bez limitu)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.try_acquire():
+            delay = self.wait_time()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Jak acquire(), ale czeka przez asyncio.sleep()"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.try_acquire():
+            delay = self.wait_time()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+        return True
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class _Limiter:
+    """Token bucket z ograniczoną kolejką przyjęć i licznikami"""
+
+    def __init__(self, rate: float, burst: int, max_queue: int):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_queue = max_queue
+        self.lock = threading.Lock()
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "rate": self.bucket.rate,
+            "burst": self.bucket.burst,
+            "tokens": round(self.bucket.tokens, 3),
+            "max_queue": self.max_queue,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class RateLimitedTaskManager(MeteredTaskManager):
+    """
+    TaskManager z limiterem per strategia
+
+    Strategia bez ustawionego limitu działa bez ograniczeń. Tryb
+    domyślny ("block" albo "reject") można nadpisać w wywołaniu
+    """
+
+    BLOCK, REJECT = "block", "reject"
+
+    def __init__(self, strategy: Optional[TaskProcessor] = None, mode: str = BLOCK,
+                 timeout: Optional[float] = None, registry=None):
+        super().__init__(strategy, registry)
+        self.mode = mode
+        self.timeout = timeout
+        self._limiters: Dict[str, _Limiter] = {}
+
+    def set_limit(self, strategy: TaskProcessor, rate: float, burst: int = 1,
+                  max_queue: int = 100) -> None:
+        """Ustaw limit strategii: rate zadań/s, burst w zapasie, max_queue oczekujących"""
+        self._limiters[strategy_label(strategy)] = _Limiter(rate, burst, max_queue)
+
+    def execute_task(self, task: WorkflowTask, mode: Optional[str] = None,
+                     timeout: Optional[float] = None) -> Dict[str, Any]:
+        limiter = self._limiter()
+        if limiter is not None:
+            self._admit(limiter, mode or self.mode, self.timeout if timeout is None else timeout)
+        return super().execute_task(task)
+
+    async def execute_task_async(self, task: WorkflowTask, mode: Optional[str] = None,
+                                 timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Czekanie na token nie blokuje pętli, strategia (synchroniczna) idzie do wątku"""
+        limiter = self._limiter()
+        if limiter is not None:
+            await self._admit_async(limiter, mode or self.mode,
+                                    self.timeout if timeout is None else timeout)
+        return await asyncio.to_thread(super().execute_task, task)
+
+    def metrics(self) -> Dict[str, Any]:
+        snapshot = super().metrics()
+        snapshot["rate_limits"] = {name: limiter.snapshot() for name, limiter in self._limiters.items()}
+        return snapshot
+
+    def render_metrics(self) -> str:
+        lines = [
+            "# TYPE task_rate_limit_tokens gauge",
+            "# TYPE task_admission_waiting gauge",
+            "# TYPE task_admission_rejected_total counter",
+        ]
+        for name, limiter in sorted(self._limiters.items()):
+            state = limiter.snapshot()
+            lines.append(f'task_rate_limit_tokens{{strategy="{name}"}} {state["tokens"]}')
+            lines.append(f'task_admission_waiting{{strategy="{name}"}} {state["waiting"]}')
+            lines.append(f'task_admission_rejected_total{{strategy="{name}"}} {state["rejected"]}')
+        return super().render_metrics() + "\n".join(lines) + "\n"
+
+    def _limiter(self) -> Optional[_Limiter]:
+        if self.strategy is None:
+            return None
+        return self._limiters.get(strategy_label(self.strategy))
+
+    def _enter_queue(self, limiter: _Limiter, mode: str) -> bool:
+        """Szybka ścieżka (token bez czekania) albo miejsce w kolejce przyjęć"""
+        with limiter.lock:
+            # Gdy ktoś już czeka, nowy nie wyprzedza kolejki
+            if limiter.waiting == 0 and limiter.bucket.try_acquire():
+                limiter.admitted += 1
+                return False
+            if mode == self.REJECT or limiter.waiting >= limiter.max_queue:
+                limiter.rejected += 1
+                raise TaskRejected(f"Rate limit exceeded (mode={mode}, waiting={limiter.waiting})")
+            limiter.waiting += 1
+            return True
+
+    def _leave_queue(self, limiter: _Limiter, acquired: bool) -> None:
+        with limiter.lock:
+            limiter.waiting -= 1
+            if acquired:
+                limiter.admitted += 1
+            else:
+                limiter.rejected += 1
+
+    def _admit(self, limiter: _Limiter, mode: str, timeout: Optional[float]) -> None:
+        if self._enter_queue(limiter, mode):
+            acquired = False
+            try:
+                acquired = limiter.bucket.acquire(timeout)
+            finally:
+                self._leave_queue(limiter, acquired)
+            if not acquired:
+                raise TaskRejected("Timed out waiting for rate limit token")
+
+    async def _admit_async(self, limiter: _Limiter, mode: str, timeout: Optional[float]) -> None:
+        if self._enter_queue(limiter, mode):
+            acquired = False
+            try:
+                acquired = await limiter.bucket.acquire_async(timeout)
+            finally:
+                self._leave_queue(limiter, acquired)
+            if not acquired:
+                raise TaskRejected("Timed out waiting for rate limit token")
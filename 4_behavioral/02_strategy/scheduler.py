@@ -0,0 +1,192 @@
+"""
+Strategy Pattern - kolejka priorytetowa przed strategiami
+
+PriorityTaskScheduler przyjmuje WorkflowTask, trzyma je na kopcu według
+TaskPriority i rozdaje wątkom roboczym. Każde zadanie trafia do strategii
+przypisanej do jego priorytetu. Aging podbija efektywny priorytet zadań
+czekających długo - LOW nie zagłodzi się pod ciągłym strumieniem URGENT.
+
+>>> from starter import TaskProcessor
+>>> class EchoProcessor(TaskProcessor):
+...     def process_task(self, task):
+...         task.mark_completed()
+...         return {"status": "completed", "strategy_used": task.priority.value}
+>>> scheduler = PriorityTaskScheduler({priority: EchoProcessor() for priority in TaskPriority})
+>>> low = scheduler.submit(WorkflowTask("Docs", TaskPriority.LOW, "Update"))
+>>> urgent = scheduler.submit(WorkflowTask("Breach", TaskPriority.URGENT, "Fix"))
+>>> scheduler.queue_depth()[TaskPriority.LOW]
+1
+>>> scheduler.run_pending()  # bez wątków - URGENT wychodzi pierwszy
+2
+>>> urgent.result()["strategy_used"], low.result()["strategy_used"]
+('urgent', 'low')
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from starter import TaskPriority, TaskProcessor, WorkflowTask
+
+
+# Pozycja priorytetu w kopcu - mniejsza wartość = wcześniej
+PRIORITY_RANK: Dict[TaskPriority, int] = {
+    TaskPriority.URGENT: 0,
+    TaskPriority.HIGH: 1,
+    TaskPriority.MEDIUM: 2,
+    TaskPriority.LOW: 3,
+}
+
+
+class _PriorityStats:
+    """Metryki jednej klasy priorytetu"""
+
+    def __init__(self):
+        self.depth = 0
+        self.dispatched = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.depth,
+            "dispatched": self.dispatched,
+            "avg_wait": self.total_wait / self.dispatched if self.dispatched else 0.0,
+            "max_wait": self.max_wait,
+        }
+
+
+class PriorityTaskScheduler:
+    """
+    Kopiec zadań z agingiem przed strategiami TaskProcessor
+
+    Klucz kopca: rank priorytetu * aging_interval + czas zgłoszenia.
+    Zadanie o randze o 1 niższej "dogania" wyższe po aging_interval
+    sekundach czekania - to jest aging bez przebudowy kopca, bo klucz
+    liczony jest raz, przy submit()
+    """
+
+    def __init__(self, processors: Dict[TaskPriority, TaskProcessor],
+                 aging_interval: float = 5.0):
+        self.processors = dict(processors)
+        self.aging_interval = aging_interval
+        # (klucz, kolejność, czas zgłoszenia, zadanie, future, dane podklasy z submit)
+        self._heap: List[Tuple[float, int, float, WorkflowTask, Future, Any]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stats = {priority: _PriorityStats() for priority in TaskPriority}
+        self._workers: List[threading.Thread] = []
+        self._running = False
+
+    # %% Przyjmowanie zadań
+
+    def submit(self, task: WorkflowTask) -> Future:
+        """Wstaw zadanie do kolejki, zwraca Future z wynikiem strategii"""
+        return self._push(task, None)
+
+    def _push(self, task: WorkflowTask, context: Any) -> Future:
+        """Wstaw zadanie; context jedzie we wpisie kopca aż do _execute()"""
+        if task.priority not in self.processors:
+            raise ValueError(f"No strategy for priority: {task.priority}")
+        enqueued_at = time.monotonic()
+        key = self._key(task, enqueued_at)
+        future: Future = Future()
+        with self._condition:
+            heapq.heappush(self._heap, (key, next(self._sequence), enqueued_at, task, future, context))
+            self._stats[task.priority].depth += 1
+            self._condition.notify()
+        return future
+
+    def _key(self, task: WorkflowTask, enqueued_at: float) -> float:
+        """Klucz kopca - mniejszy wychodzi wcześniej"""
+        return PRIORITY_RANK[task.priority] * self.aging_interval + enqueued_at
+
+    # %% Wątki robocze
+
+    def start(self, workers: int = 4) -> None:
+        """Uruchom pętle robocze pobierające zadania z kopca"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        for index in range(workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"scheduler-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, wait: bool = True) -> None:
+        """Zatrzymaj wątki robocze; wait=True najpierw opróżnia kolejkę"""
+        with self._condition:
+            if wait:
+                while self._heap and self._running:
+                    self._condition.wait()
+            self._running = False
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+
+    def run_pending(self) -> int:
+        """Przetwórz wszystkie zadania w bieżącym wątku (bez start()) - zwraca ich liczbę"""
+        count = 0
+        while True:
+            entry = self._pop(block=False)
+            if entry is None:
+                return count
+            self._dispatch(*entry)
+            count += 1
+
+    def _worker_loop(self) -> None:
+        while True:
+            entry = self._pop(block=True)
+            if entry is None:
+                return
+            self._dispatch(*entry)
+
+    def _pop(self, block: bool) -> Optional[Tuple[WorkflowTask, Future, Any]]:
+        with self._condition:
+            while True:
+                if block and not self._running:
+                    return None
+                if self._heap:
+                    break
+                if not block:
+                    return None
+                self._condition.wait()
+            _, _, enqueued_at, task, future, context = heapq.heappop(self._heap)
+            wait = time.monotonic() - enqueued_at
+            stats = self._stats[task.priority]
+            stats.depth -= 1
+            stats.dispatched += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            # Budzi stop(wait=True) czekające na pustą kolejkę
+            self._condition.notify_all()
+        return task, future, context
+
+    def _dispatch(self, task: WorkflowTask, future: Future, context: Any) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(self._execute(task, context))
+        except Exception as error:
+            future.set_exception(error)
+
+    def _execute(self, task: WorkflowTask, context: Any = None) -> Dict[str, Any]:
+        """Wykonaj zadanie strategią przypisaną do jego priorytetu"""
+        return self.processors[task.priority].process_task(task)
+
+    # %% Metryki
+
+    def queue_depth(self) -> Dict[TaskPriority, int]:
+        """Liczba czekających zadań per priorytet"""
+        with self._condition:
+            return {priority: stats.depth for priority, stats in self._stats.items()}
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Głębokość kolejki, liczba wydanych zadań i czas czekania (s) per priorytet"""
+        with self._condition:
+            return {priority.value: stats.snapshot() for priority, stats in self._stats.items()}
@@ -0,0 +1,64 @@
+"""
+Strategie pomocnicze współdzielone przez testy rozszerzeń (test_*.py)
+"""
+
+import threading
+import time
+from starter import TaskProcessor
+from tracing import trace_span
+
+
+class FailingTaskProcessor(TaskProcessor):
+    """Strategia testowa rzucająca wyjątek dla zadań bez opisu"""
+
+    def process_task(self, task):
+        if not task.description:
+            raise RuntimeError("missing description")
+        task.mark_completed()
+        return {"status": "completed", "processing_time": 0.0,
+                "strategy_used": "failing", "validation_passed": True}
+
+
+class CountingTaskProcessor(TaskProcessor):
+    """Strategia testowa licząca wywołania (z opcjonalnym opóźnieniem)"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def process_task(self, task):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("processing failed")
+        task.mark_completed()
+        return {"status": "completed", "processing_time": self.delay,
+                "strategy_used": "counting", "validation_passed": True}
+
+
+class NamedTaskProcessor(TaskProcessor):
+    """Strategia testowa zapisująca swoją nazwę i wątek wykonania"""
+
+    def __init__(self, name, delay=0.0):
+        self.name = name
+        self.delay = delay
+
+    def process_task(self, task):
+        time.sleep(self.delay)
+        task.mark_completed()
+        return {"status": "completed", "processing_time": self.delay,
+                "strategy_used": self.name, "validation_passed": True}
+
+
+class ValidatingTaskProcessor(TaskProcessor):
+    """Strategia testowa zgłaszająca span walidacji"""
+
+    def process_task(self, task):
+        with trace_span("validate", rule="description"):
+            valid = bool(task.description)
+        task.mark_completed()
+        return {"status": "completed" if valid else "failed", "processing_time": 0.0,
+                "strategy_used": "validating", "validation_passed": valid}
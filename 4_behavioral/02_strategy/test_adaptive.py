@@ -0,0 +1,111 @@
+"""
+Testy dla Strategy Pattern - wybór strategii wg opóźnień (adaptive.py)
+"""
+
+import pytest
+from starter import (
+    TaskPriority, WorkflowTask, TaskProcessor, UrgentTaskProcessor, BackgroundTaskProcessor
+)
+from adaptive import AdaptiveTaskManager, LatencyTracker
+
+
+class SlowableTaskProcessor(TaskProcessor):
+    """Strategia testowa z konfigurowalnym processing_time"""
+
+    def __init__(self, name, latency):
+        self.name = name
+        self.latency = latency
+
+    def process_task(self, task):
+        task.mark_completed()
+        return {"status": "completed", "processing_time": self.latency,
+                "strategy_used": self.name, "validation_passed": True}
+
+
+class TestAdaptiveTaskManager:
+    """Testy adaptacyjnego wyboru strategii"""
+
+    def test_latency_tracker(self):
+        """Test EWMA i p99"""
+        tracker = LatencyTracker(alpha=0.5, window=100)
+        for latency in [1.0] * 99 + [10.0]:
+            tracker.record(latency)
+
+        assert tracker.samples == 100
+        assert tracker.tail() == 1.0  # p99 ze 100 próbek = 99. wartość
+        tracker.record(10.0)
+        assert tracker.tail() == 10.0
+        assert tracker.ewma > 1.0
+
+    def test_routes_to_cheapest_within_budget(self):
+        """Test że wybierana jest najtańsza strategia mieszcząca się w budżecie"""
+        manager = AdaptiveTaskManager(budgets={TaskPriority.LOW: 0.2}, min_samples=1)
+        manager.register(SlowableTaskProcessor("cheap", 0.1), cost=1)
+        manager.register(SlowableTaskProcessor("fast", 0.01), cost=5)
+        task = WorkflowTask("Docs", TaskPriority.LOW, "Update")
+
+        used = {manager.execute_task(task)["strategy_used"] for _ in range(10)}
+
+        assert used == {"cheap"}
+
+    def test_falls_back_when_strategy_degrades_and_probes_recovery(self):
+        """Test przełączenia przy degradacji i powrotu po zadaniu próbnym"""
+        cheap = SlowableTaskProcessor("cheap", 0.01)
+        manager = AdaptiveTaskManager(budgets={TaskPriority.URGENT: 0.05},
+                                      window=4, min_samples=1, probe_every=3)
+        manager.register(cheap, cost=1)
+        manager.register(SlowableTaskProcessor("fast", 0.001), cost=5)
+        task = WorkflowTask("Breach", TaskPriority.URGENT, "Critical")
+
+        assert manager.execute_task(task)["strategy_used"] == "cheap"
+        cheap.latency = 1.0  # Degradacja
+        used = [manager.execute_task(task)["strategy_used"] for _ in range(3)]
+        assert used == ["cheap", "fast", "fast"]
+
+        cheap.latency = 0.01  # Powrót - udane zadanie próbne zaczyna okno od nowa
+        used = [manager.execute_task(task)["strategy_used"] for _ in range(3)]
+        assert used == ["cheap", "cheap", "cheap"]
+
+    def test_single_good_probe_recovers_despite_full_window(self):
+        """Test że powrót nie wymaga wypchnięcia całego okna złych próbek"""
+        cheap = SlowableTaskProcessor("cheap", 1.0)
+        manager = AdaptiveTaskManager(budgets={TaskPriority.URGENT: 0.05},
+                                      window=256, min_samples=1, probe_every=10)
+        manager.register(cheap, cost=1)
+        manager.register(SlowableTaskProcessor("fast", 0.001), cost=5)
+        task = WorkflowTask("Breach", TaskPriority.URGENT, "Critical")
+        for _ in range(300):
+            manager.execute_task(task)
+
+        cheap.latency = 0.01
+        used = [manager.execute_task(task)["strategy_used"] for _ in range(20)]
+
+        assert used.index("cheap") < 10
+        assert used[used.index("cheap"):] == ["cheap"] * (20 - used.index("cheap"))
+
+    def test_min_samples_must_be_positive(self):
+        """Test walidacji min_samples (0 oznaczałoby p99 z pustego okna)"""
+        with pytest.raises(ValueError):
+            AdaptiveTaskManager(min_samples=0)
+
+    def test_respects_allowed_priorities(self):
+        """Test że strategia nie dostaje priorytetów, których nie obsługuje"""
+        manager = AdaptiveTaskManager()
+        manager.register(BackgroundTaskProcessor(), cost=1,
+                         priorities=[TaskPriority.LOW, TaskPriority.MEDIUM])
+        manager.register(UrgentTaskProcessor(), cost=10)
+
+        urgent = WorkflowTask("Breach", TaskPriority.URGENT, "Critical")
+        low = WorkflowTask("Docs", TaskPriority.LOW, "Update")
+
+        assert manager.execute_task(urgent)["strategy_used"] == "urgent"
+        assert manager.execute_task(low)["strategy_used"] == "background"
+        assert manager.latency_stats()["UrgentTaskProcessor"]["samples"] == 1
+
+    def test_no_eligible_strategy(self):
+        """Test braku strategii dla priorytetu"""
+        manager = AdaptiveTaskManager()
+        manager.register(UrgentTaskProcessor(), cost=1, priorities=[TaskPriority.URGENT])
+
+        with pytest.raises(ValueError):
+            manager.execute_task(WorkflowTask("Docs", TaskPriority.LOW, "Update"))
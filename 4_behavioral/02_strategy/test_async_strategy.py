@@ -0,0 +1,111 @@
+"""
+Testy dla Strategy Pattern - strategie asynchroniczne (async_strategy.py)
+"""
+
+import asyncio
+import pytest
+import threading
+import time
+from starter import TaskPriority, WorkflowTask
+from async_strategy import (
+    AsyncTaskProcessor, AsyncUrgentTaskProcessor, AsyncStandardTaskProcessor, AsyncBackgroundTaskProcessor, AsyncTaskManager
+)
+
+
+class TestAsyncStrategies:
+    """Testy asynchronicznych strategii i AsyncTaskManager"""
+
+    def test_async_processors_implement_interface(self):
+        """Test że async strategie implementują AsyncTaskProcessor"""
+        for processor in [AsyncUrgentTaskProcessor(), AsyncStandardTaskProcessor(),
+                          AsyncBackgroundTaskProcessor()]:
+            assert isinstance(processor, AsyncTaskProcessor)
+
+    def test_async_validation_matches_sync_rules(self):
+        """Test walidacji async strategii"""
+        async def scenario():
+            urgent = await AsyncUrgentTaskProcessor().process_task(
+                WorkflowTask("Normal task", TaskPriority.MEDIUM, "Regular work"))
+            background = await AsyncBackgroundTaskProcessor().process_task(
+                WorkflowTask("Emergency", TaskPriority.URGENT, "Critical issue"))
+            return urgent, background
+
+        urgent, background = asyncio.run(scenario())
+
+        assert urgent["validation_passed"] is False
+        assert background["validation_passed"] is False
+        assert background["status"] == "completed"
+
+    def test_async_processing_does_not_block_loop(self):
+        """Test że 1000 zadań standardowych (~1s każde) kończy się w ~1s na jednym wątku"""
+        manager = AsyncTaskManager(AsyncStandardTaskProcessor(), max_concurrency=1000)
+        tasks = [WorkflowTask(f"Task {i}", TaskPriority.MEDIUM, "Batch") for i in range(1000)]
+        threads_before = threading.active_count()
+
+        start = time.time()
+        results = asyncio.run(manager.execute_many(tasks))
+        elapsed = time.time() - start
+
+        assert len(results) == 1000
+        assert all(r["strategy_used"] == "standard" for r in results)
+        assert elapsed < 3
+        assert threading.active_count() == threads_before
+
+    def test_concurrency_limit_per_strategy(self):
+        """Test że limit strategii ogranicza liczbę zadań w locie"""
+        manager = AsyncTaskManager(limits={"background": 2})
+        strategy = AsyncBackgroundTaskProcessor()
+        peak = 0
+
+        async def watch():
+            nonlocal peak
+            for _ in range(20):
+                peak = max(peak, manager.in_flight("background"))
+                await asyncio.sleep(0.02)
+
+        async def scenario():
+            tasks = [WorkflowTask(f"Task {i}", TaskPriority.LOW, "Batch") for i in range(6)]
+            await asyncio.gather(watch(), *(manager.execute_task(t, strategy) for t in tasks))
+
+        start = time.time()
+        asyncio.run(scenario())
+
+        assert peak == 2
+        assert time.time() - start >= 0.3  # 6 zadań po 0.1s, po 2 naraz
+
+    def test_limit_shared_by_instances_of_strategy(self):
+        """Test że nowa instancja strategii (np. po set_strategy) nie omija limitu jej nazwy"""
+        manager = AsyncTaskManager(limits={"background": 2})
+        peak = 0
+
+        async def watch():
+            nonlocal peak
+            for _ in range(20):
+                peak = max(peak, manager.in_flight("background"))
+                await asyncio.sleep(0.02)
+
+        async def scenario():
+            tasks = [WorkflowTask(f"Task {i}", TaskPriority.LOW, "Batch") for i in range(6)]
+            await asyncio.gather(watch(), *(manager.execute_task(t, AsyncBackgroundTaskProcessor()) for t in tasks))
+
+        asyncio.run(scenario())
+
+        assert peak == 2
+
+    def test_manager_reused_across_event_loops(self):
+        """Test że ten sam manager działa w kolejnych asyncio.run() (semafory per pętla)"""
+        manager = AsyncTaskManager(AsyncBackgroundTaskProcessor(), max_concurrency=2)
+
+        for run in range(2):
+            tasks = [WorkflowTask(f"Run {run} task {i}", TaskPriority.LOW, "Batch") for i in range(5)]
+            results = asyncio.run(manager.execute_many(tasks))
+
+            assert [r["status"] for r in results] == ["completed"] * 5
+
+    def test_async_manager_without_strategy(self):
+        """Test wykonania bez ustawionej strategii"""
+        manager = AsyncTaskManager()
+        task = WorkflowTask("No strategy", TaskPriority.LOW, "Test")
+
+        with pytest.raises(ValueError):
+            asyncio.run(manager.execute_task(task))
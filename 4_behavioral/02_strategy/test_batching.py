@@ -0,0 +1,54 @@
+"""
+Testy dla Strategy Pattern - strategia paczkująca (batching.py)
+"""
+
+import time
+from starter import TaskPriority, WorkflowTask, TaskProcessor, TaskManager
+from batching import BatchTaskProcessor
+
+
+class TestBatchTaskProcessor:
+    """Testy strategii przetwarzającej zadania paczkami"""
+
+    def test_batch_processor_implements_interface(self):
+        """Test że BatchTaskProcessor implementuje interface"""
+        assert isinstance(BatchTaskProcessor(), TaskProcessor)
+
+    def test_full_batches_share_fixed_cost(self):
+        """Test że 16 zadań w paczkach po 8 kosztuje ~2 przebiegi, nie 16"""
+        manager = TaskManager(BatchTaskProcessor(max_batch=8, max_wait=1.0, fixed_cost=0.1))
+        tasks = [WorkflowTask(f"Cleanup {i}", TaskPriority.LOW, "Old files") for i in range(16)]
+
+        start = time.time()
+        results = manager.execute_many(tasks, max_workers=16)
+        elapsed = time.time() - start
+
+        assert elapsed < 0.5  # BackgroundTaskProcessor: ~1.6s
+        assert [r["batch_size"] for r in results] == [8] * 16
+        assert all(r["strategy_used"] == "batch" for r in results)
+        assert all(task.completed_at is not None for task in tasks)
+
+    def test_partial_batch_flushed_after_max_wait(self):
+        """Test że niepełna paczka jest przetwarzana po max_wait"""
+        processor = BatchTaskProcessor(max_batch=100, max_wait=0.05, fixed_cost=0.01)
+        task = WorkflowTask("Lonely", TaskPriority.LOW, "Single task")
+
+        start = time.time()
+        result = processor.process_task(task)
+        elapsed = time.time() - start
+
+        assert result["batch_size"] == 1
+        assert 0.05 <= elapsed < 0.5
+        assert result["processing_time"] >= 0.05  # Obejmuje czekanie w buforze
+
+    def test_per_task_validation(self):
+        """Test walidacji per zadanie w jednym przebiegu"""
+        processor = BatchTaskProcessor(fixed_cost=0.01)
+        tasks = [
+            WorkflowTask("Cleanup", TaskPriority.LOW, "Old files"),
+            WorkflowTask("Emergency", TaskPriority.URGENT, "Critical issue"),
+        ]
+
+        results = processor.process_batch(tasks)
+
+        assert [r["validation_passed"] for r in results] == [True, False]
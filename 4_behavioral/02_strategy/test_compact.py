@@ -0,0 +1,74 @@
+"""
+Testy dla Strategy Pattern - kompaktowe WorkflowTask i TaskResult
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from starter import TaskPriority, WorkflowTask, TaskResult
+
+
+class TestCompactWorkflowTask:
+    """Testy kompaktowego zadania (__slots__, leniwe znaczniki czasu)"""
+
+    def test_task_is_compact_with_lazy_timestamps(self):
+        """Test że zadanie nie ma __dict__, a datetime liczony jest przy odczycie"""
+        before = datetime.now()
+        task = WorkflowTask("Compact", TaskPriority.LOW, "Slots")
+        task.mark_completed()
+
+        assert not hasattr(task, "__dict__")
+        assert task._created_at is None and task._completed_at is None
+        assert before - timedelta(milliseconds=5) <= task.created_at <= task.completed_at
+        assert task.completed_at <= datetime.now() + timedelta(milliseconds=5)
+
+    def test_timestamp_setters_keep_value(self):
+        """Test przypisania created_at/completed_at (np. odtworzenie z bazy)"""
+        task = WorkflowTask("Restored", TaskPriority.LOW, "x")
+        stamp = datetime(2024, 5, 1, 12, 30, 15, 123456)
+
+        task.created_at = stamp
+        task.completed_at = stamp + timedelta(seconds=2)
+
+        assert task.created_at == stamp
+        assert task.completed_ns - task.created_ns == 2_000_000_000
+        task.completed_at = None
+        assert task.completed_at is None
+
+
+class TestTaskResult:
+    """Testy slotowego wyniku strategii"""
+
+    def test_behaves_like_dict(self):
+        """Test że TaskResult czyta się i porównuje jak dotychczasowy dict"""
+        result = TaskResult("completed", 0.5, "urgent", True)
+        expected = {"status": "completed", "processing_time": 0.5,
+                    "strategy_used": "urgent", "validation_passed": True}
+
+        assert result["status"] == "completed"
+        assert result.get("missing", "default") == "default"
+        assert result == expected and expected == result
+        assert dict(result) == expected
+        assert not hasattr(result, "__dict__")
+
+    def test_extra_keys(self):
+        """Test dodatkowych kluczy (np. deadline_missed, error)"""
+        result = TaskResult(strategy_used="batch", batch_size=8)
+        result["deadline_missed"] = False
+
+        assert result["batch_size"] == 8
+        assert len(result) == 6
+        assert list(result)[-2:] == ["batch_size", "deadline_missed"]
+        del result["batch_size"]
+        with pytest.raises(KeyError):
+            result["batch_size"]
+        with pytest.raises(TypeError):
+            del result["status"]
+
+    def test_results_are_independent_objects(self):
+        """Test że wyniki nie są współdzielone - trzymane przez referencję nie zmieniają się"""
+        first = TaskResult("completed", 0.1, "urgent", True, error=None)
+        second = TaskResult("failed", 0.2, "urgent", False)
+        second["error"] = "boom"
+
+        assert first["status"] == "completed" and first["error"] is None
+        assert not hasattr(TaskResult, "reset")
@@ -0,0 +1,72 @@
+"""
+Testy dla Strategy Pattern - współbieżne execute_many() / iter_completed()
+"""
+
+import pytest
+import time
+from starter import (
+    TaskPriority, WorkflowTask, UrgentTaskProcessor, BackgroundTaskProcessor, TaskManager
+)
+from support import FailingTaskProcessor
+
+
+class TestConcurrentExecution:
+    """Testy TaskManager.execute_many() i iter_completed()"""
+
+    def test_execute_many_runs_concurrently(self):
+        """Test że zadania w tle nakładają się w czasie"""
+        manager = TaskManager(BackgroundTaskProcessor())
+        tasks = [WorkflowTask(f"Task {i}", TaskPriority.LOW, "Batch") for i in range(10)]
+
+        start = time.time()
+        results = manager.execute_many(tasks, max_workers=10)
+        elapsed = time.time() - start
+
+        assert len(results) == 10
+        assert elapsed < 0.5  # Sekwencyjnie ~1s
+        assert all(task.completed_at is not None for task in tasks)
+
+    def test_execute_many_keeps_submission_order_and_fields(self):
+        """Test kolejności wyników i pól processing_time/strategy_used"""
+        manager = TaskManager(UrgentTaskProcessor())
+        tasks = [
+            WorkflowTask("Urgent", TaskPriority.URGENT, "Critical"),
+            WorkflowTask("Not urgent", TaskPriority.LOW, "Minor"),
+        ]
+
+        results = manager.execute_many(tasks, max_workers=2)
+
+        assert [r["validation_passed"] for r in results] == [True, False]
+        assert all(r["strategy_used"] == "urgent" for r in results)
+        assert all(r["processing_time"] >= 0 for r in results)
+
+    def test_iter_completed_yields_task_result_pairs(self):
+        """Test że iter_completed zwraca pary (zadanie, wynik)"""
+        manager = TaskManager(BackgroundTaskProcessor())
+        tasks = [WorkflowTask(f"Task {i}", TaskPriority.LOW, "Batch") for i in range(5)]
+
+        pairs = list(manager.iter_completed(tasks, max_workers=5))
+
+        assert {id(task) for task, _ in pairs} == {id(task) for task in tasks}
+        assert all(result["strategy_used"] == "background" for _, result in pairs)
+
+    def test_execute_many_reports_failures_per_task(self):
+        """Test że błąd jednego zadania nie przerywa paczki"""
+        manager = TaskManager(FailingTaskProcessor())
+        tasks = [
+            WorkflowTask("Good", TaskPriority.LOW, "Has description"),
+            WorkflowTask("Bad", TaskPriority.LOW, ""),
+        ]
+
+        results = manager.execute_many(tasks)
+
+        assert results[0]["status"] == "completed"
+        assert results[1]["status"] == "failed"
+        assert "missing description" in results[1]["error"]
+
+    def test_execute_many_without_strategy(self):
+        """Test wykonywania paczki bez ustawionej strategii"""
+        manager = TaskManager()
+
+        with pytest.raises(ValueError):
+            manager.execute_many([WorkflowTask("No strategy", TaskPriority.LOW, "Test")])
@@ -0,0 +1,134 @@
+"""
+Testy dla Strategy Pattern - kolejka EDF z limitami czasu (deadlines.py)
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from starter import TaskPriority, WorkflowTask
+from deadlines import DeadlineScheduler
+from support import CountingTaskProcessor, ValidatingTaskProcessor
+
+
+class TestDeadlineScheduler:
+    """Testy kolejki EDF z limitami czasu i anulowaniem"""
+
+    def _scheduler(self, processor=None, **kwargs):
+        processor = processor or CountingTaskProcessor()
+        return DeadlineScheduler({priority: processor for priority in TaskPriority}, **kwargs)
+
+    def test_earliest_deadline_first(self):
+        """Test że wychodzi zadanie z najbliższym terminem, bez terminu na końcu"""
+        scheduler = self._scheduler()
+        now = datetime.now()
+        order = []
+        for title, priority, deadline in [
+            ("none", TaskPriority.URGENT, None),
+            ("late", TaskPriority.URGENT, now + timedelta(minutes=10)),
+            ("soon", TaskPriority.LOW, now + timedelta(minutes=1)),
+        ]:
+            future = scheduler.submit(WorkflowTask(title, priority, "EDF", deadline=deadline))
+            future.add_done_callback(lambda f, t=title: order.append(t))
+
+        scheduler.run_pending()
+
+        assert order == ["soon", "late", "none"]
+
+    def test_expired_task_dropped_before_processing(self):
+        """Test że zadanie po terminie nie uruchamia strategii"""
+        strategy = CountingTaskProcessor()
+        scheduler = self._scheduler(strategy)
+        task = WorkflowTask("Stale", TaskPriority.HIGH, "Too late",
+                            deadline=datetime.now() - timedelta(seconds=1))
+        future = scheduler.submit(task)
+
+        scheduler.run_pending()
+
+        assert future.result()["status"] == "expired"
+        assert future.result()["deadline_missed"] is True
+        assert strategy.calls == 0
+        assert scheduler.deadline_stats["expired"] == 1
+
+    def test_timeout_frees_worker_and_cancels_task(self):
+        """Test że zablokowana strategia nie blokuje workera dłużej niż timeout"""
+        scheduler = self._scheduler(CountingTaskProcessor(delay=0.5))
+        stalled = WorkflowTask("Stalled", TaskPriority.MEDIUM, "Hangs")
+        future = scheduler.submit(stalled, timeout=0.05)
+
+        start = time.time()
+        scheduler.run_pending()
+
+        assert time.time() - start < 0.4
+        assert future.result()["status"] == "timeout"
+        assert future.result()["deadline_missed"] is True
+        assert stalled.cancelled
+
+    def test_timeout_travels_with_each_submission(self):
+        """Test że ponownie zgłoszone to samo zadanie ma własny limit czasu (nie po id(task))"""
+        scheduler = self._scheduler(CountingTaskProcessor(delay=0.2))
+        task = WorkflowTask("Retried", TaskPriority.MEDIUM, "x")
+        unlimited = scheduler.submit(task)
+        limited = scheduler.submit(task, timeout=0.05)
+
+        scheduler.run_pending()
+
+        assert limited.result()["status"] == "timeout"
+        assert unlimited.result()["status"] == "completed"
+
+    def test_timed_tasks_share_bounded_thread_pool(self):
+        """Test że zadania z limitem czasu nie tworzą wątku na zadanie"""
+        scheduler = self._scheduler(CountingTaskProcessor(delay=0.5), default_timeout=0.01, timeout_threads=2)
+        futures = [scheduler.submit(WorkflowTask(f"Stuck {i}", TaskPriority.LOW, "x")) for i in range(10)]
+        threads_before = threading.active_count()
+
+        scheduler.run_pending()
+        started = threading.active_count() - threads_before
+        scheduler.stop()
+
+        assert all(future.result()["status"] == "timeout" for future in futures)
+        assert started <= 2
+
+    def test_deadline_bounds_timeout(self):
+        """Test że strategia dostaje najwyżej czas do terminu"""
+        scheduler = self._scheduler(CountingTaskProcessor(delay=0.5), default_timeout=5.0)
+        future = scheduler.submit(WorkflowTask("Tight", TaskPriority.HIGH, "x",
+                                               deadline=datetime.now() + timedelta(seconds=0.05)))
+
+        scheduler.run_pending()
+
+        assert future.result(timeout=1)["status"] == "timeout"
+
+    def test_cancelled_task_skipped(self):
+        """Test że zadanie anulowane w kolejce nie jest przetwarzane"""
+        strategy = CountingTaskProcessor()
+        scheduler = self._scheduler(strategy)
+        task = WorkflowTask("Obsolete", TaskPriority.LOW, "x")
+        future = scheduler.submit(task)
+        task.cancel()
+
+        scheduler.run_pending()
+
+        assert future.result()["status"] == "cancelled"
+        assert strategy.calls == 0
+
+    def test_completed_within_deadline(self):
+        """Test że zadanie ukończone w terminie ma deadline_missed == False"""
+        scheduler = self._scheduler(default_timeout=1.0)
+        future = scheduler.submit(WorkflowTask("Ok", TaskPriority.URGENT, "x",
+                                               deadline=datetime.now() + timedelta(minutes=1)))
+
+        scheduler.run_pending()
+
+        assert future.result()["status"] == "completed"
+        assert future.result()["deadline_missed"] is False
+
+    def test_failure_without_deadline_is_not_missed(self):
+        """Test że nieudane zadanie bez terminu nie liczy się jako spóźnione"""
+        scheduler = self._scheduler(ValidatingTaskProcessor())
+        future = scheduler.submit(WorkflowTask("Empty", TaskPriority.MEDIUM, ""))
+
+        scheduler.run_pending()
+
+        assert future.result()["status"] == "failed"
+        assert future.result()["deadline_missed"] is False
+        assert scheduler.deadline_stats["missed"] == 0
@@ -0,0 +1,109 @@
+"""
+Testy dla Strategy Pattern - trwała kolejka SQLite (durable_queue.py)
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from starter import TaskPriority, WorkflowTask, UrgentTaskProcessor
+from durable_queue import SQLiteTaskQueue
+from support import FailingTaskProcessor
+
+
+class TestSQLiteTaskQueue:
+    """Testy trwałej kolejki w SQLite"""
+
+    def test_backlog_survives_restart(self, tmp_path):
+        """Test że zadania przetrwają utworzenie kolejki na nowo (restart)"""
+        path = str(tmp_path / "tasks.db")
+        ids = SQLiteTaskQueue(path).enqueue_many(
+            [WorkflowTask(f"Task {i}", TaskPriority.MEDIUM, "Persisted") for i in range(3)])
+
+        claimed = SQLiteTaskQueue(path).claim(10)
+
+        assert [task_id for task_id, _ in claimed] == ids
+        assert [task.title for _, task in claimed] == ["Task 0", "Task 1", "Task 2"]
+
+    def test_deadline_and_idempotency_key_survive_restart(self, tmp_path):
+        """Test że termin i klucz idempotencji wracają z claim() po restarcie"""
+        path = str(tmp_path / "tasks.db")
+        deadline = datetime.now() + timedelta(minutes=5)
+        SQLiteTaskQueue(path).enqueue_many([
+            WorkflowTask("Invoice", TaskPriority.HIGH, "Send", idempotency_key="order-42", deadline=deadline),
+            WorkflowTask("Docs", TaskPriority.LOW, "Update"),
+        ])
+
+        (_, invoice), (_, docs) = SQLiteTaskQueue(path).claim(10)
+
+        assert (invoice.idempotency_key, invoice.deadline) == ("order-42", deadline)
+        assert (docs.idempotency_key, docs.deadline) == (None, None)
+
+    def test_old_schema_gets_new_columns(self, tmp_path):
+        """Test że plik bez kolumn idempotency_key/deadline dostaje je przy otwarciu"""
+        path = str(tmp_path / "tasks.db")
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE workflow_tasks (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, "
+                               "description TEXT NOT NULL, priority VARCHAR NOT NULL, priority_rank INTEGER NOT NULL, "
+                               "status VARCHAR NOT NULL, created_at FLOAT NOT NULL, claimed_at FLOAT, "
+                               "completed_at FLOAT, result TEXT)")
+            connection.execute("INSERT INTO workflow_tasks (title, description, priority, priority_rank, status, "
+                               "created_at) VALUES ('Old', 'Row', 'low', 3, 'pending', 0)")
+        connection.close()
+
+        queue = SQLiteTaskQueue(path)
+        queue.enqueue(WorkflowTask("New", TaskPriority.LOW, "Row", idempotency_key="k"))
+
+        assert [(task.title, task.idempotency_key) for _, task in queue.claim(10)] == [("Old", None), ("New", "k")]
+
+    def test_claim_by_priority_without_double_claim(self, tmp_path):
+        """Test kolejności priorytetów i tego, że zajęte zadanie nie wraca drugi raz"""
+        queue = SQLiteTaskQueue(str(tmp_path / "tasks.db"))
+        queue.enqueue_many([
+            WorkflowTask("Low", TaskPriority.LOW, "Later"),
+            WorkflowTask("High", TaskPriority.HIGH, "Soon"),
+            WorkflowTask("Urgent", TaskPriority.URGENT, "Now"),
+        ])
+
+        first = [task.title for _, task in queue.claim(2)]
+        second = [task.title for _, task in queue.claim(2)]
+
+        assert first == ["Urgent", "High"]
+        assert second == ["Low"]
+        assert queue.claim(2) == []
+
+    def test_process_pending_feeds_strategies(self, tmp_path):
+        """Test zasilania strategii i zapisu wyników"""
+        queue = SQLiteTaskQueue(str(tmp_path / "tasks.db"))
+        ids = queue.enqueue_many([
+            WorkflowTask("Breach", TaskPriority.URGENT, "Critical"),
+            WorkflowTask("Broken", TaskPriority.LOW, ""),
+        ])
+        processors = {TaskPriority.URGENT: UrgentTaskProcessor(),
+                      TaskPriority.LOW: FailingTaskProcessor()}
+
+        processed = queue.process_pending(processors, batch_size=1)
+
+        assert processed == 2
+        assert queue.counts() == {"done": 1, "failed": 1}
+        assert queue.result(ids[0])["strategy_used"] == "urgent"
+        assert "missing description" in queue.result(ids[1])["error"]
+
+    def test_release_stale_claims(self, tmp_path):
+        """Test zwrotu zajętych zadań po awarii workera"""
+        queue = SQLiteTaskQueue(str(tmp_path / "tasks.db"))
+        queue.enqueue(WorkflowTask("Orphan", TaskPriority.LOW, "Worker died"))
+        queue.claim(1)
+
+        assert queue.release_stale(older_than=60) == 0
+        assert queue.release_stale(older_than=-1) == 1
+        assert [task.title for _, task in queue.claim(1)] == ["Orphan"]
+
+    def test_bulk_enqueue(self, tmp_path):
+        """Test wstawienia dużej paczki jedną transakcją"""
+        queue = SQLiteTaskQueue(str(tmp_path / "tasks.db"))
+        tasks = [WorkflowTask(f"Task {i}", TaskPriority.LOW, "Bulk") for i in range(10_000)]
+
+        ids = queue.enqueue_many(tasks)
+
+        assert len(ids) == 10_000
+        assert ids == sorted(ids)
+        assert queue.counts() == {"pending": 10_000}
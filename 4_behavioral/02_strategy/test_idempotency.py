@@ -0,0 +1,112 @@
+"""
+Testy dla Strategy Pattern - idempotentne wykonanie zadań (idempotency.py)
+"""
+
+import pytest
+import time
+from starter import TaskPriority, WorkflowTask
+from idempotency import IdempotentTaskManager, task_key
+from support import CountingTaskProcessor, ValidatingTaskProcessor
+
+
+class TestIdempotentTaskManager:
+    """Testy idempotentnego wykonania zadań"""
+
+    def test_task_key_from_content_or_explicit_key(self):
+        """Test klucza: skrót treści albo jawny idempotency_key"""
+        a = WorkflowTask("Invoice", TaskPriority.HIGH, "Send")
+        b = WorkflowTask("Invoice", TaskPriority.HIGH, "Send")
+        c = WorkflowTask("Invoice", TaskPriority.LOW, "Send")
+
+        assert task_key(a) == task_key(b)
+        assert task_key(a) != task_key(c)
+        assert task_key(WorkflowTask("X", TaskPriority.LOW, "Y", idempotency_key="order-1")) == "order-1"
+
+    def test_completed_results_served_from_cache(self):
+        """Test że ponowienie nie uruchamia strategii ponownie"""
+        strategy = CountingTaskProcessor()
+        manager = IdempotentTaskManager(strategy)
+        retry = WorkflowTask("Invoice", TaskPriority.HIGH, "Send")
+
+        first = manager.execute_task(WorkflowTask("Invoice", TaskPriority.HIGH, "Send"))
+        second = manager.execute_task(retry)
+
+        assert first == second
+        assert strategy.calls == 1
+        assert retry.completed_at is not None
+        assert manager.stats()["hits"] == 1
+        assert manager.hit_rate() == 0.5
+
+    def test_in_flight_duplicates_wait_for_first_execution(self):
+        """Test że równoczesne duplikaty czekają na pierwsze wykonanie"""
+        strategy = CountingTaskProcessor(delay=0.1)
+        manager = IdempotentTaskManager(strategy)
+        tasks = [WorkflowTask("Invoice", TaskPriority.HIGH, "Send") for _ in range(8)]
+
+        results = manager.execute_many(tasks, max_workers=8)
+
+        assert strategy.calls == 1
+        assert all(r["status"] == "completed" for r in results)
+        assert manager.stats()["joins"] + manager.stats()["hits"] == 7
+
+    def test_ttl_expiry_and_bounded_size(self):
+        """Test wygasania TTL i limitu liczby wpisów"""
+        strategy = CountingTaskProcessor()
+        manager = IdempotentTaskManager(strategy, ttl=0.05, max_entries=2)
+
+        manager.execute_task(WorkflowTask("A", TaskPriority.LOW, "a"))
+        time.sleep(0.06)
+        manager.execute_task(WorkflowTask("A", TaskPriority.LOW, "a"))
+        assert strategy.calls == 2
+
+        for title in ["B", "C", "D"]:
+            manager.execute_task(WorkflowTask(title, TaskPriority.LOW, "x"))
+        assert manager.stats()["entries"] == 2
+
+    def test_failures_are_not_cached(self):
+        """Test że błąd nie jest zapamiętywany - ponowienie uruchamia strategię"""
+        strategy = CountingTaskProcessor(fail=True)
+        manager = IdempotentTaskManager(strategy)
+        task = WorkflowTask("Invoice", TaskPriority.HIGH, "Send")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                manager.execute_task(task)
+
+        assert strategy.calls == 2
+
+    def test_failed_status_is_not_cached(self):
+        """Test że wynik ze statusem "failed" (bez wyjątku) nie trafia do pamięci"""
+        strategy = ValidatingTaskProcessor()
+        manager = IdempotentTaskManager(strategy)
+
+        for _ in range(2):
+            assert manager.execute_task(WorkflowTask("Invoice", TaskPriority.HIGH, ""))["status"] == "failed"
+
+        assert manager.stats()["misses"] == 2
+        assert manager.stats()["entries"] == 0
+
+    def test_caller_mutation_does_not_corrupt_cache(self):
+        """Test że zmiana wyniku przez wywołującego nie zmienia kolejnych trafień"""
+        manager = IdempotentTaskManager(CountingTaskProcessor())
+
+        first = manager.execute_task(WorkflowTask("Invoice", TaskPriority.HIGH, "Send"))
+        first["status"] = "tampered"
+        second = manager.execute_task(WorkflowTask("Invoice", TaskPriority.HIGH, "Send"))
+        second["strategy_used"] = "tampered"
+        third = manager.execute_task(WorkflowTask("Invoice", TaskPriority.HIGH, "Send"))
+
+        assert third["status"] == "completed"
+        assert third["strategy_used"] != "tampered"
+
+    def test_invalidate(self):
+        """Test jawnego unieważnienia wyniku"""
+        strategy = CountingTaskProcessor()
+        manager = IdempotentTaskManager(strategy)
+        task = WorkflowTask("Invoice", TaskPriority.HIGH, "Send")
+
+        manager.execute_task(task)
+        manager.invalidate(task)
+        manager.execute_task(task)
+
+        assert strategy.calls == 2
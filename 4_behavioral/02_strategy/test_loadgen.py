@@ -0,0 +1,51 @@
+"""
+Testy dla Strategy Pattern - generator obciążenia (loadgen.py)
+"""
+
+import json
+import pytest
+import random
+from starter import TaskPriority
+import loadgen
+
+
+class TestLoadGenerator:
+    """Testy generatora obciążenia"""
+
+    def test_parse_mix_normalizes_weights(self):
+        mix = loadgen.parse_mix("urgent=1,low=3")
+
+        assert mix == {TaskPriority.URGENT: 0.25, TaskPriority.LOW: 0.75}
+
+    def test_arrival_patterns(self):
+        """Test przybyć: od razu, Poisson (średnia częstość) i paczkami"""
+        assert loadgen.arrivals(3, 0, "poisson", 1, random.Random(1)) == [0.0, 0.0, 0.0]
+
+        poisson = loadgen.arrivals(5000, 100.0, "poisson", 1, random.Random(1))
+        assert poisson == sorted(poisson)
+        assert 45 < poisson[-1] < 55  # ~5000 / 100 s
+
+        assert loadgen.arrivals(6, 10.0, "bursty", 3, random.Random(1)) == [0.0, 0.0, 0.0, 0.3, 0.3, 0.3]
+
+    def test_stream_is_deterministic(self):
+        args = loadgen.build_parser().parse_args(["--tasks", "50", "--seed", "7"])
+
+        first = [(offset, task.priority) for offset, task in loadgen.generate(args)]
+        second = [(offset, task.priority) for offset, task in loadgen.generate(args)]
+
+        assert first == second
+
+    @pytest.mark.parametrize("mode", loadgen.MODES)
+    def test_report(self, mode):
+        """Test raportu JSON dla każdego trybu"""
+        args = loadgen.build_parser().parse_args(
+            ["--mode", mode, "--tasks", "20", "--sleep-scale", "0.001", "--workers", "8"])
+
+        report = loadgen.run(args)
+
+        assert report["mode"] == mode
+        assert report["errors"] == 0
+        assert report["latency_ms"]["count"] == 20
+        assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+        assert report["throughput"] > 0 and report["cpu_s"] >= 0
+        json.dumps(report)
@@ -0,0 +1,79 @@
+"""
+Testy dla Strategy Pattern - histogramy i eksport metryk (metrics.py)
+"""
+
+import pytest
+from starter import TaskPriority, WorkflowTask, UrgentTaskProcessor, BackgroundTaskProcessor
+from metrics import LatencyHistogram, MeteredTaskManager, TaskMetrics, serve_metrics
+from support import FailingTaskProcessor
+
+
+class TestMetrics:
+    """Testy histogramów i metryk MeteredTaskManager"""
+
+    def test_histogram_percentiles_within_precision(self):
+        """Test że percentyle HDR mieszczą się w ~1% błędu"""
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        assert histogram.total == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.max == 1.0
+
+    def test_records_per_strategy_and_priority(self):
+        """Test serii per strategia i per priorytet"""
+        manager = MeteredTaskManager(UrgentTaskProcessor())
+        manager.execute_task(WorkflowTask("Breach", TaskPriority.URGENT, "Critical"))
+        manager.execute_task(WorkflowTask("Outage", TaskPriority.URGENT, "Critical"))
+        manager.set_strategy(BackgroundTaskProcessor())
+        manager.execute_task(WorkflowTask("Docs", TaskPriority.LOW, "Update"))
+
+        snapshot = manager.metrics()
+
+        assert snapshot["by_strategy"]["UrgentTaskProcessor"]["count"] == 2
+        assert snapshot["by_priority"]["low"]["count"] == 1
+        assert snapshot["by_priority"]["low"]["latency"]["p50"] >= 0.09
+        assert len(snapshot["series"]) == 2
+
+    def test_errors_and_in_flight(self):
+        """Test liczenia błędów i miernika zadań w locie"""
+        manager = MeteredTaskManager(FailingTaskProcessor())
+        manager.execute_task(WorkflowTask("Good", TaskPriority.LOW, "Has description"))
+        with pytest.raises(RuntimeError):
+            manager.execute_task(WorkflowTask("Bad", TaskPriority.LOW, ""))
+
+        stats = manager.metrics()["by_strategy"]["FailingTaskProcessor"]
+
+        assert stats["count"] == 2
+        assert stats["errors"] == 1
+        assert stats["error_rate"] == 0.5
+        assert stats["in_flight"] == 0
+
+    def test_execute_many_is_metered(self):
+        """Test że execute_many() też zapisuje metryki"""
+        manager = MeteredTaskManager(BackgroundTaskProcessor())
+        tasks = [WorkflowTask(f"Task {i}", TaskPriority.LOW, "Batch") for i in range(5)]
+
+        manager.execute_many(tasks, max_workers=5)
+
+        assert manager.metrics()["by_priority"]["low"]["count"] == 5
+
+    def test_text_exposition_and_http_endpoint(self):
+        """Test formatu tekstowego i endpointu /metrics"""
+        from urllib.request import urlopen
+
+        registry = TaskMetrics()
+        manager = MeteredTaskManager(UrgentTaskProcessor(), registry=registry)
+        manager.execute_task(WorkflowTask("Breach", TaskPriority.URGENT, "Critical"))
+        server = serve_metrics(registry, port=0)
+        try:
+            body = urlopen(f"http://127.0.0.1:{server.server_port}/metrics").read().decode()
+        finally:
+            server.shutdown()
+
+        labels = 'strategy="UrgentTaskProcessor",priority="urgent"'
+        assert f"task_requests_total{{{labels}}} 1" in body
+        assert f'task_latency_seconds_bucket{{{labels},le="+Inf"}} 1' in body
+        assert f"task_in_flight{{{labels}}} 0" in body
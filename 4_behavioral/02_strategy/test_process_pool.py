@@ -0,0 +1,60 @@
+"""
+Testy dla Strategy Pattern - strategia w puli procesów (process_pool.py)
+"""
+
+from datetime import datetime, timedelta
+from starter import TaskPriority, WorkflowTask, UrgentTaskProcessor, TaskManager
+from process_pool import CpuTaskProcessor, ProcessPoolTaskProcessor, from_record, to_record
+
+
+class TestProcessPoolTaskProcessor:
+    """Testy strategii uruchamianej w puli procesów"""
+
+    def test_compact_record_round_trip(self):
+        """Test że rekord zadania zachowuje pola i created_at"""
+        task = WorkflowTask("Checksum", TaskPriority.HIGH, "payload")
+
+        restored = from_record(to_record(task))
+
+        assert (restored.title, restored.priority, restored.description) == \
+            ("Checksum", TaskPriority.HIGH, "payload")
+        assert restored.created_at == task.created_at
+
+    def test_record_keeps_key_deadline_and_cancelled(self):
+        """Test że rekord przenosi klucz idempotencji, termin i anulowanie"""
+        deadline = datetime.now() + timedelta(minutes=5)
+        task = WorkflowTask("Checksum", TaskPriority.LOW, "payload",
+                            idempotency_key="order-42", deadline=deadline)
+        task.cancel()
+
+        restored = from_record(to_record(task))
+
+        assert restored.idempotency_key == "order-42"
+        assert restored.deadline == deadline
+        assert restored.cancelled is True
+        assert from_record(to_record(WorkflowTask("Plain", TaskPriority.LOW, "x"))).deadline is None
+
+    def test_runs_in_worker_process_and_syncs_state(self):
+        """Test że zadanie wykonuje się w innym procesie, a completed_at wraca do rodzica"""
+        import os
+
+        task = WorkflowTask("Checksum", TaskPriority.MEDIUM, "payload")
+        with ProcessPoolTaskProcessor(CpuTaskProcessor(rounds=1000), max_workers=1) as processor:
+            result = processor.process_task(task)
+
+        assert result["worker_pid"] != os.getpid()
+        assert result["checksum"] == CpuTaskProcessor(rounds=1000).process_task(
+            WorkflowTask("Local", TaskPriority.MEDIUM, "payload"))["checksum"]
+        assert task.completed_at is not None
+
+    def test_wraps_lab_strategies_behind_task_manager(self):
+        """Test że opakowana strategia działa przez TaskManager i process_many()"""
+        tasks = [WorkflowTask(f"Breach {i}", TaskPriority.URGENT, "Critical") for i in range(8)]
+        with ProcessPoolTaskProcessor(UrgentTaskProcessor(), max_workers=2) as processor:
+            manager = TaskManager(processor)
+            single = manager.execute_task(WorkflowTask("Outage", TaskPriority.URGENT, "Critical"))
+            results = processor.process_many(tasks, chunksize=4)
+
+        assert single["strategy_used"] == "urgent"
+        assert [r["validation_passed"] for r in results] == [True] * 8
+        assert all(task.completed_at is not None for task in tasks)
@@ -0,0 +1,97 @@
+"""
+Testy dla Strategy Pattern - token bucket i backpressure (rate_limit.py)
+"""
+
+import asyncio
+import pytest
+import time
+from starter import TaskPriority, WorkflowTask, UrgentTaskProcessor
+from rate_limit import RateLimitedTaskManager, TaskRejected, TokenBucket
+
+
+class TestRateLimiting:
+    """Testy token bucket i backpressure per strategia"""
+
+    def test_token_bucket_refills_at_rate(self):
+        """Test że bucket oddaje burst od razu, a potem rate tokenów/s"""
+        bucket = TokenBucket(rate=20.0, burst=2)
+
+        assert bucket.try_acquire() and bucket.try_acquire()
+        assert bucket.try_acquire() is False
+        start = time.time()
+        assert bucket.acquire(timeout=1.0) is True
+        assert 0.03 <= time.time() - start < 0.5
+
+    def test_blocking_mode_paces_callers(self):
+        """Test że tryb block rozkłada zadania w czasie zgodnie z limitem"""
+        strategy = UrgentTaskProcessor()
+        manager = RateLimitedTaskManager(strategy)
+        manager.set_limit(strategy, rate=20.0, burst=1)
+        tasks = [WorkflowTask(f"Breach {i}", TaskPriority.URGENT, "Critical") for i in range(5)]
+
+        start = time.time()
+        results = [manager.execute_task(task) for task in tasks]
+
+        assert all(r["status"] == "completed" for r in results)
+        assert time.time() - start >= 0.18  # 4 tokeny po 0.05s
+        assert manager.metrics()["rate_limits"]["UrgentTaskProcessor"]["admitted"] == 5
+
+    def test_reject_fast_mode(self):
+        """Test że tryb reject odrzuca natychmiast i liczy odrzucenia"""
+        strategy = UrgentTaskProcessor()
+        manager = RateLimitedTaskManager(strategy, mode=RateLimitedTaskManager.REJECT)
+        manager.set_limit(strategy, rate=0.1, burst=1)
+        task = WorkflowTask("Breach", TaskPriority.URGENT, "Critical")
+
+        manager.execute_task(task)
+        with pytest.raises(TaskRejected):
+            manager.execute_task(task)
+
+        state = manager.metrics()["rate_limits"]["UrgentTaskProcessor"]
+        assert (state["admitted"], state["rejected"]) == (1, 1)
+        assert 'task_admission_rejected_total{strategy="UrgentTaskProcessor"} 1' in manager.render_metrics()
+
+    def test_bounded_admission_queue_pushes_back(self):
+        """Test że pełna kolejka przyjęć odrzuca nadmiarowych producentów"""
+        strategy = UrgentTaskProcessor()
+        manager = RateLimitedTaskManager(strategy)
+        manager.set_limit(strategy, rate=5.0, burst=1, max_queue=2)
+        tasks = [WorkflowTask(f"Breach {i}", TaskPriority.URGENT, "Critical") for i in range(6)]
+
+        results = manager.execute_many(tasks, max_workers=6)
+
+        statuses = [r["status"] for r in results]
+        assert statuses.count("completed") == 3  # 1 z bursta + 2 z kolejki
+        assert statuses.count("failed") == 3
+        assert all("TaskRejected" in r["error"] for r in results if r["status"] == "failed")
+
+    def test_async_admission(self):
+        """Test że execute_task_async czeka na token bez blokowania pętli"""
+        strategy = UrgentTaskProcessor()
+        manager = RateLimitedTaskManager(strategy)
+        manager.set_limit(strategy, rate=20.0, burst=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            tasks = [WorkflowTask(f"Breach {i}", TaskPriority.URGENT, "Critical") for i in range(3)]
+            return await asyncio.gather(ticker(), *(manager.execute_task_async(t) for t in tasks))
+
+        _, *results = asyncio.run(scenario())
+
+        assert ticks == 5
+        assert all(r["strategy_used"] == "urgent" for r in results)
+
+    def test_unlimited_strategy(self):
+        """Test że strategia bez limitu nie jest ograniczana"""
+        manager = RateLimitedTaskManager(UrgentTaskProcessor(), mode=RateLimitedTaskManager.REJECT)
+        task = WorkflowTask("Breach", TaskPriority.URGENT, "Critical")
+
+        results = [manager.execute_task(task) for _ in range(50)]
+
+        assert len(results) == 50
@@ -0,0 +1,82 @@
+"""
+Testy dla Strategy Pattern - kolejka priorytetowa z agingiem (scheduler.py)
+"""
+
+import pytest
+import time
+from starter import TaskPriority, WorkflowTask, UrgentTaskProcessor, BackgroundTaskProcessor
+from scheduler import PriorityTaskScheduler
+
+
+class TestPriorityTaskScheduler:
+    """Testy kolejki priorytetowej z agingiem"""
+
+    def _processors(self):
+        return {
+            TaskPriority.URGENT: UrgentTaskProcessor(),
+            TaskPriority.HIGH: UrgentTaskProcessor(),
+            TaskPriority.MEDIUM: UrgentTaskProcessor(),
+            TaskPriority.LOW: BackgroundTaskProcessor(),
+        }
+
+    def test_dispatch_order_by_priority(self):
+        """Test że zadania wychodzą według priorytetu, nie kolejności zgłoszenia"""
+        scheduler = PriorityTaskScheduler(self._processors())
+        order = []
+        for priority in [TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.URGENT, TaskPriority.HIGH]:
+            future = scheduler.submit(WorkflowTask(priority.value, priority, "Ordering"))
+            future.add_done_callback(lambda f, p=priority: order.append(p))
+
+        scheduler.run_pending()
+
+        assert order == [TaskPriority.URGENT, TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.LOW]
+
+    def test_routes_to_strategy_of_priority(self):
+        """Test że zadanie trafia do strategii swojego priorytetu"""
+        scheduler = PriorityTaskScheduler(self._processors())
+        low = scheduler.submit(WorkflowTask("Cleanup", TaskPriority.LOW, "Old files"))
+        urgent = scheduler.submit(WorkflowTask("Breach", TaskPriority.URGENT, "Critical"))
+
+        scheduler.run_pending()
+
+        assert low.result()["strategy_used"] == "background"
+        assert urgent.result()["strategy_used"] == "urgent"
+
+    def test_aging_prevents_starvation(self):
+        """Test że długo czekające LOW wyprzedza świeże URGENT"""
+        scheduler = PriorityTaskScheduler(self._processors(), aging_interval=0.01)
+        order = []
+        old_low = scheduler.submit(WorkflowTask("Old low", TaskPriority.LOW, "Waiting"))
+        old_low.add_done_callback(lambda f: order.append("low"))
+        time.sleep(0.05)  # > 3 * aging_interval
+        fresh = scheduler.submit(WorkflowTask("Fresh", TaskPriority.URGENT, "Critical"))
+        fresh.add_done_callback(lambda f: order.append("urgent"))
+
+        scheduler.run_pending()
+
+        assert order == ["low", "urgent"]
+
+    def test_worker_threads_and_metrics(self):
+        """Test wątków roboczych oraz metryk głębokości i czasu czekania"""
+        scheduler = PriorityTaskScheduler(self._processors())
+        futures = [scheduler.submit(WorkflowTask(f"Low {i}", TaskPriority.LOW, "Batch"))
+                   for i in range(4)]
+        assert scheduler.queue_depth()[TaskPriority.LOW] == 4
+
+        scheduler.start(workers=4)
+        results = [future.result(timeout=2) for future in futures]
+        scheduler.stop()
+
+        metrics = scheduler.metrics()
+        assert all(r["status"] == "completed" for r in results)
+        assert metrics["low"]["queue_depth"] == 0
+        assert metrics["low"]["dispatched"] == 4
+        assert metrics["low"]["avg_wait"] >= 0
+        assert metrics["urgent"]["dispatched"] == 0
+
+    def test_submit_without_strategy_for_priority(self):
+        """Test zgłoszenia zadania bez strategii dla jego priorytetu"""
+        scheduler = PriorityTaskScheduler({TaskPriority.URGENT: UrgentTaskProcessor()})
+
+        with pytest.raises(ValueError):
+            scheduler.submit(WorkflowTask("Docs", TaskPriority.LOW, "Update"))
@@ -0,0 +1,119 @@
+"""
+Testy dla Strategy Pattern - hierarchiczne koło czasowe (timing_wheel.py)
+"""
+
+import pytest
+import time
+from starter import TaskPriority, WorkflowTask
+from timing_wheel import HierarchicalTimingWheel, TimedTaskManager
+from support import CountingTaskProcessor, NamedTaskProcessor
+
+
+class TestHierarchicalTimingWheel:
+    """Testy koła czasowego"""
+
+    def test_timers_fire_on_their_tick(self):
+        """Test że każdy timer wygasa dokładnie w swoim ticku (także po kaskadzie)"""
+        wheel = HierarchicalTimingWheel(wheel_size=4, levels=3)
+        for delay in [1, 3, 4, 5, 17, 63]:
+            wheel.schedule(delay, delay)
+
+        fired = {}
+        while len(wheel):
+            for timer in wheel.advance(1):
+                fired[timer.payload] = wheel.current_tick
+
+        assert fired == {delay: delay for delay in [1, 3, 4, 5, 17, 63]}
+
+    def test_timer_beyond_range(self):
+        """Test timera dalszego niż zasięg koła"""
+        wheel = HierarchicalTimingWheel(wheel_size=4, levels=2)  # zasięg 16 ticków
+        wheel.schedule(40, "far")
+
+        assert wheel.advance(39) == []
+        assert [t.payload for t in wheel.advance(1)] == ["far"]
+
+    def test_cancel_and_memory_proportional_to_live_timers(self):
+        """Test anulowania i zwalniania pustych kubełków"""
+        wheel = HierarchicalTimingWheel(wheel_size=8, levels=3)
+        timers = [wheel.schedule(delay, delay) for delay in range(1, 200)]
+
+        assert all(wheel.cancel(timer) for timer in timers)
+        assert not wheel.cancel(timers[0])
+        assert len(wheel) == 0
+        assert all(not slots for slots in wheel._slots)
+        assert wheel.advance(300) == []
+
+    def test_same_tick_keeps_insertion_order(self):
+        """Test kolejności timerów z tego samego ticku"""
+        wheel = HierarchicalTimingWheel(wheel_size=4, levels=2)
+        for name in ["a", "b", "c"]:
+            wheel.schedule(6, name)
+
+        assert [t.payload for t in wheel.advance(6)] == ["a", "b", "c"]
+
+    def test_wheel_size_must_be_power_of_two(self):
+        with pytest.raises(ValueError):
+            HierarchicalTimingWheel(wheel_size=10)
+
+
+class TestTimedTaskManager:
+    """Testy TaskManager z zadaniami opóźnionymi"""
+
+    def test_expired_task_runs_with_its_strategy(self):
+        """Test że wygasłe zadanie trafia do strategii wskazanej przy planowaniu"""
+        manager = TimedTaskManager(NamedTaskProcessor("default"), tick=0.01)
+        later = manager.execute_later(WorkflowTask("Later", TaskPriority.LOW, "x"), 0.05)
+        other = manager.execute_later(WorkflowTask("Other", TaskPriority.LOW, "x"), 0.02,
+                                      strategy=NamedTaskProcessor("other"))
+
+        assert [f.result(timeout=1)["strategy_used"] for f in manager.advance(2)] == ["other"]
+        assert [f.result(timeout=1)["strategy_used"] for f in manager.advance(3)] == ["default"]
+        assert later.payload["future"].done() and other.payload["future"].done()
+        manager.stop()
+
+    def test_cancel_scheduled_task(self):
+        """Test anulowania zaplanowanego zadania"""
+        strategy = CountingTaskProcessor()
+        manager = TimedTaskManager(strategy, tick=0.01)
+        timer = manager.execute_later(WorkflowTask("Reminder", TaskPriority.LOW, "x"), 0.05)
+
+        assert manager.cancel(timer)
+        assert manager.advance(10) == []
+        assert timer.payload["future"].cancelled()
+        assert strategy.calls == 0 and manager.pending() == 0
+        manager.stop()
+
+    def test_retry_with_backoff(self):
+        """Test ponowienia nieudanego zadania przez koło"""
+        strategy = CountingTaskProcessor(fail=True)
+        manager = TimedTaskManager(strategy, tick=0.01)
+        timer = manager.execute_later(WorkflowTask("Flaky", TaskPriority.HIGH, "x"), 0.01,
+                                      retries=2, backoff=0.02)
+
+        manager.start()
+        with pytest.raises(RuntimeError):
+            timer.payload["future"].result(timeout=2)
+        manager.stop()
+
+        assert strategy.calls == 3
+
+    def test_clock_thread_runs_tasks_on_time(self):
+        """Test wątku zegara - zadanie wykonane po opóźnieniu, nie wcześniej"""
+        manager = TimedTaskManager(NamedTaskProcessor("timed"), tick=0.005)
+        start = time.time()
+        timer = manager.execute_later(WorkflowTask("Timed", TaskPriority.MEDIUM, "x"), 0.05)
+
+        manager.start()
+        result = timer.payload["future"].result(timeout=2)
+        elapsed = time.time() - start
+        manager.stop()
+
+        assert result["attempts"] == 1
+        assert 0.05 <= elapsed < 0.5
+
+    def test_requires_strategy(self):
+        manager = TimedTaskManager()
+        with pytest.raises(ValueError):
+            manager.execute_later(WorkflowTask("X", TaskPriority.LOW, "x"), 1.0)
+        manager.stop()
@@ -0,0 +1,83 @@
+"""
+Testy dla Strategy Pattern - spany zadań (tracing.py)
+"""
+
+import json
+import pytest
+from starter import TaskPriority, WorkflowTask
+from tracing import Tracer, TracedTaskManager, read_trace, trace_span
+from support import FailingTaskProcessor, ValidatingTaskProcessor
+
+
+class TestTracing:
+    """Testy próbkowanych spanów zadań"""
+
+    def test_spans_for_sampled_task(self, tmp_path):
+        """Test kompletu spanów jednego zadania w formacie Chrome Trace"""
+        path = str(tmp_path / "trace.json")
+        with Tracer(path, sample_rate=1.0) as tracer:
+            manager = TracedTaskManager(ValidatingTaskProcessor(), tracer)
+            manager.execute_task(WorkflowTask("Docs", TaskPriority.LOW, "Update"))
+
+        spans = read_trace(path)
+        by_name = {span["name"]: span for span in spans}
+        assert set(by_name) == {"wait", "admission", "validate", "process", "complete", "task"}
+        assert all(span["ph"] == "X" and span["dur"] >= 0 for span in spans)
+        assert len({span["args"]["trace_id"] for span in spans}) == 1
+        assert by_name["validate"]["args"]["rule"] == "description"
+        assert by_name["task"]["args"]["status"] == "completed"
+        # validate zagnieżdżony w process
+        process, validate = by_name["process"], by_name["validate"]
+        assert process["ts"] <= validate["ts"]
+        assert validate["ts"] + validate["dur"] <= process["ts"] + process["dur"]
+
+    def test_file_loads_as_json_array(self, tmp_path):
+        """Test że plik po dopisaniu "]" jest poprawną tablicą JSON (format viewerów)"""
+        path = tmp_path / "trace.json"
+        with Tracer(str(path), sample_rate=1.0) as tracer:
+            manager = TracedTaskManager(ValidatingTaskProcessor(), tracer)
+            for i in range(3):
+                manager.execute_task(WorkflowTask(f"T{i}", TaskPriority.LOW, "x"))
+
+        text = path.read_text().rstrip().rstrip(",") + "]"
+        assert len(json.loads(text)) == 18
+
+    def test_sampling_rate(self, tmp_path):
+        """Test że sample_rate=0 nie zapisuje nic, a wyniki się nie zmieniają"""
+        path = str(tmp_path / "trace.json")
+        with Tracer(path, sample_rate=0.0) as tracer:
+            manager = TracedTaskManager(ValidatingTaskProcessor(), tracer)
+            results = [manager.execute_task(WorkflowTask("T", TaskPriority.LOW, "x")) for _ in range(50)]
+
+        assert read_trace(path) == []
+        assert all(r["status"] == "completed" for r in results)
+
+    def test_batched_writes(self, tmp_path):
+        """Test że spany trafiają do pliku paczkami"""
+        path = str(tmp_path / "trace.json")
+        tracer = Tracer(path, sample_rate=1.0, batch_size=12)
+        manager = TracedTaskManager(ValidatingTaskProcessor(), tracer)
+
+        manager.execute_task(WorkflowTask("A", TaskPriority.LOW, "x"))
+        assert tracer.written == 0  # 6 spanów < batch_size
+        manager.execute_task(WorkflowTask("B", TaskPriority.LOW, "x"))
+        assert tracer.written == 12
+        manager.execute_task(WorkflowTask("C", TaskPriority.LOW, "x"))
+        tracer.close()
+        assert len(read_trace(path)) == 18
+
+    def test_failure_is_traced_and_raised(self, tmp_path):
+        """Test że wyjątek strategii kończy span task statusem failed"""
+        path = str(tmp_path / "trace.json")
+        with Tracer(path, sample_rate=1.0) as tracer:
+            manager = TracedTaskManager(FailingTaskProcessor(), tracer)
+            with pytest.raises(RuntimeError):
+                manager.execute_task(WorkflowTask("Bad", TaskPriority.LOW, ""))
+
+        task_span = [span for span in read_trace(path) if span["name"] == "task"][0]
+        assert task_span["args"]["status"] == "failed"
+
+    def test_trace_span_outside_task_is_noop(self):
+        """Test że trace_span bez śledzonego zadania nic nie robi"""
+        with trace_span("validate"):
+            pass
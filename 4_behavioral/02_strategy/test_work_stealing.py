@@ -0,0 +1,81 @@
+"""
+Testy dla Strategy Pattern - work stealing między managerami (work_stealing.py)
+"""
+
+import pytest
+import time
+from starter import TaskPriority, WorkflowTask, TaskManager
+from work_stealing import WorkStealingRuntime
+from support import FailingTaskProcessor, NamedTaskProcessor
+
+
+class TestWorkStealingRuntime:
+    """Testy work stealing między managerami"""
+
+    def _runtime(self, count=3, delay=0.0, steal=True):
+        managers = []
+        for index in range(count):
+            manager = TaskManager()
+            manager.set_strategy(NamedTaskProcessor(f"tenant-{index}", delay))
+            managers.append(manager)
+        return WorkStealingRuntime(managers, steal=steal)
+
+    def _tasks(self, count):
+        return [WorkflowTask(f"Task {i}", TaskPriority.MEDIUM, "Skewed") for i in range(count)]
+
+    def test_owner_runs_local_queue_in_fifo_order(self):
+        """Test że właściciel wykonuje swoje zadania w kolejności zgłoszenia"""
+        runtime = self._runtime(count=1)
+        tasks = self._tasks(5)
+        order = []
+        for task, future in zip(tasks, runtime.submit_many(0, tasks)):
+            future.add_done_callback(lambda f, t=task: order.append(t.title))
+
+        assert runtime.run_pending(0) == 5
+        assert order == [task.title for task in tasks]
+
+    def test_idle_manager_steals_and_uses_own_strategy(self):
+        """Test że skradzione zadanie wykonuje strategia złodzieja"""
+        runtime = self._runtime(count=2)
+        futures = runtime.submit_many(0, self._tasks(8))
+
+        stolen = runtime.run_pending(1)
+
+        assert stolen == 8
+        assert {f.result()["strategy_used"] for f in futures} == {"tenant-1"}
+        assert runtime.stats()[1]["stolen"] == 8
+        assert runtime.stats()[0]["queue_depth"] == 0
+
+    def test_static_partitioning_does_not_steal(self):
+        """Test że steal=False zostawia zadania właścicielowi"""
+        runtime = self._runtime(count=2, steal=False)
+        runtime.submit_many(0, self._tasks(4))
+
+        assert runtime.run_pending(1) == 0
+        assert runtime.stats()[0]["queue_depth"] == 4
+
+    def test_skewed_load_spreads_across_threads(self):
+        """Test że przy skośnym ruchu pracują wszystkie wątki"""
+        runtime = self._runtime(count=4, delay=0.01)
+        futures = runtime.submit_many(0, self._tasks(40))
+
+        start = time.time()
+        runtime.start()
+        results = [future.result(timeout=5) for future in futures]
+        runtime.stop()
+
+        assert time.time() - start < 0.3  # bez kradzieży ~0.4s
+        assert len({r["strategy_used"] for r in results}) == 4
+        assert sum(s["executed"] for s in runtime.stats()) == 40
+
+    def test_failure_sets_future_exception(self):
+        """Test że wyjątek strategii trafia do Future, a wątek działa dalej"""
+        manager = TaskManager()
+        manager.set_strategy(FailingTaskProcessor())
+        runtime = WorkStealingRuntime([manager])
+        failed = runtime.submit(0, WorkflowTask("Bad", TaskPriority.LOW, ""))
+
+        runtime.start()
+        with pytest.raises(RuntimeError):
+            failed.result(timeout=2)
+        runtime.stop()
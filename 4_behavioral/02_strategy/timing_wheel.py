@@ -0,0 +1,268 @@
+"""
+Strategy Pattern - hierarchiczne koło czasowe dla zadań opóźnionych
+
+Strategie modelują opóźnienia przez time.sleep(), a milion opóźnionych
+albo ponawianych zadań na osobnych timerach lub kopcu kosztuje
+O(log n) na operację i wątek/obiekt na timer. HierarchicalTimingWheel:
+- insert i cancel w O(1) (kubełek = słownik, timer zna swój kubełek)
+- tick() przesuwa wskazówkę; co obrót niższego poziomu timery z wyższego
+  poziomu spadają niżej (kaskada), a z poziomu 0 - wygasają
+- kubełki tworzone leniwie i usuwane gdy puste - pamięć ~ liczba żywych timerów
+TimedTaskManager to TaskManager, który na wygaśnięcie timera uruchamia
+strategię zadania (domyślnie bieżącą strategię managera).
+
+>>> wheel = HierarchicalTimingWheel(tick=0.01, wheel_size=4, levels=3)
+>>> soon, later = wheel.schedule(2, "soon"), wheel.schedule(30, "later")
+>>> [timer.payload for timer in wheel.advance(2)]
+['soon']
+>>> wheel.cancel(later), len(wheel), wheel.advance(40)
+(True, 0, [])
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from starter import TaskManager, TaskProcessor, WorkflowTask
+
+
+class Timer:
+    """Uchwyt timera - zwracany przez schedule(), przyjmowany przez cancel()"""
+
+    __slots__ = ("expires", "payload", "_bucket", "_level", "_index")
+
+    def __init__(self, expires: int, payload: Any):
+        self.expires = expires
+        self.payload = payload
+        self._bucket: Optional[Dict["Timer", None]] = None
+        self._level = 0
+        self._index = 0
+
+    @property
+    def active(self) -> bool:
+        return self._bucket is not None
+
+
+class HierarchicalTimingWheel:
+    """
+    levels poziomów po wheel_size kubełków (potęga dwójki)
+
+    Kubełek poziomu l obejmuje wheel_size^l ticków - zasięg koła to
+    wheel_size^levels ticków. Timery dalsze czekają w ostatnim poziomie
+    i są przekładane, aż znajdą się w zasięgu
+    """
+
+    def __init__(self, tick: float = 0.01, wheel_size: int = 256, levels: int = 4):
+        if wheel_size & (wheel_size - 1):
+            raise ValueError("wheel_size must be a power of two")
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self.levels = levels
+        self._bits = wheel_size.bit_length() - 1
+        self._mask = wheel_size - 1
+        self._range = wheel_size ** levels
+        # Tylko niepuste kubełki: poziom -> {indeks -> kubełek}
+        self._slots: List[Dict[int, Dict[Timer, None]]] = [{} for _ in range(levels)]
+        self._count = 0
+        self.current_tick = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    # %% Wstawianie i anulowanie - O(1)
+
+    def schedule(self, ticks: int, payload: Any) -> Timer:
+        """Timer wygasający za ticks ticków (co najmniej 1)"""
+        timer = Timer(self.current_tick + max(1, ticks), payload)
+        self._place(timer)
+        self._count += 1
+        return timer
+
+    def schedule_after(self, delay: float, payload: Any) -> Timer:
+        """Timer wygasający za delay sekund (zaokrąglone w górę do ticków)"""
+        return self.schedule(math.ceil(delay / self.tick), payload)
+
+    def cancel(self, timer: Timer) -> bool:
+        """Usuń timer - False gdy już wygasł albo był anulowany"""
+        if timer._bucket is None:
+            return False
+        self._unlink(timer)
+        self._count -= 1
+        return True
+
+    def _place(self, timer: Timer) -> None:
+        current = self.current_tick
+        delta = timer.expires - current
+        if delta >= self._range:
+            delta = self._range - 1  # Spoza zasięgu - najdalszy kubełek, potem przełożenie
+        elif delta < 0:
+            delta = 0
+        level = (delta.bit_length() - 1) // self._bits if delta else 0
+        index = ((current + delta) >> (self._bits * level)) & self._mask
+        slots = self._slots[level]
+        bucket = slots.get(index)
+        if bucket is None:
+            bucket = slots[index] = {}
+        bucket[timer] = None
+        timer._bucket = bucket
+        timer._level = level
+        timer._index = index
+
+    def _unlink(self, timer: Timer) -> None:
+        del timer._bucket[timer]
+        if not timer._bucket:
+            del self._slots[timer._level][timer._index]
+        timer._bucket = None
+
+    # %% Przesuwanie wskazówki
+
+    def advance(self, ticks: int = 1) -> List[Timer]:
+        """Przesuń o ticks ticków - zwraca wygasłe timery w kolejności wygaśnięcia"""
+        expired: List[Timer] = []
+        for step in range(ticks):
+            if not self._count:
+                # Puste koło - nie ma czego kaskadować ani odpalać
+                self.current_tick += ticks - step
+                break
+            expired.extend(self._tick())
+        return expired
+
+    def _tick(self) -> List[Timer]:
+        self.current_tick += 1
+        # Kaskada: na początku obrotu poziomu l-1 kubełek poziomu l spada niżej
+        for level in range(1, self.levels):
+            if self.current_tick & ((1 << (self._bits * level)) - 1):
+                break
+            index = (self.current_tick >> (self._bits * level)) & self._mask
+            bucket = self._slots[level].pop(index, None)
+            for timer in bucket or ():
+                self._place(timer)
+        bucket = self._slots[0].pop(self.current_tick & self._mask, None)
+        if not bucket:
+            return []
+        expired = []
+        for timer in bucket:
+            timer._bucket = None
+            if timer.expires > self.current_tick:
+                self._place(timer)  # Timer spoza zasięgu koła - jeszcze nie teraz
+            else:
+                expired.append(timer)
+        self._count -= len(expired)
+        return expired
+
+
+class TimedTaskManager(TaskManager):
+    """
+    TaskManager z zadaniami opóźnionymi na kole czasowym
+
+    Wątek zegara co tick przesuwa koło i przekazuje wygasłe zadania do
+    puli wykonawców - strategia nie blokuje zegara. Nieudane wykonanie
+    (wyjątek albo status różny od "completed") może być ponowione po
+    backoff * 2^próba sekund
+    """
+
+    def __init__(self, strategy=None, tick: float = 0.01, wheel_size: int = 256,
+                 levels: int = 4, max_workers: int = 4):
+        super().__init__()
+        self.strategy = strategy
+        self.wheel = HierarchicalTimingWheel(tick, wheel_size, levels)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="timed")
+        self._clock: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # %% Planowanie
+
+    def execute_later(self, task: WorkflowTask, delay: float,
+                      strategy: Optional[TaskProcessor] = None,
+                      retries: int = 0, backoff: float = 1.0) -> Timer:
+        """Wykonaj zadanie za delay sekund; wynik w timer.payload["future"]"""
+        strategy = strategy or self.strategy
+        if strategy is None:
+            raise ValueError("No strategy set")
+        entry = {"task": task, "strategy": strategy, "future": Future(),
+                 "retries": retries, "backoff": backoff, "attempt": 0}
+        with self._lock:
+            entry["timer"] = self.wheel.schedule_after(delay, entry)
+        return entry["timer"]
+
+    def execute_at(self, task: WorkflowTask, when: datetime, **options) -> Timer:
+        """Wykonaj zadanie o wskazanej godzinie"""
+        return self.execute_later(task, max(0.0, (when - datetime.now()).total_seconds()), **options)
+
+    def cancel(self, timer: Timer) -> bool:
+        """Anuluj zaplanowane zadanie (O(1)) - jego Future zostaje anulowany"""
+        with self._lock:
+            # Po ponowieniu zadanie czeka na nowym timerze
+            cancelled = self.wheel.cancel(timer.payload["timer"])
+        if cancelled:
+            timer.payload["future"].cancel()
+        return cancelled
+
+    def pending(self) -> int:
+        """Liczba zaplanowanych (jeszcze niewygasłych) zadań"""
+        with self._lock:
+            return len(self.wheel)
+
+    # %% Zegar
+
+    def start(self) -> None:
+        """Uruchom wątek zegara przesuwający koło zgodnie z czasem rzeczywistym"""
+        if self._clock is not None:
+            return
+        self._stop.clear()
+        self._clock = threading.Thread(target=self._clock_loop, name="timing-wheel", daemon=True)
+        self._clock.start()
+
+    def stop(self) -> None:
+        """Zatrzymaj zegar i poczekaj na zadania już przekazane do wykonania"""
+        self._stop.set()
+        if self._clock is not None:
+            self._clock.join()
+            self._clock = None
+        self._executor.shutdown(wait=True)
+
+    def advance(self, ticks: int = 1) -> List[Future]:
+        """Przesuń koło ręcznie (bez start()) - zwraca Future wygasłych zadań"""
+        with self._lock:
+            expired = self.wheel.advance(ticks)
+        return [self._dispatch(timer.payload) for timer in expired]
+
+    def _clock_loop(self) -> None:
+        next_tick = time.monotonic() + self.wheel.tick
+        while not self._stop.wait(max(0.0, next_tick - time.monotonic())):
+            # Po przestoju (np. GC) nadrabiamy zaległe ticki
+            behind = int((time.monotonic() - next_tick) / self.wheel.tick) + 1
+            self.advance(behind)
+            next_tick += behind * self.wheel.tick
+
+    # %% Wykonanie
+
+    def _dispatch(self, entry: Dict[str, Any]) -> Future:
+        future = entry["future"]
+        if not future.cancelled():
+            self._executor.submit(self._run, entry)
+        return future
+
+    def _run(self, entry: Dict[str, Any]) -> None:
+        future = entry["future"]
+        try:
+            result = entry["strategy"].process_task(entry["task"])
+            failed, error = result.get("status") != "completed", None
+        except Exception as exc:
+            result, failed, error = None, True, exc
+        if failed and entry["attempt"] < entry["retries"]:
+            entry["attempt"] += 1
+            with self._lock:
+                entry["timer"] = self.wheel.schedule_after(entry["backoff"] * 2 ** (entry["attempt"] - 1), entry)
+            return
+        if not future.set_running_or_notify_cancel():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            result["attempts"] = entry["attempt"] + 1
+            future.set_result(result)
@@ -0,0 +1,199 @@
+"""
+Strategy Pattern - próbkowane spany zadań zapisywane do pliku trace
+
+Gdy workflow jest wolny, nie wiadomo, czy czas poszedł na kolejkę,
+walidację czy przetwarzanie w strategii. TracedTaskManager zapisuje dla
+próbki zadań spany:
+- wait      - od utworzenia zadania (task.created_ns) do execute_task()
+- admission - sprawdzenia przed strategią (_admit)
+- process   - wywołanie strategii
+- validate  - zgłaszany przez samą strategię: with trace_span("validate")
+- complete  - obsługa wyniku po strategii
+Spany trafiają do bufora i są dopisywane do pliku paczkami. Plik to
+Chrome Trace Event Format (JSON Array, zamykający "]" jest opcjonalny):
+pierwsza linia "[", potem jeden span na linię - ładuje się w Perfetto
+i chrome://tracing, a read_trace() czyta go linia po linii.
+
+>>> import os, tempfile
+>>> from starter import TaskProcessor
+>>> class Echo(TaskProcessor):
+...     def process_task(self, task):
+...         with trace_span("validate"):
+...             valid = bool(task.description)
+...         task.mark_completed()
+...         return {"status": "completed", "strategy_used": "echo", "validation_passed": valid}
+>>> path = os.path.join(tempfile.mkdtemp(), "trace.json")
+>>> with Tracer(path, sample_rate=1.0) as tracer:
+...     manager = TracedTaskManager(Echo(), tracer)
+...     _ = manager.execute_task(WorkflowTask("Docs", TaskPriority.LOW, "Update"))
+>>> [span["name"] for span in read_trace(path)]
+['wait', 'admission', 'validate', 'process', 'complete', 'task']
+"""
+
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from starter import TaskManager, TaskPriority, WorkflowTask
+
+
+_local = threading.local()
+# Jeden enkoder zamiast json.dumps(..., separators=...) - ten tworzy enkoder przy każdym wywołaniu
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class _Trace:
+    """Próbkowany ślad jednego zadania - spany zbierane do końca execute_task()"""
+
+    __slots__ = ("trace_id", "spans")
+
+    def __init__(self, trace_id: int):
+        self.trace_id = trace_id
+        self.spans: List[Dict[str, Any]] = []
+
+    def record(self, name: str, start_ns: int, end_ns: int, **args) -> None:
+        self.spans.append({
+            "name": name,
+            "cat": "task",
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {"trace_id": self.trace_id, **args},
+        })
+
+
+@contextmanager
+def trace_span(name: str, **args) -> Iterator[None]:
+    """
+    Span wewnątrz bieżącego zadania (np. walidacja w strategii)
+
+    Poza próbkowanym zadaniem to tylko odczyt zmiennej wątku
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        yield
+        return
+    start_ns = time.monotonic_ns()
+    try:
+        yield
+    finally:
+        trace.record(name, start_ns, time.monotonic_ns(), **args)
+
+
+class Tracer:
+    """
+    Próbkowanie zadań i zapis spanów paczkami do pliku
+
+    sample_rate - udział śledzonych zadań (0.0-1.0); batch_size - liczba
+    spanów w buforze, po której następuje zapis do pliku
+    """
+
+    def __init__(self, path: str, sample_rate: float = 0.01, batch_size: int = 512):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._random = random.random
+        self.written = 0
+        with open(path, "w", encoding="utf-8") as trace_file:
+            trace_file.write("[\n")
+
+    def sample(self, task: WorkflowTask) -> Optional[_Trace]:
+        """Decyzja próbkowania - None dla zadania, które nie jest śledzone"""
+        if self.sample_rate <= 0 or self._random() >= self.sample_rate:
+            return None
+        return _Trace(next(self._ids))
+
+    def export(self, trace: _Trace) -> None:
+        lines = [_encode(span) + ",\n" for span in trace.spans]
+        with self._lock:
+            self._buffer.extend(lines)
+            if len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+            self._write(batch)
+
+    def flush(self) -> None:
+        """Zapisz bufor do pliku"""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            self._write(batch)
+
+    def _write(self, batch: List[str]) -> None:
+        # Wywoływane pod blokadą - paczki trafiają do pliku w całości i po kolei
+        if batch:
+            with open(self.path, "a", encoding="utf-8") as trace_file:
+                trace_file.write("".join(batch))
+            self.written += len(batch)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "Tracer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_trace(path: str) -> List[Dict[str, Any]]:
+    """Spany z pliku zapisanego przez Tracer"""
+    with open(path, encoding="utf-8") as trace_file:
+        return [json.loads(line.rstrip().rstrip(","))
+                for line in trace_file if line.strip() not in ("", "[", "]")]
+
+
+class TracedTaskManager(TaskManager):
+    """
+    TaskManager zapisujący spany dla próbki zadań
+
+    Zadanie niewylosowane kosztuje jedno losowanie - dlatego narzut przy
+    typowym sample_rate to ułamek procenta
+    """
+
+    def __init__(self, strategy=None, tracer: Optional[Tracer] = None):
+        super().__init__()
+        self.strategy = strategy
+        self.tracer = tracer
+
+    def execute_task(self, task: WorkflowTask) -> Dict[str, Any]:
+        trace = self.tracer.sample(task) if self.tracer is not None else None
+        if trace is None:
+            self._admit(task)
+            return super().execute_task(task)
+
+        start_ns = time.monotonic_ns()
+        attrs = {"title": task.title, "priority": task.priority.value}
+        trace.record("wait", task.created_ns, start_ns, **attrs)
+        outer, _local.trace = getattr(_local, "trace", None), trace
+        status = "failed"
+        try:
+            with trace_span("admission"):
+                self._admit(task)
+            with trace_span("process", strategy=type(self.strategy).__name__):
+                result = super().execute_task(task)
+            with trace_span("complete"):
+                status = self._complete(task, result)
+            return result
+        finally:
+            _local.trace = outer
+            trace.record("task", start_ns, time.monotonic_ns(), status=status, **attrs)
+            self.tracer.export(trace)
+
+    def _admit(self, task: WorkflowTask) -> None:
+        """Sprawdzenia przed strategią - punkt rozszerzeń dla podklas"""
+        if self.strategy is None:
+            raise ValueError("No strategy set")
+
+    def _complete(self, task: WorkflowTask, result: Dict[str, Any]) -> str:
+        """Obsługa wyniku po strategii - zwraca status zapisany w spanie task"""
+        return result.get("status", "unknown")
@@ -0,0 +1,195 @@
+"""
+Strategy Pattern - work stealing między wieloma TaskManager
+
+Jeden TaskManager na tenanta i nierówny ruch: jeden tonie w zadaniach,
+reszta stoi. WorkStealingRuntime daje każdemu managerowi własny wątek i
+lokalną kolejkę (deque) WorkflowTask:
+- właściciel bierze zadania z początku swojej kolejki (FIFO)
+- bezczynny manager kradnie połowę zaległości z końca kolejki najbardziej
+  obciążonego managera
+- skradzione zadanie wykonuje execute_task() managera, który je wykonuje -
+  czyli jego strategia
+steal=False wyłącza kradzież (statyczny podział - do porównań).
+
+>>> from starter import TaskManager, TaskProcessor
+>>> class Named(TaskProcessor):
+...     def __init__(self, name):
+...         self.name = name
+...     def process_task(self, task):
+...         task.mark_completed()
+...         return {"status": "completed", "strategy_used": self.name}
+>>> runtime = WorkStealingRuntime([TaskManager(Named("a")), TaskManager(Named("b"))])
+>>> futures = runtime.submit_many(0, [WorkflowTask(f"T{i}", TaskPriority.LOW, "x") for i in range(4)])
+>>> runtime.run_pending(1)  # manager "b" nie ma własnych zadań - kradnie z kolejki "a"
+4
+>>> {future.result()["strategy_used"] for future in futures}, runtime.stats()[1]["stolen"]
+({'b'}, 4)
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starter import TaskManager, TaskPriority, WorkflowTask
+
+
+class _Worker:
+    """Lokalna kolejka jednego managera z licznikami"""
+
+    def __init__(self, manager: TaskManager):
+        self.manager = manager
+        self.queue: Deque[Tuple[WorkflowTask, Future]] = deque()
+        self.lock = threading.Lock()
+        self.executed = 0
+        self.stolen = 0
+        self.steal_attempts = 0
+
+    def pop(self) -> Optional[Tuple[WorkflowTask, Future]]:
+        with self.lock:
+            return self.queue.popleft() if self.queue else None
+
+    def steal_half(self) -> List[Tuple[WorkflowTask, Future]]:
+        """Zabierz połowę (zaokrągloną w górę) zadań z końca kolejki"""
+        with self.lock:
+            count = (len(self.queue) + 1) // 2
+            stolen = [self.queue.pop() for _ in range(count)]
+        stolen.reverse()
+        return stolen
+
+
+class WorkStealingRuntime:
+    """
+    Wątek i lokalna kolejka per TaskManager, bezczynni kradną od zajętych
+
+    Kradzież paczkami (połowa kolejki ofiary) sprawia, że przy dużej
+    nierównowadze złodziej wraca po następne zadania rzadko - blokady
+    kolejek są prawie zawsze niesporne
+    """
+
+    def __init__(self, managers: Sequence[TaskManager], steal: bool = True):
+        self._workers = [_Worker(manager) for manager in managers]
+        self.steal = steal
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._threads: List[threading.Thread] = []
+        self._running = False
+
+    @property
+    def managers(self) -> List[TaskManager]:
+        return [worker.manager for worker in self._workers]
+
+    # %% Przyjmowanie zadań
+
+    def submit(self, index: int, task: WorkflowTask) -> Future:
+        """Wstaw zadanie do kolejki managera index, zwraca Future z wynikiem"""
+        return self.submit_many(index, [task])[0]
+
+    def submit_many(self, index: int, tasks: Iterable[WorkflowTask]) -> List[Future]:
+        worker = self._workers[index]
+        entries = [(task, Future()) for task in tasks]
+        with worker.lock:
+            worker.queue.extend(entries)
+        with self._condition:
+            self._pending += len(entries)
+            self._condition.notify_all()
+        return [future for _, future in entries]
+
+    # %% Wątki robocze
+
+    def start(self) -> None:
+        """Uruchom po jednym wątku na managera"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        for index in range(len(self._workers)):
+            thread = threading.Thread(target=self._worker_loop, args=(index,),
+                                      name=f"stealing-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, wait: bool = True) -> None:
+        """Zatrzymaj wątki; wait=True najpierw wykonuje wszystkie zaległe zadania"""
+        with self._condition:
+            if wait:
+                while self._pending and self._running:
+                    self._condition.wait()
+            self._running = False
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def run_pending(self, index: int) -> int:
+        """Wykonaj w bieżącym wątku wszystko, co dostępne dla managera index"""
+        count = 0
+        while True:
+            entry = self._next(index)
+            if entry is None:
+                return count
+            self._run(self._workers[index], *entry)
+            count += 1
+
+    def _worker_loop(self, index: int) -> None:
+        worker = self._workers[index]
+        while True:
+            entry = self._next(index)
+            if entry is not None:
+                self._run(worker, *entry)
+                continue
+            with self._condition:
+                while self._running and not self._has_work(index):
+                    self._condition.wait()
+                if not self._running:
+                    return
+
+    def _next(self, index: int) -> Optional[Tuple[WorkflowTask, Future]]:
+        """Najpierw lokalna kolejka, potem (gdy steal) kradzież od najbardziej obciążonego"""
+        worker = self._workers[index]
+        entry = worker.pop()
+        if entry is not None or not self.steal:
+            return entry
+        worker.steal_attempts += 1
+        victim = max((other for other in self._workers if other is not worker),
+                     key=lambda other: len(other.queue), default=None)
+        if victim is None:
+            return None
+        stolen = victim.steal_half()
+        if not stolen:
+            return None
+        worker.stolen += len(stolen)
+        with worker.lock:
+            worker.queue.extend(stolen[1:])
+        return stolen[0]
+
+    def _has_work(self, index: int) -> bool:
+        if self._workers[index].queue:
+            return True
+        return self.steal and any(worker.queue for worker in self._workers)
+
+    def _run(self, worker: _Worker, task: WorkflowTask, future: Future) -> None:
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(worker.manager.execute_task(task))
+            except Exception as error:
+                future.set_exception(error)
+        worker.executed += 1
+        with self._condition:
+            self._pending -= 1
+            if not self._pending:
+                self._condition.notify_all()
+
+    # %% Metryki
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per manager: długość kolejki, wykonane, skradzione, próby kradzieży"""
+        return [
+            {
+                "queue_depth": len(worker.queue),
+                "executed": worker.executed,
+                "stolen": worker.stolen,
+                "steal_attempts": worker.steal_attempts,
+            }
+            for worker in self._workers
+        ]
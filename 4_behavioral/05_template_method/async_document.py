@@ -0,0 +1,84 @@
+"""
+Template Method - asynchroniczny szablon z sekcjami pobieranymi współbieżnie
+
+W produkcji create_body() (a czasem i create_header()) czeka na wolne
+I/O. W AsyncDocumentGenerator kroki mogą być korutynami:
+- generate_document_async() startuje wszystkie kroki naraz - czas to
+  maksimum czasów sekcji, nie ich suma
+- kolejność w dokumencie zostaje: header → body → signature → footer
+- kroki synchroniczne wykonują się od razu w pętli; blokujące można
+  przenieść do wątków (offload_sync_steps = True)
+- błąd jednego kroku anuluje pozostałe i jest rzucany dalej
+
+>>> import asyncio
+>>> class Status(AsyncDocumentGenerator):
+...     async def create_header(self):
+...         await asyncio.sleep(0.02)
+...         return f"STATUS {self.title}"
+...     async def create_body(self):
+...         await asyncio.sleep(0.02)
+...         return "all green"
+...     def create_footer(self):
+...         return "-- ops"
+>>> asyncio.run(Status("API").generate_document_async())
+'STATUS API\\n\\nall green\\n\\n\\n\\n-- ops'
+"""
+
+import asyncio
+import inspect
+from typing import Any, Iterable, List
+
+from starter import DocumentGenerator
+
+
+STEPS = ("create_header", "create_body", "add_signature", "create_footer")
+
+
+class AsyncDocumentGenerator(DocumentGenerator):
+    """
+    DocumentGenerator, którego kroki mogą być async def
+
+    KLUCZOWE: szablon (kolejność i separator sekcji) jest ten sam co w
+    generate_document() - zmienia się tylko sposób czekania na kroki
+    """
+
+    # True - synchroniczne kroki w asyncio.to_thread(), np. gdy blokują na I/O
+    offload_sync_steps = False
+
+    async def generate_document_async(self) -> str:
+        """TEMPLATE METHOD (async) - sekcje współbieżnie, wynik w stałej kolejności"""
+        sections = await self._gather(*(self._run_step(step) for step in STEPS))
+        return self.SECTION_SEPARATOR.join(sections)
+
+    async def _run_step(self, step: str) -> str:
+        method = getattr(self, step)
+        if self.offload_sync_steps and not inspect.iscoroutinefunction(method):
+            return await asyncio.to_thread(method)
+        result = method()
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    @staticmethod
+    async def _gather(*coroutines) -> List[Any]:
+        """asyncio.gather, który po pierwszym błędzie anuluje pozostałe kroki"""
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+async def generate_many_async(documents: Iterable[AsyncDocumentGenerator],
+                              max_concurrency: int = 100) -> List[str]:
+    """Wygeneruj dokumenty współbieżnie (najwyżej max_concurrency naraz) - wyniki w kolejności wejścia"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def one(document: AsyncDocumentGenerator) -> str:
+        async with semaphore:
+            return await document.generate_document_async()
+
+    return await asyncio.gather(*(one(document) for document in documents))
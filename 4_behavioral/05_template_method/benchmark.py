@@ -0,0 +1,301 @@
+"""
+Benchmark - rozszerzenia Template Method
+
+Podkomendy:
+- bulk: dokumenty/s render_bulk() dla różnej liczby procesów względem
+  pętli generate_document() w jednym procesie (skalowanie zależy od liczby rdzeni)
+- cache: dokumenty/s z CachedSections vs bez cache, gdy dane treści
+  zmieniają się co --body-changes dokumentów (reszta sekcji z cache)
+- compiled: generate_document() szablonu skompilowanego (CompiledDocument)
+  vs wywołania kroków i sklejanie przy każdym dokumencie
+- async: czas dokumentu z sekcjami czekającymi na I/O - kroki po kolei
+  vs generate_document_async() (sekcje współbieżnie)
+- merge: e-maile/min - EmailDocument(subject) per odbiorca vs MailMerge
+  domyślny (asercja: nie wolniejszy niż pętla) i szablonowy zapisujący
+  jeden plik, jeden plik .gz i plik na paczkę
+- profile: dokumenty/s z profilowaniem kroków wyłączonym, włączonym
+  i znowu wyłączonym + tabela statystyk per klasa i krok
+
+Uruchomienie (po zaimplementowaniu ReportDocument i EmailDocument):
+    python benchmark.py bulk
+    python benchmark.py bulk --documents 500000 --processes 1 2 4 8 --chunk-size 512
+    python benchmark.py bulk --directory
+    python benchmark.py cache --documents 20000 --rows 200 --body-changes 100
+    python benchmark.py compiled --documents 500000
+    python benchmark.py async --latency 0.05 0.2 0.01 0.02
+    python benchmark.py merge --recipients 1000000 --batch-size 10000
+    python benchmark.py profile --documents 200000
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+from collections import deque
+from typing import Callable, Iterator, List, Tuple
+
+import profiling
+from async_document import AsyncDocumentGenerator
+from bulk import render_bulk
+from compiled import CompiledDocument
+from mail_merge import STEPS as MERGE_STEPS, MailMerge, RecipientTable
+from section_cache import CachedSections, SectionCache
+from starter import DocumentGenerator, EmailDocument, ReportDocument
+
+
+def document_specs(documents: int) -> Iterator[Tuple[type, str]]:
+    """Na przemian raporty i e-maile - generator, żeby nie trzymać listy w pamięci"""
+    for index in range(documents):
+        document_class = ReportDocument if index % 2 else EmailDocument
+        yield document_class, f"Document {index}"
+
+
+def run_serial(documents: int, path: str) -> float:
+    """Punkt odniesienia - generate_document() po kolei w jednym procesie"""
+    start = time.perf_counter()
+    with open(path, "w", encoding="utf-8") as output:
+        for document_class, title in document_specs(documents):
+            output.write(document_class(title).generate_document())
+    return documents / (time.perf_counter() - start)
+
+
+def bench_bulk(args: argparse.Namespace) -> None:
+    print(f"bulk: {args.documents} dokumentów, paczki po {args.chunk_size}, "
+          f"{os.cpu_count()} rdzeni, wyjście: {'katalog' if args.directory else 'plik'}")
+    workdir = tempfile.mkdtemp()
+    try:
+        baseline = run_serial(args.documents, os.path.join(workdir, "serial.txt"))
+    finally:
+        shutil.rmtree(workdir)
+    print(f"  szeregowo    {baseline:>10,.0f} dok/s")
+    for processes in args.processes:
+        workdir = tempfile.mkdtemp()
+        output = workdir if args.directory else os.path.join(workdir, "documents.txt")
+        try:
+            stats = render_bulk(document_specs(args.documents), output,
+                                processes=processes, chunk_size=args.chunk_size)
+        finally:
+            shutil.rmtree(workdir)
+        print(f"  procesy={processes:<3} {stats['documents_per_s']:>10,.0f} dok/s  "
+              f"{stats['bytes'] / 2 ** 20:>8.1f} MiB  "
+              f"x{stats['documents_per_s'] / baseline:.2f}")
+
+
+class DataReport(DocumentGenerator):
+    """Raport z sekcjami liczonymi z danych - treść zależy od wersji danych"""
+
+    def __init__(self, title: str, rows: int, version: int):
+        super().__init__(title)
+        self.rows = rows
+        self.version = version
+
+    def create_header(self) -> str:
+        return "\n".join(f"{self.title} | {field:<12} | {index:>4}" for index, field in enumerate(
+            ["owner", "department", "period", "currency", "status"] * 4))
+
+    def create_body(self) -> str:
+        return "".join(f"{index:06d} | v{self.version} | {index * 1.5:12.2f}\n" for index in range(self.rows))
+
+    def add_signature(self) -> str:
+        return f"Approved: {self.title.upper()}"
+
+    def create_footer(self) -> str:
+        return "\n".join(f"{self.title} page {page}" for page in range(20))
+
+
+class CachedDataReport(CachedSections, DataReport):
+    section_cache = SectionCache()
+
+    def body_key(self):
+        return self.rows, self.version
+
+
+def run_documents(document_class: type, args: argparse.Namespace) -> float:
+    start = time.perf_counter()
+    for index in range(args.documents):
+        document_class(f"Report {index % args.titles}", args.rows, index // args.body_changes).generate_document()
+    return args.documents / (time.perf_counter() - start)
+
+
+def bench_cache(args: argparse.Namespace) -> None:
+    print(f"cache: {args.documents} dokumentów, {args.titles} tytułów, {args.rows} wierszy treści, "
+          f"nowe dane co {args.body_changes} dokumentów")
+    plain = run_documents(DataReport, args)
+    cached = run_documents(CachedDataReport, args)
+    stats = CachedDataReport.section_cache.stats()
+    print(f"  bez cache  {plain:>10,.0f} dok/s")
+    print(f"  cache      {cached:>10,.0f} dok/s  x{cached / plain:.2f}  "
+          f"trafienia {stats['hits']:,} / chybienia {stats['misses']:,}  {stats['bytes'] / 1024:.0f} KiB")
+
+
+def run_render(document_class: type, documents: int) -> float:
+    document = document_class("Q4 Sales")
+    start = time.perf_counter()
+    for _ in range(documents):
+        document.generate_document()
+    return documents / (time.perf_counter() - start)
+
+
+def bench_compiled(args: argparse.Namespace) -> None:
+    print(f"compiled: {args.documents} wywołań generate_document() na jednym dokumencie")
+    for base in (ReportDocument, EmailDocument):
+        compiled = type(f"Compiled{base.__name__}", (CompiledDocument, base), {})
+        plain, fast = run_render(base, args.documents), run_render(compiled, args.documents)
+        print(f"  {base.__name__:<15} {plain:>12,.0f} dok/s  skompilowany {fast:>12,.0f} dok/s  "
+              f"x{fast / plain:.2f}  kroki: {compiled.compiled_steps}")
+
+
+class RemoteSectionsDocument(AsyncDocumentGenerator):
+    """Dokument, którego sekcje czekają na zdalne źródła (asyncio.sleep)"""
+
+    def __init__(self, title: str, latency: List[float]):
+        super().__init__(title)
+        self.latency = latency
+
+    async def _fetch(self, index: int, text: str) -> str:
+        await asyncio.sleep(self.latency[index])
+        return text
+
+    async def create_header(self) -> str:
+        return await self._fetch(0, f"HEADER {self.title}")
+
+    async def create_body(self) -> str:
+        return await self._fetch(1, "BODY")
+
+    async def add_signature(self) -> str:
+        return await self._fetch(2, "SIGNATURE")
+
+    async def create_footer(self) -> str:
+        return await self._fetch(3, "FOOTER")
+
+
+async def generate_sequentially(document: RemoteSectionsDocument) -> str:
+    sections = [await getattr(document, step)() for step in
+                ("create_header", "create_body", "add_signature", "create_footer")]
+    return document.SECTION_SEPARATOR.join(sections)
+
+
+def bench_async(args: argparse.Namespace) -> None:
+    print(f"async: opóźnienia sekcji {args.latency} s (suma {sum(args.latency):.3f}, maksimum {max(args.latency):.3f})")
+    document = RemoteSectionsDocument("Q4", args.latency)
+    for name, render in (("po kolei", generate_sequentially(document)),
+                         ("współbieżnie", document.generate_document_async())):
+        start = time.perf_counter()
+        asyncio.run(render)
+        print(f"  {name:<13} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+def best_per_min(render: Callable[[], object], count: int, repeats: int = 3) -> float:
+    """E-maile/min z najlepszego z kilku przebiegów - porównanie odporne na pojedyncze zakłócenia"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - start)
+    return count / best * 60
+
+
+def bench_merge(args: argparse.Namespace) -> None:
+    subjects = [f"Order {index} has shipped" for index in range(args.recipients)]
+    recipients = RecipientTable({"title": subjects})
+    print(f"merge: {args.recipients} odbiorców, paczki po {args.batch_size}")
+
+    # Domyślny MailMerge (bez template_steps) nie może być wolniejszy niż pętla, którą zastępuje
+    default = MailMerge(EmailDocument, recipients)
+    naive = best_per_min(lambda: deque((EmailDocument(subject).generate_document() for subject in subjects),
+                                       maxlen=0), args.recipients)
+    merged = best_per_min(lambda: deque(default, maxlen=0), args.recipients)
+    print(f"  w pamięci: EmailDocument per odbiorca {naive:>14,.0f} e-maili/min")
+    print(f"  w pamięci: MailMerge domyślnie       {merged:>14,.0f} e-maili/min  x{merged / naive:.2f}  "
+          f"{default.compiled_steps}")
+    assert merged >= naive, f"domyślny MailMerge wolniejszy niż pętla: {merged:,.0f} < {naive:,.0f} e-maili/min"
+
+    workdir = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        with open(os.path.join(workdir, "naive.txt"), "w", encoding="utf-8") as output:
+            for subject in subjects:
+                output.write(EmailDocument(subject).generate_document())
+        naive = args.recipients / (time.perf_counter() - start) * 60
+        print(f"  EmailDocument per odbiorca  {naive:>14,.0f} e-maili/min")
+
+        # EmailDocument wstawia tytuł bez warunków - wszystkie kroki mogą być szablonem
+        merge = MailMerge(EmailDocument, recipients, template_steps=MERGE_STEPS)
+        merge.verify()
+        runs = (("domyślnie, plik", lambda: default.write_stream(os.path.join(workdir, "default.txt"), args.batch_size)),
+                ("jeden plik", lambda: merge.write_stream(os.path.join(workdir, "emails.txt"), args.batch_size)),
+                ("jeden plik .gz", lambda: merge.write_stream(os.path.join(workdir, "emails.txt.gz"), args.batch_size,
+                                                                compresslevel=args.compresslevel)),
+                ("plik na paczkę", lambda: merge.write_batches(os.path.join(workdir, "batches"), args.batch_size)))
+        for name, run in runs:
+            stats = run()
+            print(f"  MailMerge, {name:<16} {stats['emails_per_min']:>14,.0f} e-maili/min  "
+                  f"x{stats['emails_per_min'] / naive:.2f}  {stats['bytes'] / 2 ** 20:.0f} MiB")
+    finally:
+        shutil.rmtree(workdir)
+
+
+def run_mixed(documents: int) -> float:
+    start = time.perf_counter()
+    for document_class, title in document_specs(documents):
+        document_class(title).generate_document()
+    return documents / (time.perf_counter() - start)
+
+
+def bench_profile(args: argparse.Namespace) -> None:
+    print(f"profile: {args.documents} dokumentów (raporty i e-maile na przemian)")
+    before = run_mixed(args.documents)
+    with profiling.profiled():
+        enabled = run_mixed(args.documents)
+    after = run_mixed(args.documents)
+    for name, value in (("wyłączone", before), ("włączone", enabled), ("wyłączone ponownie", after)):
+        print(f"  {name:<19} {value:>12,.0f} dok/s  x{value / before:.2f}")
+    print(profiling.report())
+    profiling.reset()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark rozszerzeń Template Method")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bulk = commands.add_parser("bulk", help="generowanie w puli procesów")
+    bulk.add_argument("--documents", type=int, default=100_000)
+    bulk.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    bulk.add_argument("--chunk-size", type=int, default=256)
+    bulk.add_argument("--directory", action="store_true", help="plik na dokument zamiast jednego pliku")
+    bulk.set_defaults(run=bench_bulk)
+
+    cache = commands.add_parser("cache", help="cache sekcji")
+    cache.add_argument("--documents", type=int, default=20_000)
+    cache.add_argument("--titles", type=int, default=50)
+    cache.add_argument("--rows", type=int, default=200, help="wiersze treści")
+    cache.add_argument("--body-changes", type=int, default=100, help="co ile dokumentów nowa wersja danych")
+    cache.set_defaults(run=bench_cache)
+
+    compiled = commands.add_parser("compiled", help="szablon kompilowany na podklasę")
+    compiled.add_argument("--documents", type=int, default=500_000)
+    compiled.set_defaults(run=bench_compiled)
+
+    latency = commands.add_parser("async", help="sekcje współbieżnie")
+    latency.add_argument("--latency", type=float, nargs=4, default=[0.05, 0.2, 0.01, 0.02],
+                         metavar=("HEADER", "BODY", "SIGNATURE", "FOOTER"), help="opóźnienia sekcji (s)")
+    latency.set_defaults(run=bench_async)
+
+    merge = commands.add_parser("merge", help="korespondencja seryjna")
+    merge.add_argument("--recipients", type=int, default=1_000_000)
+    merge.add_argument("--batch-size", type=int, default=10_000)
+    merge.add_argument("--compresslevel", type=int, default=6, help="poziom gzip dla pliku .gz")
+    merge.set_defaults(run=bench_merge)
+
+    profile = commands.add_parser("profile", help="narzut profilowania kroków")
+    profile.add_argument("--documents", type=int, default=200_000)
+    profile.set_defaults(run=bench_profile)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Template Method - masowe generowanie dokumentów w puli procesów
+
+Setki tysięcy ReportDocument/EmailDocument generowane po jednym to jeden
+rdzeń. render_bulk() przyjmuje strumień specyfikacji (klasa, *argumenty),
+dzieli go na paczki i renderuje w puli procesów:
+- wynik trafia do jednego pliku albo katalogu (plik na dokument) w kolejności wejścia
+- w locie jest najwyżej max_pending paczek - pamięć nie rośnie z liczbą dokumentów
+- do procesu jedzie paczka krotek (klasa - pikle'owana po nazwie, argumenty),
+  nie gotowe obiekty; klasy muszą więc być zdefiniowane na poziomie modułu
+- w trybie katalogu procesy same zapisują pliki - tekst nie wraca przez IPC
+
+>>> import os, tempfile
+>>> from starter import ReportDocument
+>>> path = os.path.join(tempfile.mkdtemp(), "reports.txt")
+>>> stats = render_bulk([(ReportDocument, f"Q{i}") for i in range(5)], path, processes=2, chunk_size=2)
+>>> stats["documents"], open(path).read().count(DEFAULT_SEPARATOR)
+(5, 4)
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence
+
+
+# Specyfikacja dokumentu: (klasa generatora, *argumenty konstruktora)
+DocumentSpec = Sequence[Any]
+
+DEFAULT_SEPARATOR = "\n\n" + "=" * 60 + "\n\n"
+
+
+def _chunks(specs: Iterable[DocumentSpec], size: int) -> Iterable[List[DocumentSpec]]:
+    iterator = iter(specs)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# %% Strona procesu roboczego
+
+def _render(spec: DocumentSpec) -> str:
+    document_class, *args = spec
+    return document_class(*args).generate_document()
+
+
+def _render_chunk(chunk: List[DocumentSpec], separator: str) -> bytes:
+    """Cała paczka jako jeden blok bajtów - jeden obiekt do przesłania zamiast chunk_size napisów"""
+    return separator.join(_render(spec) for spec in chunk).encode("utf-8")
+
+
+def _render_chunk_to_files(chunk: List[DocumentSpec], directory: str, first_index: int,
+                           suffix: str) -> int:
+    """Zapisz każdy dokument paczki do własnego pliku - zwraca liczbę bajtów"""
+    written = 0
+    for offset, spec in enumerate(chunk):
+        data = _render(spec).encode("utf-8")
+        with open(os.path.join(directory, f"{first_index + offset:08d}{suffix}"), "wb") as output:
+            output.write(data)
+        written += len(data)
+    return written
+
+
+# %% Strona rodzica
+
+def render_bulk(specs: Iterable[DocumentSpec], output: str, processes: Optional[int] = None,
+                chunk_size: int = 256, max_pending: Optional[int] = None,
+                separator: str = DEFAULT_SEPARATOR, suffix: str = ".txt") -> Dict[str, Any]:
+    """
+    Wyrenderuj dokumenty w puli procesów, zachowując kolejność wejścia
+
+    output - plik UTF-8 (dokumenty rozdzielone separator) albo istniejący
+    katalog (plik 00000000.txt, 00000001.txt, ... na dokument). Zwraca
+    statystyki: documents, bytes, seconds, documents_per_s, processes
+    """
+    processes = processes or os.cpu_count() or 1
+    max_pending = max_pending or processes * 2
+    to_directory = os.path.isdir(output)
+    pending: Deque[Future] = deque()
+    documents = written = 0
+    start = time.perf_counter()
+
+    sink = None if to_directory else open(output, "wb")
+    chunk_separator = separator.encode("utf-8")
+    first = True
+
+    def drain_one() -> None:
+        nonlocal written, first
+        result = pending.popleft().result()
+        if to_directory:
+            written += result
+            return
+        # Separator zależy od pozycji paczki, nie od bajtów - pusty dokument też jest dokumentem
+        if not first:
+            sink.write(chunk_separator)
+            written += len(chunk_separator)
+        sink.write(result)
+        written += len(result)
+        first = False
+
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            for chunk in _chunks(specs, chunk_size):
+                if to_directory:
+                    future = pool.submit(_render_chunk_to_files, chunk, output, documents, suffix)
+                else:
+                    future = pool.submit(_render_chunk, chunk, separator)
+                pending.append(future)
+                documents += len(chunk)
+                # Ograniczenie pamięci: czekamy na najstarszą paczkę zanim wyślemy kolejną
+                while len(pending) >= max_pending:
+                    drain_one()
+            while pending:
+                drain_one()
+    finally:
+        if sink is not None:
+            sink.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        "documents": documents,
+        "bytes": written,
+        "seconds": seconds,
+        "documents_per_s": documents / seconds if seconds else 0.0,
+        "processes": processes,
+    }
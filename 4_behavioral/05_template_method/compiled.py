@@ -0,0 +1,138 @@
+"""
+Template Method - szkielet dokumentu kompilowany raz na podklasę
+
+generate_document() przy każdym wywołaniu woła cztery kroki i skleja ich
+wyniki. CompiledDocument w __init_subclass__ sprawdza każdy krok podklasy
+na próbnych tytułach i klasyfikuje go jako:
+- static  - wynik nie zależy od instancji (np. podpis, stopka)
+- title   - wynik to stałe kawałki przeplecione tytułem (tekst.join)
+- dynamic - wszystko inne (wyjątek na próbie, inne atrybuty, title.upper())
+Potem generuje jedną funkcję renderującą: stałe kawałki są policzone
+z góry, a dokument bez kroków dynamicznych to jedno title.join(kawałki).
+Kroki zależne od atrybutów ustawianych w __init__ przy wartościach
+domyślnych klasy nie dadzą się wykryć próbą - wpisz je do dynamic_steps.
+To samo dotyczy kroków zmiennych w czasie (date.today(), licznik, los):
+próby trwają ułamek sekundy, więc krok wygląda na "static" i jego wynik
+z chwili definicji klasy zostaje zamrożony w każdym kolejnym dokumencie.
+
+>>> class Notice(CompiledDocument):
+...     def create_header(self): return f"NOTICE: {self.title}"
+...     def create_body(self): return "Office closed on " + self.title
+...     def create_footer(self): return "-- Admin"
+>>> Notice.compiled_steps["create_header"], Notice.compiled_steps["create_footer"]
+('title', 'static')
+>>> Notice("Friday").generate_document()
+'NOTICE: Friday\\n\\nOffice closed on Friday\\n\\n\\n\\n-- Admin'
+"""
+
+from typing import Dict, FrozenSet, List, Tuple
+
+from starter import DocumentGenerator
+
+
+STEPS = ("create_header", "create_body", "add_signature", "create_footer")
+
+# Tytuły próbne: dwa znaczniki bez liter (odporne na kolizję z treścią)
+# i zwykły tekst innej długości - wyłapuje title.upper(), len(title) itp.
+_PROBES = ("\x00\x01\x00", "\x00\x02\x02\x00", "Probe Title 42")
+
+
+class CompiledDocument(DocumentGenerator):
+    """
+    DocumentGenerator z szablonem kompilowanym przy definicji podklasy
+
+    compiled_steps - klasyfikacja kroków; dynamic_steps - kroki wymuszone
+    jako dynamiczne; podklasa nadpisująca krok jest kompilowana od nowa
+    """
+
+    dynamic_steps: FrozenSet[str] = frozenset()
+    compiled_steps: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # ABCMeta ustawia __abstractmethods__ dopiero po __init_subclass__ - sprawdzamy kroki
+        abstract = any(getattr(getattr(cls, step), "__isabstractmethod__", False) for step in STEPS)
+        if abstract or "generate_document" in cls.__dict__:
+            return  # Klasa pośrednia albo własny szablon - nie kompilujemy
+        segments = _classify(cls)
+        cls.compiled_steps = {step: kind for step, kind, _ in segments}
+        cls.generate_document = _build_render(cls, segments)
+
+
+def _probe(cls: type, step: str, title: str) -> str:
+    document = object.__new__(cls)
+    document.title = title
+    return getattr(document, step)()
+
+
+def _classify(cls: type) -> List[Tuple[str, str, Tuple[str, ...]]]:
+    """(krok, rodzaj, stałe kawałki) - dla "title" kawałki do title.join()"""
+    segments = []
+    for step in STEPS:
+        kind, pieces = "dynamic", ()
+        if step not in cls.dynamic_steps:
+            try:
+                outputs = [_probe(cls, step, title) for title in _PROBES]
+            except Exception:
+                outputs = None
+            if outputs and all(isinstance(output, str) for output in outputs):
+                candidate = tuple(outputs[0].split(_PROBES[0]))
+                if len(candidate) == 1 and outputs[0] == outputs[1] == outputs[2]:
+                    kind, pieces = "static", candidate
+                elif all(title.join(candidate) == output for title, output in zip(_PROBES, outputs)):
+                    kind, pieces = "title", candidate
+        segments.append((step, kind, pieces))
+    return segments
+
+
+def _build_render(cls: type, segments: List[Tuple[str, str, Tuple[str, ...]]]):
+    """Jedna funkcja renderująca - sąsiednie stałe sklejone z góry"""
+    parts: List[object] = []  # str = stała, None = tytuł, nazwa kroku w krotce = wywołanie
+
+    def constant(text: str) -> None:
+        if parts and isinstance(parts[-1], str):
+            parts[-1] += text
+        elif text:
+            parts.append(text)
+
+    for index, (step, kind, pieces) in enumerate(segments):
+        if index:
+            constant(cls.SECTION_SEPARATOR)
+        if kind == "dynamic":
+            parts.append((step,))
+            continue
+        for position, piece in enumerate(pieces):
+            if position:
+                parts.append(None)
+            constant(piece)
+
+    namespace: Dict[str, object] = {}
+    if all(not isinstance(part, tuple) for part in parts):
+        # Tylko stałe i tytuł: kawałki między kolejnymi wystąpieniami tytułu
+        pieces, current = [], ""
+        for part in parts:
+            if part is None:
+                pieces.append(current)
+                current = ""
+            else:
+                current += part
+        namespace["PIECES"] = tuple(pieces + [current])
+        body = "return self.title.join(PIECES)"
+    else:
+        expressions = []
+        for part in parts:
+            if part is None:
+                expressions.append("title")
+            elif isinstance(part, tuple):
+                expressions.append(f"self.{part[0]}()")
+            else:
+                name = f"C{len(namespace)}"
+                namespace[name] = part
+                expressions.append(name)
+        body = f"title = self.title\n    return ''.join(({', '.join(expressions)},))"
+    source = f"def generate_document(self):\n    {body}\n"
+    exec(source, namespace)
+    render = namespace["generate_document"]
+    render.__qualname__ = f"{cls.__qualname__}.generate_document"
+    render.__doc__ = f"Skompilowany szablon {cls.__name__}:\n{source}"
+    return render
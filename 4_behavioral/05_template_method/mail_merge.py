@@ -0,0 +1,336 @@
+"""
+Template Method - korespondencja seryjna dla milionów odbiorców
+
+EmailDocument(subject) dla każdego odbiorcy tworzy obiekt i od nowa
+buduje wszystkie sekcje. MailMerge bierze jedną klasę dokumentu
+i kolumnową tabelę odbiorców (kolumna = atrybut dokumentu, np. title, name):
+- krok, który nie czyta żadnej kolumny i na próbach daje ten sam tekst
+  (podpis, stopka), jest renderowany raz (static)
+- pozostałe kroki są wołane per odbiorca (dynamic) na jednym dokumencie
+  odbiorcy, wspólnym dla wszystkich jego kroków - zawsze poprawnie
+- kroki wskazane w template_steps są raz renderowane na znacznikach zamiast
+  wartości kolumn i dzielone na stałe kawałki + odwołania do kolumn
+- UWAGA: szablon jest sprawdzany tylko na próbnym, pierwszym i ostatnim
+  odbiorcy; krok z warunkiem na wartości kolumny (if self.vip == "yes")
+  może te próby przejść i po cichu dać zły tekst odbiorcom pomiędzy.
+  Do template_steps wpisuj tylko kroki, które wstawiają kolumny bez
+  warunków i przekształceń; verify() porównuje wszystkich odbiorców
+  z prawdziwymi metodami (wolne - do testów i przebiegów próbnych)
+- krok zmienny w czasie (date.today()) wygląda na stały - jego wynik
+  z chwili utworzenia MailMerge trafi do wszystkich e-maili
+- z kawałków powstaje jedna funkcja render(kolumna0, kolumna1, ...)
+  wołana przez map() po kolumnach - per odbiorca zostaje jedno "".join
+- wynik paczkami: plik na paczkę albo jeden strumień (także .gz)
+
+>>> from starter import DocumentGenerator
+>>> class Invite(DocumentGenerator):
+...     def create_header(self): return f"To: {self.name}\\nSubject: {self.title}"
+...     def create_body(self): return f"Hi {self.name}, see you on {self.title}!"
+...     def create_footer(self): return "-- Events"
+>>> recipients = {"name": ["Ann", "Bob"], "title": ["Monday", "Friday"]}
+>>> MailMerge(Invite, recipients).compiled_steps
+{'create_header': 'dynamic', 'create_body': 'dynamic', 'add_signature': 'static', 'create_footer': 'static'}
+>>> merge = MailMerge(Invite, recipients, template_steps=STEPS)
+>>> merge.compiled_steps
+{'create_header': 'template', 'create_body': 'template', 'add_signature': 'static', 'create_footer': 'static'}
+>>> merge.verify()
+>>> print(merge.render(1))
+To: Bob
+Subject: Friday
+<BLANKLINE>
+Hi Bob, see you on Friday!
+<BLANKLINE>
+<BLANKLINE>
+<BLANKLINE>
+-- Events
+"""
+
+import csv
+import gzip
+import keyword
+import os
+import re
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from bulk import DEFAULT_SEPARATOR
+
+
+STEPS = ("create_header", "create_body", "add_signature", "create_footer")
+
+
+class RecipientTable:
+    """Kolumnowa tabela odbiorców - kolumna to lista wartości, wszystkie tej samej długości"""
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]]):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns differ in length: {sorted(lengths)}")
+        self.columns: Dict[str, Sequence[Any]] = dict(columns)
+        self.names: Tuple[str, ...] = tuple(self.columns)
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def row(self, index: int) -> Dict[str, Any]:
+        return {name: values[index] for name, values in self.columns.items()}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "RecipientTable":
+        columns: Dict[str, List[Any]] = {}
+        for count, row in enumerate(rows):
+            if not columns:
+                columns = {name: [] for name in row}
+            if row.keys() != columns.keys():
+                raise ValueError(f"Row {count} has columns {sorted(row)}, expected {sorted(columns)}")
+            for name, value in row.items():
+                columns[name].append(value)
+        return cls(columns)
+
+    @classmethod
+    def from_csv(cls, path: str, encoding: str = "utf-8") -> "RecipientTable":
+        """Tabela z pliku CSV z nagłówkiem (nazwy kolumn = atrybuty dokumentu)"""
+        with open(path, newline="", encoding=encoding) as source:
+            return cls.from_rows(csv.DictReader(source))
+
+
+class MailMerge:
+    """
+    Jedna klasa dokumentu renderowana dla wszystkich odbiorców tabeli
+
+    compiled_steps - static (stały tekst, liczony raz), template (kawałki
+    + kolumny), dynamic (metoda wołana per odbiorca). template_steps - kroki, dla
+    których wywołujący zgadza się na kompilację do szablonu
+    """
+
+    def __init__(self, document_class: type,
+                 recipients: Union[RecipientTable, Mapping[str, Sequence[Any]]],
+                 separator: str = DEFAULT_SEPARATOR, template_steps: Iterable[str] = ()):
+        self.document_class = document_class
+        self.template_steps = frozenset(template_steps)
+        unknown = self.template_steps - set(STEPS)
+        if unknown:
+            raise ValueError(f"Unknown template steps: {sorted(unknown)}")
+        self.recipients = recipients if isinstance(recipients, RecipientTable) else RecipientTable(recipients)
+        self.separator = separator
+        self.compiled_steps: Dict[str, str] = {}
+        self._render = self._compile()
+
+    # %% Kompilacja szablonu
+
+    def _document(self, values: Mapping[str, Any]):
+        """Dokument bez __init__ - tylko atrybuty z kolumn"""
+        document = object.__new__(self.document_class)
+        for name, value in values.items():
+            setattr(document, name, value)
+        return document
+
+    def _recorder(self) -> type:
+        """Podklasa zapisująca, które kolumny odczytał krok (także przez getattr i metody pomocnicze)"""
+        columns = set(self.recipients.names)
+        reads = set()
+
+        def __getattribute__(document, name):
+            if name in columns:
+                reads.add(name)
+            return super(recorder, document).__getattribute__(name)
+
+        recorder = type(f"_Recorded{self.document_class.__name__}", (self.document_class,),
+                        {"__getattribute__": __getattribute__, "reads": reads})
+        return recorder
+
+    def _static_text(self, step: str, recorder: type) -> Optional[str]:
+        """
+        Tekst kroku, jeśli nie czyta żadnej kolumny i jest ten sam na próbach; None = nie stały
+
+        Krok zmienny w czasie (date.today()) też wygląda na stały - jego
+        wynik z chwili utworzenia MailMerge trafi do wszystkich e-maili
+        """
+        names = self.recipients.names
+        outputs = []
+        for probe in range(2):
+            document = object.__new__(recorder)
+            for index, name in enumerate(names):
+                object.__setattr__(document, name, f"Probe {name.title()} {index}.{probe}")
+            recorder.reads.clear()
+            try:
+                outputs.append(getattr(document, step)())
+            except Exception:
+                return None
+            if recorder.reads or not isinstance(outputs[-1], str):
+                return None
+        return outputs[0] if outputs[0] == outputs[1] else None
+
+    def _step_parts(self, step: str) -> Optional[List[Union[str, int]]]:
+        """Kawałki kroku z template_steps: str = stała, int = numer kolumny; None = krok dynamiczny"""
+        names = self.recipients.names
+        markers = {name: f"\x00{index}\x00" for index, name in enumerate(names)}
+        try:
+            probe = getattr(self._document(markers), step)()
+        except Exception:
+            return None
+        if not isinstance(probe, str):
+            return None
+        parts: List[Union[str, int]] = []
+        for position, piece in enumerate(re.split("\x00(\\d+)\x00", probe)):
+            parts.append(int(piece) if position % 2 else piece)
+        # Sprawdzenie na próbnych wartościach i prawdziwych odbiorcach (pierwszym i ostatnim)
+        rows = [{name: f"Probe {name.title()} {index}" for index, name in enumerate(names)}]
+        rows += [self.recipients.row(index) for index in sorted({0, len(self.recipients) - 1})
+                 if len(self.recipients)]
+        for row in rows:
+            try:
+                expected = getattr(self._document(row), step)()
+            except Exception:
+                return None
+            filled = "".join(str(row[names[part]]) if isinstance(part, int) else part for part in parts)
+            if filled != expected:
+                return None
+        return parts
+
+    def _compile(self):
+        """
+        Jedna funkcja render(c0, c1, ...) - sąsiednie stałe sklejone z góry
+
+        Kroki dynamiczne dostają jeden dokument na odbiorcę (atrybuty
+        przypisane wprost, bez słownika wiersza), wspólny dla wszystkich kroków
+        """
+        parts: List[Union[str, int, Tuple[str]]] = []
+        recorder = self._recorder()
+
+        def constant(text: str) -> None:
+            if parts and isinstance(parts[-1], str):
+                parts[-1] += text
+            elif text:
+                parts.append(text)
+
+        for index, step in enumerate(STEPS):
+            if index:
+                constant(self.document_class.SECTION_SEPARATOR)
+            step_parts = self._step_parts(step) if step in self.template_steps else None
+            if step_parts is None:
+                static = self._static_text(step, recorder)
+                step_parts = None if static is None else [static]
+            if step_parts is None:
+                self.compiled_steps[step] = "dynamic"
+                parts.append((step,))
+                continue
+            self.compiled_steps[step] = "template" if any(isinstance(part, int) for part in step_parts) else "static"
+            for part in step_parts:
+                if isinstance(part, str):
+                    constant(part)
+                else:
+                    parts.append(part)
+
+        names = self.recipients.names
+        namespace: Dict[str, Any] = {"NEW": object.__new__, "CLS": self.document_class, "SET": setattr}
+        expressions = []
+        for part in parts:
+            if isinstance(part, int):
+                expressions.append(f"str(c{part})")
+            elif isinstance(part, tuple):
+                expressions.append(f"d.{part[0]}()")
+            else:
+                name = f"K{len(namespace)}"
+                namespace[name] = part
+                expressions.append(name)
+        expressions = expressions or ["''"]
+        body = []
+        if any(isinstance(part, tuple) for part in parts):
+            body.append("d = NEW(CLS)")
+            for index, name in enumerate(names):
+                body.append(f"d.{name} = c{index}" if name.isidentifier() and not keyword.iskeyword(name)
+                            else f"SET(d, {name!r}, c{index})")
+        body.append(f"return ''.join(({', '.join(expressions)},))")
+        arguments = ", ".join(f"c{index}" for index in range(len(names)))
+        source = f"def render({arguments}):\n" + "".join(f"    {line}\n" for line in body)
+        exec(source, namespace)
+        return namespace["render"]
+
+    def verify(self) -> None:
+        """
+        Porównaj e-mail każdego odbiorcy z prawdziwymi metodami kroków
+
+        ValueError przy pierwszej różnicy - wskazuje odbiorcę i winny krok
+        """
+        templated = [step for step in STEPS if self.compiled_steps[step] != "dynamic"]
+        if not templated:
+            return
+        separator = self.document_class.SECTION_SEPARATOR
+        for index, email in enumerate(self):
+            document = self._document(self.recipients.row(index))
+            sections = [getattr(document, step)() for step in STEPS]
+            if email == separator.join(sections):
+                continue
+            for step, section in zip(STEPS, sections):
+                if step in templated and section not in email:
+                    raise ValueError(f"Recipient {index}: step {step} differs from its template")
+            raise ValueError(f"Recipient {index}: rendered e-mail differs from the document")
+
+    # %% Renderowanie
+
+    def render(self, index: int) -> str:
+        """E-mail jednego odbiorcy"""
+        return self._render(*(values[index] for values in self.recipients.columns.values()))
+
+    def __iter__(self) -> Iterator[str]:
+        if not self.recipients.names:
+            return iter(())
+        return map(self._render, *self.recipients.columns.values())
+
+    def iter_batches(self, batch_size: int = 10_000) -> Iterator[str]:
+        """Paczki e-maili sklejone separatorem - w pamięci najwyżej jedna paczka"""
+        emails = iter(self)
+        while True:
+            batch = self.separator.join(islice(emails, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def write_batches(self, directory: str, batch_size: int = 10_000,
+                      compress: bool = False, compresslevel: int = 6) -> Dict[str, Any]:
+        """Plik na paczkę: batch_00000.txt (albo .txt.gz) w katalogu directory"""
+        os.makedirs(directory, exist_ok=True)
+        suffix = ".txt.gz" if compress else ".txt"
+        start, written, batches = time.perf_counter(), 0, 0
+        for batches, batch in enumerate(self.iter_batches(batch_size), 1):
+            data = batch.encode("utf-8")
+            path = os.path.join(directory, f"batch_{batches - 1:05d}{suffix}")
+            with (gzip.open(path, "wb", compresslevel=compresslevel) if compress else open(path, "wb")) as output:
+                output.write(data)
+            written += len(data)
+        return self._stats(start, written, batches)
+
+    def write_stream(self, path: str, batch_size: int = 10_000,
+                     compress: Optional[bool] = None, compresslevel: int = 6) -> Dict[str, Any]:
+        """
+        Wszystkie e-maile do jednego pliku; compress domyślnie wg rozszerzenia .gz
+
+        Przy kompresji to ona dominuje - compresslevel=1 jest wyraźnie szybszy niż 6
+        """
+        if compress is None:
+            compress = path.endswith(".gz")
+        separator = self.separator.encode("utf-8")
+        start, written, batches = time.perf_counter(), 0, 0
+        with (gzip.open(path, "wb", compresslevel=compresslevel) if compress else open(path, "wb")) as output:
+            for batches, batch in enumerate(self.iter_batches(batch_size), 1):
+                if batches > 1:
+                    output.write(separator)
+                    written += len(separator)
+                data = batch.encode("utf-8")
+                output.write(data)
+                written += len(data)
+        return self._stats(start, written, batches)
+
+    def _stats(self, start: float, written: int, batches: int) -> Dict[str, Any]:
+        seconds = time.perf_counter() - start
+        emails = len(self.recipients)
+        return {
+            "emails": emails,
+            "batches": batches,
+            "bytes": written,
+            "seconds": seconds,
+            "emails_per_min": emails / seconds * 60 if seconds else 0.0,
+        }
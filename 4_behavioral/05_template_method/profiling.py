@@ -0,0 +1,221 @@
+"""
+Template Method - profilowanie kroków szablonu per podklasa
+
+Nie wiadomo, który krok generate_document() jest wolny dla danej
+podklasy. enable() owija kroki (create_header, create_body,
+add_signature, create_footer) i sam generate_document we wszystkich
+podklasach DocumentGenerator - także definiowanych później:
+- mierzony jest czas (perf_counter_ns) i bajty (UTF-8) wyniku
+- statystyki sumowane per klasa instancji (type(self)) i krok
+- wywołanie przez super() tego samego kroku liczone jest raz
+disable() przywraca oryginalne funkcje - wyłączone profilowanie
+kosztuje dokładnie zero. Przełącznik dotyczy całego procesu;
+DOCUMENT_PROFILING=1 w środowisku włącza je przy imporcie modułu.
+
+>>> from starter import DocumentGenerator
+>>> class Memo(DocumentGenerator):
+...     def create_header(self): return f"MEMO {self.title}"
+...     def create_body(self): return "body"
+...     def create_footer(self): return "end"
+>>> with profiled():
+...     _ = [Memo(f"#{i}").generate_document() for i in range(3)]
+>>> step = stats()["Memo"]["create_header"]
+>>> step["calls"], step["bytes"]
+(3, 21)
+>>> reset()
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from starter import DocumentGenerator
+
+
+STEPS = ("create_header", "create_body", "add_signature", "create_footer")
+HOOKED = STEPS + ("generate_document",)
+
+_lock = threading.Lock()
+_local = threading.local()
+# Statystyki per wątek - gorąca ścieżka bez blokady; stats() je sumuje
+_threads: List["_ThreadStats"] = []
+# (klasa definiująca, krok) -> oryginalna funkcja
+_originals: Dict[Tuple[type, str], Callable] = {}
+_base_init_subclass = DocumentGenerator.__dict__.get("__init_subclass__")
+_enabled = False
+
+
+class _ThreadStats:
+    """Kroki w toku i liczniki jednego wątku"""
+
+    __slots__ = ("active", "entries")
+
+    def __init__(self):
+        self.active = set()
+        # (klasa instancji, krok) -> [wywołania, suma ns, maksimum ns, bajty]
+        self.entries: Dict[Tuple[type, str], List[int]] = {}
+
+
+def _thread_stats() -> _ThreadStats:
+    try:
+        return _local.stats
+    except AttributeError:
+        _local.stats = thread_stats = _ThreadStats()
+        with _lock:
+            _threads.append(thread_stats)
+        return thread_stats
+
+
+def _size(text: Any) -> int:
+    if not isinstance(text, str):
+        return 0
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _wrap(function: Callable, step: str) -> Callable:
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(function)
+    def profiled(self):
+        try:
+            thread_stats = _local.stats
+        except AttributeError:
+            thread_stats = _thread_stats()
+        active = thread_stats.active
+        if step in active:
+            # Wywołanie przez super() - liczy się tylko zewnętrzne
+            return function(self)
+        active.add(step)
+        start = perf_counter_ns()
+        try:
+            result = function(self)
+        finally:
+            elapsed = perf_counter_ns() - start
+            active.discard(step)
+        entries = thread_stats.entries
+        key = (self.__class__, step)
+        entry = entries.get(key)
+        if entry is None:
+            entry = entries[key] = [0, 0, 0, 0]
+        entry[0] += 1
+        entry[1] += elapsed
+        if elapsed > entry[2]:
+            entry[2] = elapsed
+        entry[3] += len(result) if result.__class__ is str and result.isascii() else _size(result)
+        return result
+
+    profiled.__profiled__ = True
+    return profiled
+
+
+def _instrument(cls: type) -> None:
+    for step in HOOKED:
+        function = cls.__dict__.get(step)
+        if callable(function) and not getattr(function, "__profiled__", False):
+            _originals[(cls, step)] = function
+            setattr(cls, step, _wrap(function, step))
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def _on_subclass(cls: type, **kwargs) -> None:
+    if _base_init_subclass is not None:
+        _base_init_subclass.__get__(None, cls)(**kwargs)
+    else:
+        super(DocumentGenerator, cls).__init_subclass__(**kwargs)
+    _instrument(cls)
+
+
+def enable() -> None:
+    """Włącz profilowanie w procesie - owija kroki istniejących i przyszłych podklas"""
+    global _enabled
+    with _lock:
+        if _enabled:
+            return
+        _enabled = True
+    for cls in [DocumentGenerator, *_subclasses(DocumentGenerator)]:
+        _instrument(cls)
+    DocumentGenerator.__init_subclass__ = classmethod(_on_subclass)
+
+
+def disable() -> None:
+    """Wyłącz profilowanie - przywraca oryginalne funkcje (statystyki zostają)"""
+    global _enabled
+    with _lock:
+        if not _enabled:
+            return
+        _enabled = False
+    if _base_init_subclass is not None:
+        DocumentGenerator.__init_subclass__ = _base_init_subclass
+    else:
+        del DocumentGenerator.__init_subclass__
+    for (cls, step), function in _originals.items():
+        setattr(cls, step, function)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def profiled() -> Iterator[None]:
+    """Profilowanie tylko w bloku with (jeśli nie było włączone wcześniej)"""
+    was_enabled = _enabled
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """{klasa: {krok: calls, total_ms, mean_us, max_us, bytes}} - posortowane po nazwie klasy"""
+    totals: Dict[Tuple[str, str], List[int]] = {}
+    with _lock:
+        for thread_stats in _threads:
+            for (cls, step), (calls, total_ns, max_ns, size) in list(thread_stats.entries.items()):
+                total = totals.setdefault((cls.__name__, step), [0, 0, 0, 0])
+                total[0] += calls
+                total[1] += total_ns
+                total[2] = max(total[2], max_ns)
+                total[3] += size
+    result: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for (name, step), (calls, total_ns, max_ns, size) in sorted(totals.items(), key=lambda item: item[0][0]):
+        result.setdefault(name, {})[step] = {
+            "calls": calls,
+            "total_ms": total_ns / 1e6,
+            "mean_us": total_ns / calls / 1e3,
+            "max_us": max_ns / 1e3,
+            "bytes": size,
+        }
+    return result
+
+
+def reset() -> None:
+    """Wyzeruj statystyki"""
+    with _lock:
+        for thread_stats in _threads:
+            thread_stats.entries.clear()
+
+
+def report() -> str:
+    """Tabela statystyk - kroki każdej klasy od najwolniejszego (suma czasu)"""
+    lines = [f"{'klasa':<24} {'krok':<18} {'wywołania':>10} {'suma ms':>10} {'śr. us':>8} {'max us':>8} {'bajty':>12}"]
+    for name, steps in stats().items():
+        for step, entry in sorted(steps.items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(f"{name:<24} {step:<18} {entry['calls']:>10} {entry['total_ms']:>10.2f} "
+                         f"{entry['mean_us']:>8.2f} {entry['max_us']:>8.1f} {entry['bytes']:>12}")
+    return "\n".join(lines)
+
+
+if os.environ.get("DOCUMENT_PROFILING") == "1":
+    enable()
@@ -0,0 +1,171 @@
+"""
+Template Method - cache sekcji dokumentu
+
+Nagłówek, podpis i stopka większości dokumentów zależą tylko od klasy
+i tytułu, a treść - od danych, które zmieniają się rzadko. CachedSections
+to mixin nakładany przed konkretną klasą generatora:
+- każdy krok (create_header, create_body, add_signature, create_footer)
+  pytany jest najpierw o klucz - section_key(step); None = bez cache
+- klucz wpisu to (klasa, krok, klucz kroku) - różne klasy nie dzielą wpisów
+- SectionCache to LRU ograniczone bajtami (sys.getsizeof tekstu)
+- invalidate() usuwa wpisy wg klasy / kroku / klucza, np. po zmianie danych treści
+Szablon generate_document() (i strumieniowy iter_chunks()) się nie zmienia -
+wywołuje te same kroki, które teraz trafiają do cache.
+
+>>> from starter import DocumentGenerator
+>>> class Memo(DocumentGenerator):
+...     def create_header(self): return f"MEMO {self.title}"
+...     def create_body(self): return "body"
+...     def create_footer(self): return "end"
+>>> class CachedMemo(CachedSections, Memo):
+...     section_cache = SectionCache(max_bytes=4096)
+>>> _ = CachedMemo("A").generate_document(), CachedMemo("A").generate_document()
+>>> stats = CachedMemo.section_cache.stats()
+>>> stats["hits"], stats["misses"]
+(3, 3)
+"""
+
+import sys
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from starter import DocumentGenerator
+
+
+STEPS = ("create_header", "create_body", "add_signature", "create_footer")
+
+
+class SectionCache:
+    """
+    LRU tekstów sekcji ograniczone łączną liczbą bajtów
+
+    Wpis większy niż max_bytes nie jest zapamiętywany
+    """
+
+    def __init__(self, max_bytes: int = 16 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[type, str, Hashable], Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.evictions = 0
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_render(self, cls: type, step: str, key: Hashable, render: Callable[[], str]) -> str:
+        """Tekst z cache albo render() zapisany do cache"""
+        entry_key = (cls, step, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                self._entries.move_to_end(entry_key)
+                self._hits[step] += 1
+                return entry[0]
+            self._misses[step] += 1
+        # Renderowanie poza blokadą - wolny krok nie blokuje innych wątków
+        text = render()
+        self._store(entry_key, text)
+        return text
+
+    def _store(self, entry_key: Tuple[type, str, Hashable], text: str) -> None:
+        size = sys.getsizeof(text)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(entry_key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[entry_key] = (text, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def invalidate(self, cls: Optional[type] = None, step: Optional[str] = None,
+                   key: Any = ...) -> int:
+        """
+        Usuń pasujące wpisy - zwraca ich liczbę
+
+        Pominięty argument pasuje do wszystkiego; cls obejmuje też podklasy
+        """
+        with self._lock:
+            matching = [entry_key for entry_key in self._entries
+                        if (cls is None or issubclass(entry_key[0], cls))
+                        and (step is None or entry_key[1] == step)
+                        and (key is ... or entry_key[2] == key)]
+            for entry_key in matching:
+                self.bytes -= self._entries.pop(entry_key)[1]
+        return len(matching)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Trafienia i chybienia (łącznie i per krok), rozmiar cache"""
+        with self._lock:
+            steps = {step: {"hits": self._hits[step], "misses": self._misses[step]}
+                     for step in dict.fromkeys([*STEPS, *self._hits, *self._misses])}
+            return {
+                "hits": sum(self._hits.values()),
+                "misses": sum(self._misses.values()),
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "steps": steps,
+            }
+
+
+class CachedSections(DocumentGenerator):
+    """
+    Mixin zapamiętujący sekcje - class CachedReport(CachedSections, ReportDocument)
+
+    Domyślnie nagłówek, podpis i stopka są kluczowane tytułem, a treść nie
+    jest zapamiętywana. Podklasa z treścią zależną od danych nadpisuje
+    body_key() - np. zwraca wersję danych; zmiana wersji = nowy wpis
+    """
+
+    section_cache = SectionCache()
+
+    def section_key(self, step: str) -> Optional[Hashable]:
+        """Klucz kroku (jego wejścia) - None wyłącza cache dla tego kroku"""
+        if step == "create_body":
+            return self.body_key()
+        return self.title
+
+    def body_key(self) -> Optional[Hashable]:
+        """Klucz treści - domyślnie None (treść renderowana za każdym razem)"""
+        return None
+
+    def _cached(self, step: str, render: Callable[[], str]) -> str:
+        key = self.section_key(step)
+        if key is None:
+            return render()
+        return self.section_cache.get_or_render(type(self), step, key, render)
+
+    def create_header(self) -> str:
+        return self._cached("create_header", super().create_header)
+
+    def create_body(self) -> str:
+        return self._cached("create_body", super().create_body)
+
+    def add_signature(self) -> str:
+        return self._cached("add_signature", super().add_signature)
+
+    def create_footer(self) -> str:
+        return self._cached("create_footer", super().create_footer)
+
+    def invalidate_sections(self, *steps: str) -> int:
+        """Usuń z cache sekcje tego dokumentu (domyślnie wszystkie) - zwraca liczbę wpisów"""
+        removed = 0
+        for step in steps or STEPS:
+            key = self.section_key(step)
+            if key is not None:
+                removed += self.section_cache.invalidate(type(self), step, key)
+        return removed
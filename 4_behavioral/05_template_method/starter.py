@@ -28,9 +28,17 @@ True
 >>> email = EmailDocument("Test")
 >>> email.add_signature()  # Email ma własną implementację
 'Best regards,\\nThe Team'
+
+>>> # Strumieniowanie do ujścia (GOTOWE) - ten sam tekst, bez składania w pamięci
+>>> import io
+>>> sink = io.StringIO()
+>>> written = email.generate_to(sink)
+>>> sink.getvalue() == email.generate_document(), written == len(sink.getvalue())
+(True, True)
 """
 
 from abc import ABC, abstractmethod
+from typing import IO, Iterator, Optional
 
 
 # Document Generator - CZĘŚCIOWO GOTOWE
@@ -82,6 +90,59 @@ class DocumentGenerator(ABC):
         """
         return ""  # Domyślnie brak podpisu
 
+    # Strumieniowanie - GOTOWE
+    # Ta sama kolejność kroków, ale sekcje płyną kawałkami prosto do ujścia
+    # (plik, socket, kompresor) - cały dokument nigdy nie leży w pamięci
+
+    SECTION_SEPARATOR = "\n\n"
+
+    def stream_header(self) -> Iterator[str]:
+        """Nagłówek kawałkami - domyślnie jeden kawałek z create_header()"""
+        yield self.create_header()
+
+    def stream_body(self) -> Iterator[str]:
+        """
+        Treść kawałkami - domyślnie jeden kawałek z create_body()
+
+        Subklasy z dużą treścią nadpisują tę metodę i yieldują np. wiersz po wierszu
+        """
+        yield self.create_body()
+
+    def stream_signature(self) -> Iterator[str]:
+        """Podpis kawałkami - domyślnie jeden kawałek z add_signature()"""
+        yield self.add_signature()
+
+    def stream_footer(self) -> Iterator[str]:
+        """Stopka kawałkami - domyślnie jeden kawałek z create_footer()"""
+        yield self.create_footer()
+
+    def iter_chunks(self) -> Iterator[str]:
+        """
+        TEMPLATE METHOD (strumieniowa) - header → body → signature → footer
+
+        "".join(iter_chunks()) daje ten sam tekst co generate_document()
+        """
+        sections = (self.stream_header, self.stream_body, self.stream_signature, self.stream_footer)
+        for index, section in enumerate(sections):
+            if index:
+                yield self.SECTION_SEPARATOR
+            for chunk in section():
+                if chunk:
+                    yield chunk
+
+    def generate_to(self, sink: IO, encoding: Optional[str] = None) -> int:
+        """
+        Zapisz dokument do ujścia z metodą write() - zwraca liczbę zapisanych znaków
+
+        encoding - dla ujść binarnych (socket.makefile("wb"), gzip.open(..., "wb"))
+        """
+        written = 0
+        write = sink.write
+        for chunk in self.iter_chunks():
+            write(chunk.encode(encoding) if encoding else chunk)
+            written += len(chunk)
+        return written
+
 
 # Concrete Generators - DO IMPLEMENTACJI
 # WZORZEC: Konkretne implementacje primitive operations
@@ -0,0 +1,36 @@
+"""
+Dokumenty pomocnicze współdzielone przez testy rozszerzeń (test_*.py)
+"""
+
+from starter import DocumentGenerator
+
+
+class LedgerReport(DocumentGenerator):
+    """Dokument testowy z dużą treścią strumieniowaną wiersz po wierszu"""
+
+    def __init__(self, title: str, rows: int):
+        super().__init__(title)
+        self.rows = rows
+
+    def create_header(self):
+        return f"LEDGER: {self.title}"
+
+    def create_body(self):
+        return "".join(self.stream_body())
+
+    def stream_body(self):
+        for index in range(self.rows):
+            yield f"{index:08d} | entry for {self.title} | {index * 3.5:12.2f}\n"
+
+    def create_footer(self):
+        return "End of Ledger"
+
+
+class EmptyDocument:
+    """Generator renderujący pusty dokument (separatory w render_bulk)"""
+
+    def __init__(self, title: str):
+        self.title = title
+
+    def generate_document(self):
+        return ""
@@ -0,0 +1,95 @@
+"""
+Testy dla Template Method Pattern - szablon asynchroniczny (async_document.py)
+"""
+
+import asyncio
+import time
+import pytest
+from starter import ReportDocument, EmailDocument
+from async_document import AsyncDocumentGenerator, generate_many_async
+
+
+class SlowSectionsDocument(AsyncDocumentGenerator):
+    """Dokument testowy - każda sekcja czeka delays[krok] sekund"""
+
+    def __init__(self, title: str, delays: dict, fail: str = ""):
+        super().__init__(title)
+        self.delays = delays
+        self.fail = fail
+        self.finished = []
+
+    async def _section(self, step, text):
+        await asyncio.sleep(self.delays.get(step, 0))
+        if step == self.fail:
+            raise IOError(f"{step} source unavailable")
+        self.finished.append(step)
+        return text
+
+    async def create_header(self):
+        return await self._section("header", f"HEADER {self.title}")
+
+    async def create_body(self):
+        return await self._section("body", "BODY")
+
+    def create_footer(self):
+        return "FOOTER"
+
+
+class TestAsyncDocumentGenerator:
+    """Testy asynchronicznego template method (generate_document_async)"""
+
+    def test_same_output_as_sync_template(self):
+        """Test że synchroniczne kroki dają ten sam tekst co generate_document()"""
+        for base in (ReportDocument, EmailDocument):
+            async_class = type(f"Async{base.__name__}", (AsyncDocumentGenerator, base), {})
+            assert asyncio.run(async_class("Q4").generate_document_async()) == base("Q4").generate_document()
+
+    def test_sections_run_concurrently_in_order(self):
+        """Test że czas to maksimum sekcji, a kolejność zostaje mimo innej kolejności ukończenia"""
+        document = SlowSectionsDocument("Q4", {"header": 0.15, "body": 0.05})
+        start = time.perf_counter()
+        text = asyncio.run(document.generate_document_async())
+        elapsed = time.perf_counter() - start
+
+        assert text == "HEADER Q4\n\nBODY\n\n\n\nFOOTER"
+        assert document.finished == ["body", "header"]
+        assert elapsed < 0.19
+
+    def test_failure_cancels_other_sections(self):
+        """Test że błąd sekcji jest rzucany, a pozostałe sekcje zostają anulowane"""
+        document = SlowSectionsDocument("Q4", {"header": 0.2, "body": 0.01}, fail="body")
+
+        with pytest.raises(IOError, match="body source unavailable"):
+            asyncio.run(document.generate_document_async())
+        assert document.finished == []
+
+    def test_blocking_sync_steps_offloaded_to_threads(self):
+        """Test offload_sync_steps - blokujące kroki synchroniczne nie blokują się nawzajem"""
+
+        class BlockingDocument(AsyncDocumentGenerator):
+            offload_sync_steps = True
+
+            def create_header(self):
+                time.sleep(0.1)
+                return "H"
+
+            def create_body(self):
+                time.sleep(0.1)
+                return "B"
+
+            def create_footer(self):
+                time.sleep(0.1)
+                return "F"
+
+        start = time.perf_counter()
+        text = asyncio.run(BlockingDocument("x").generate_document_async())
+
+        assert text == "H\n\nB\n\n\n\nF"
+        assert time.perf_counter() - start < 0.25
+
+    def test_generate_many_keeps_input_order(self):
+        """Test generowania wielu dokumentów z limitem współbieżności"""
+        documents = [SlowSectionsDocument(f"D{index}", {"body": 0.03 - index * 0.005}) for index in range(5)]
+        texts = asyncio.run(generate_many_async(documents, max_concurrency=2))
+
+        assert [text.split("\n")[0] for text in texts] == [f"HEADER D{index}" for index in range(5)]
@@ -0,0 +1,68 @@
+"""
+Testy dla Template Method Pattern - masowe generowanie (bulk.py)
+"""
+
+from starter import ReportDocument, EmailDocument
+from bulk import DEFAULT_SEPARATOR, render_bulk
+from support import EmptyDocument, LedgerReport
+
+
+class TestBulkGeneration:
+    """Testy masowego generowania w puli procesów (render_bulk)"""
+
+    def specs(self, count):
+        return [(ReportDocument if index % 2 else EmailDocument, f"Doc {index}") for index in range(count)]
+
+    def test_single_file_keeps_input_order(self, tmp_path):
+        """Test że plik wynikowy zawiera dokumenty w kolejności wejścia"""
+        path = tmp_path / "documents.txt"
+        specs = self.specs(50)
+        stats = render_bulk(specs, str(path), processes=2, chunk_size=7)
+
+        expected = [document_class(title).generate_document() for document_class, title in specs]
+        assert path.read_text(encoding="utf-8").split(DEFAULT_SEPARATOR) == expected
+        assert stats["documents"] == 50
+        assert stats["bytes"] == path.stat().st_size
+
+    def test_directory_one_file_per_document(self, tmp_path):
+        """Test trybu katalogu - plik na dokument, numerowany wg pozycji na wejściu"""
+        stats = render_bulk(iter(self.specs(10)), str(tmp_path), processes=2, chunk_size=3)
+
+        names = sorted(path.name for path in tmp_path.iterdir())
+        assert names == [f"{index:08d}.txt" for index in range(10)]
+        assert (tmp_path / "00000003.txt").read_text(encoding="utf-8") == ReportDocument("Doc 3").generate_document()
+        assert stats["bytes"] == sum(path.stat().st_size for path in tmp_path.iterdir())
+
+    def test_custom_generator_with_arguments(self, tmp_path):
+        """Test specyfikacji z dodatkowymi argumentami konstruktora"""
+        path = tmp_path / "ledgers.txt"
+        render_bulk([(LedgerReport, "A", 2), (LedgerReport, "B", 3)], str(path),
+                    processes=1, separator="\n--\n")
+
+        first, second = path.read_text(encoding="utf-8").split("\n--\n")
+        assert first == LedgerReport("A", 2).generate_document()
+        assert second.count("entry for B") == 3
+
+    def test_empty_first_document_keeps_separator(self, tmp_path):
+        """Test że pusty pierwszy dokument nie gubi separatora przed kolejną paczką"""
+        path = tmp_path / "documents.txt"
+        stats = render_bulk([(EmptyDocument, "A"), (EmptyDocument, "B"), (ReportDocument, "C")],
+                            str(path), processes=1, chunk_size=1, separator="\n--\n")
+
+        assert path.read_text(encoding="utf-8").split("\n--\n") == ["", "", ReportDocument("C").generate_document()]
+        assert stats["bytes"] == path.stat().st_size
+
+    def test_bounded_pending_chunks(self, tmp_path):
+        """Test że przy max_pending=1 wynik jest ten sam (paczki wysyłane pojedynczo)"""
+        bounded, unbounded = tmp_path / "bounded.txt", tmp_path / "unbounded.txt"
+        render_bulk(self.specs(40), str(bounded), processes=2, chunk_size=4, max_pending=1)
+        render_bulk(self.specs(40), str(unbounded), processes=2, chunk_size=4, max_pending=100)
+
+        assert bounded.read_bytes() == unbounded.read_bytes()
+
+    def test_empty_input(self, tmp_path):
+        """Test pustego wejścia"""
+        path = tmp_path / "empty.txt"
+        stats = render_bulk([], str(path))
+
+        assert stats["documents"] == 0 and path.read_text() == ""
@@ -0,0 +1,90 @@
+"""
+Testy dla Template Method Pattern - szablon kompilowany (compiled.py)
+"""
+
+from starter import ReportDocument, EmailDocument
+from compiled import CompiledDocument
+
+
+class TestCompiledDocument:
+    """Testy szablonu kompilowanego w __init_subclass__ (CompiledDocument)"""
+
+    def test_same_output_as_template_method(self):
+        """Test że skompilowany szablon daje ten sam tekst co zwykły generate_document()"""
+        for base in (ReportDocument, EmailDocument):
+            compiled = type(f"Compiled{base.__name__}", (CompiledDocument, base), {})
+            for title in ["Q4 Sales", "", "{0} %s \n\n", "Zażółć"]:
+                assert compiled(title).generate_document() == base(title).generate_document()
+
+    def test_static_and_title_steps_precomputed(self):
+        """Test klasyfikacji kroków - dokument bez kroków dynamicznych to jedno join"""
+        compiled = type("CompiledEmail", (CompiledDocument, EmailDocument), {})
+
+        assert compiled.compiled_steps == {"create_header": "title", "create_body": "title",
+                                           "add_signature": "static", "create_footer": "static"}
+        assert "self.title.join(PIECES)" in compiled.generate_document.__doc__
+
+    def test_instance_state_steps_stay_dynamic(self):
+        """Test że kroki zależne od innych atrybutów lub przekształcające tytuł są wołane w locie"""
+
+        class Invoice(CompiledDocument):
+            def __init__(self, title, amount):
+                super().__init__(title)
+                self.amount = amount
+
+            def create_header(self):
+                return f"INVOICE {self.title.upper()}"
+
+            def create_body(self):
+                return f"Amount: {self.amount}"
+
+            def create_footer(self):
+                return "Thank you"
+
+        assert Invoice.compiled_steps["create_header"] == "dynamic"
+        assert Invoice.compiled_steps["create_body"] == "dynamic"
+        assert Invoice("acme", 10).generate_document() == "INVOICE ACME\n\nAmount: 10\n\n\n\nThank you"
+
+    def test_forced_dynamic_and_recompiled_subclass(self):
+        """Test dynamic_steps i ponownej kompilacji podklasy nadpisującej krok"""
+
+        class Counter(CompiledDocument):
+            dynamic_steps = frozenset({"create_body"})
+            calls = 0
+
+            def create_header(self):
+                return self.title
+
+            def create_body(self):
+                type(self).calls += 1
+                return str(type(self).calls)
+
+            def create_footer(self):
+                return "end"
+
+        class SignedCounter(Counter):
+            def add_signature(self):
+                return f"signed: {self.title}"
+
+        assert Counter("a").generate_document() != Counter("a").generate_document()
+        assert SignedCounter.compiled_steps["add_signature"] == "title"
+        assert "signed: b" in SignedCounter("b").generate_document()
+
+    def test_abstract_intermediate_class_not_compiled(self):
+        """Test że klasa pośrednia z krokami abstrakcyjnymi nie jest kompilowana"""
+
+        class Partial(CompiledDocument):
+            def create_header(self):
+                return f"HEADER {self.title}"
+
+        class Complete(Partial):
+            def create_body(self):
+                return "body"
+
+            def create_footer(self):
+                return "end"
+
+        assert "generate_document" not in Partial.__dict__
+        assert Partial.compiled_steps == {}
+        assert Complete.compiled_steps["create_header"] == "title"
+        assert Complete("x").generate_document() == "HEADER x\n\nbody\n\n\n\nend"
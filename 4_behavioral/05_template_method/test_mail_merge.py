@@ -0,0 +1,165 @@
+"""
+Testy dla Template Method Pattern - korespondencja seryjna (mail_merge.py)
+"""
+
+import gzip
+import pytest
+from starter import DocumentGenerator, EmailDocument
+from mail_merge import STEPS as MERGE_STEPS, MailMerge, RecipientTable
+
+
+class PersonalEmail(DocumentGenerator):
+    """Dokument testowy z kolumnami name/title/plan i jednym krokiem nieszablonowym"""
+
+    def create_header(self):
+        return f"To: {self.name}\nSubject: {self.title}"
+
+    def create_body(self):
+        return f"Dear {self.name},\n\nyour {self.plan} plan renews soon."
+
+    def add_signature(self):
+        return f"-- {self.plan.upper()} TEAM"
+
+    def create_footer(self):
+        return "Unsubscribe: example.com/u"
+
+
+class VipEmail(DocumentGenerator):
+    """Dokument testowy z warunkiem na wartości kolumny"""
+
+    def create_header(self):
+        return f"To: {self.name}"
+
+    def create_body(self):
+        return f"Hi {self.name}" + (" -- VIP 50% off" if self.vip == "yes" else "")
+
+    def create_footer(self):
+        return "Bye"
+
+
+class TestMailMerge:
+    """Testy korespondencji seryjnej (MailMerge / RecipientTable)"""
+
+    RECIPIENTS = {"name": ["Ann", "Bob", "Cy"], "title": ["Renewal", "Renewal", "Last call"],
+                  "plan": ["basic", "pro", "team"]}
+
+    def expected(self, index):
+        document = object.__new__(PersonalEmail)
+        for name, values in self.RECIPIENTS.items():
+            setattr(document, name, values[index])
+        return DocumentGenerator.SECTION_SEPARATOR.join(
+            [document.create_header(), document.create_body(), document.add_signature(), document.create_footer()])
+
+    def test_email_document_matches_generate_document(self):
+        """Test że mail merge dla EmailDocument daje to samo co EmailDocument(subject)"""
+        subjects = ["Meeting", "Invoice {0} %s", "Zażółć"]
+        merge = MailMerge(EmailDocument, {"title": subjects}, template_steps=MERGE_STEPS)
+
+        assert list(merge) == [EmailDocument(subject).generate_document() for subject in subjects]
+        assert merge.compiled_steps["create_header"] == "template"
+        assert merge.compiled_steps["create_footer"] == "static"
+
+    def test_columns_personalise_and_dynamic_fallback(self):
+        """Test kolumn jako atrybutów i kroku przekształcającego wartość (dynamic)"""
+        merge = MailMerge(PersonalEmail, self.RECIPIENTS, template_steps=MERGE_STEPS)
+
+        assert merge.compiled_steps["add_signature"] == "dynamic"
+        assert [merge.render(index) for index in range(3)] == [self.expected(index) for index in range(3)]
+
+    def test_steps_dynamic_unless_opted_in(self):
+        """Test że bez template_steps kroki czytające kolumny są wołane per odbiorca, a stałe liczone raz"""
+        merge = MailMerge(PersonalEmail, self.RECIPIENTS)
+
+        assert merge.compiled_steps == {"create_header": "dynamic", "create_body": "dynamic",
+                                        "add_signature": "dynamic", "create_footer": "static"}
+        assert list(merge) == [self.expected(index) for index in range(3)]
+
+    def test_one_document_per_recipient_shared_by_steps(self):
+        """Test że kroki dynamiczne jednego odbiorcy dostają ten sam dokument"""
+        seen = []
+
+        class Tracked(PersonalEmail):
+            def create_header(self):
+                seen.append(id(self))
+                return super().create_header()
+
+            def create_body(self):
+                seen.append(id(self))
+                return super().create_body()
+
+        merge = MailMerge(Tracked, self.RECIPIENTS)
+        seen.clear()
+        emails = [merge.render(index) for index in range(3)]
+
+        assert emails == [self.expected(index) for index in range(3)]
+        assert seen[0] == seen[1] and seen[2] == seen[3]
+        assert len(seen) == 6
+
+    def test_step_reading_column_is_never_static(self):
+        """Test że krok czytający kolumnę nie jest liczony raz, nawet gdy na próbach daje ten sam tekst"""
+
+        class Perk(VipEmail):
+            def add_signature(self):
+                return "P.S. Free shipping" if getattr(self, "vip", "no") == "yes" else ""
+
+        recipients = {"name": ["Ann", "Bob"], "vip": ["no", "yes"]}
+        merge = MailMerge(Perk, recipients)
+
+        assert merge.compiled_steps["add_signature"] == "dynamic"
+        assert merge.compiled_steps["create_footer"] == "static"
+        assert "P.S. Free shipping" not in merge.render(0)
+        assert "P.S. Free shipping" in merge.render(1)
+
+    def test_conditional_column_is_not_corrupted(self):
+        """Test kroku z warunkiem na kolumnie - domyślnie poprawnie, po włączeniu szablonu verify() wykrywa błąd"""
+        recipients = {"name": ["Ann", "Bob", "Cy"], "vip": ["no", "yes", "no"]}
+        expected = [object.__new__(VipEmail) for _ in range(3)]
+        for index, document in enumerate(expected):
+            document.name, document.vip = recipients["name"][index], recipients["vip"][index]
+
+        merge = MailMerge(VipEmail, recipients)
+        assert merge.render(1) == "To: Bob\n\nHi Bob -- VIP 50% off\n\n\n\nBye"
+        merge.verify()
+
+        templated = MailMerge(VipEmail, recipients, template_steps=MERGE_STEPS)
+        assert templated.compiled_steps["create_body"] == "template"
+        with pytest.raises(ValueError, match="Recipient 1: step create_body"):
+            templated.verify()
+
+    def test_unknown_template_step_rejected(self):
+        """Test walidacji nazw kroków w template_steps"""
+        with pytest.raises(ValueError):
+            MailMerge(PersonalEmail, self.RECIPIENTS, template_steps=["create_bdy"])
+
+    def test_batches_bound_memory_and_keep_order(self, tmp_path):
+        """Test plików na paczkę - kolejność odbiorców i liczba paczek"""
+        recipients = RecipientTable({"title": [f"Subject {index}" for index in range(25)]})
+        stats = MailMerge(EmailDocument, recipients, separator="\n#\n",
+                          template_steps=MERGE_STEPS).write_batches(str(tmp_path), batch_size=10)
+
+        files = sorted(tmp_path.iterdir())
+        assert [path.name for path in files] == ["batch_00000.txt", "batch_00001.txt", "batch_00002.txt"]
+        emails = "\n#\n".join(path.read_text(encoding="utf-8") for path in files).split("\n#\n")
+        assert emails == [EmailDocument(f"Subject {index}").generate_document() for index in range(25)]
+        assert stats["emails"] == 25 and stats["batches"] == 3
+
+    def test_single_compressed_stream(self, tmp_path):
+        """Test jednego strumienia .gz"""
+        path = tmp_path / "emails.txt.gz"
+        merge = MailMerge(PersonalEmail, self.RECIPIENTS)
+        stats = merge.write_stream(str(path), batch_size=2)
+
+        text = gzip.decompress(path.read_bytes()).decode("utf-8")
+        assert text == merge.separator.join(self.expected(index) for index in range(3))
+        assert stats["bytes"] == len(text.encode("utf-8"))
+
+    def test_recipient_table_sources(self, tmp_path):
+        """Test budowania tabeli z wierszy i CSV oraz walidacji kolumn"""
+        path = tmp_path / "recipients.csv"
+        path.write_text("name,title,plan\nAnn,Renewal,basic\nBob,Renewal,pro\n", encoding="utf-8")
+        table = RecipientTable.from_csv(str(path))
+
+        assert len(table) == 2 and table.row(1) == {"name": "Bob", "title": "Renewal", "plan": "pro"}
+        assert RecipientTable.from_rows([table.row(0), table.row(1)]).columns == table.columns
+        with pytest.raises(ValueError):
+            RecipientTable({"name": ["Ann"], "title": []})
@@ -0,0 +1,83 @@
+"""
+Testy dla Template Method Pattern - profilowanie kroków (profiling.py)
+"""
+
+import time
+import pytest
+from starter import DocumentGenerator, ReportDocument, EmailDocument
+import profiling
+
+
+class TestProfiling:
+    """Testy profilowania kroków template method (profiling)"""
+
+    @pytest.fixture(autouse=True)
+    def clean_profiler(self):
+        profiling.reset()
+        yield
+        profiling.disable()
+        profiling.reset()
+
+    def test_steps_aggregated_per_subclass(self):
+        """Test czasu, wywołań i bajtów per klasa i krok"""
+        with profiling.profiled():
+            for index in range(4):
+                ReportDocument(f"R{index}").generate_document()
+            EmailDocument("Zażółć").generate_document()
+        stats = profiling.stats()
+
+        report = stats["ReportDocument"]
+        assert set(report) == {"create_header", "create_body", "add_signature", "create_footer", "generate_document"}
+        assert report["create_header"]["calls"] == 4
+        assert report["add_signature"]["bytes"] == 0
+        assert report["generate_document"]["total_ms"] >= report["create_body"]["total_ms"]
+        email = EmailDocument("Zażółć")
+        assert stats["EmailDocument"]["create_header"]["bytes"] == len(email.create_header().encode("utf-8"))
+
+    def test_disable_restores_original_functions(self):
+        """Test że wyłączone profilowanie nie zostawia żadnych owinięć"""
+        original = ReportDocument.__dict__["create_header"]
+        profiling.enable()
+        assert ReportDocument.__dict__["create_header"] is not original
+        profiling.disable()
+
+        assert ReportDocument.__dict__["create_header"] is original
+        assert "__init_subclass__" not in DocumentGenerator.__dict__
+        ReportDocument("Q4").generate_document()
+        assert profiling.stats() == {}
+
+    def test_subclass_defined_while_enabled_and_super_counted_once(self):
+        """Test nowej podklasy (w tym z super()) - krok liczony raz per wywołanie"""
+        with profiling.profiled():
+            class ShoutingReport(ReportDocument):
+                def create_header(self):
+                    return super().create_header().upper()
+
+            ShoutingReport("Q4").generate_document()
+            ShoutingReport("Q4").generate_document()
+        stats = profiling.stats()
+
+        assert stats["ShoutingReport"]["create_header"]["calls"] == 2
+        assert "ReportDocument" not in stats
+        assert not getattr(ShoutingReport.__dict__["create_header"], "__profiled__", False)
+
+    def test_report_lists_slowest_step_first(self):
+        """Test tabeli raportu - najwolniejszy krok klasy na górze"""
+
+        class SlowBody(DocumentGenerator):
+            def create_header(self):
+                return "H"
+
+            def create_body(self):
+                time.sleep(0.01)
+                return "B"
+
+            def create_footer(self):
+                return "F"
+
+        with profiling.profiled():
+            SlowBody("x").generate_document()
+        lines = [line for line in profiling.report().splitlines() if line.startswith("SlowBody")]
+
+        assert lines[0].split()[1] == "generate_document"
+        assert lines[1].split()[1] == "create_body"
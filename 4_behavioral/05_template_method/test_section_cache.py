@@ -0,0 +1,99 @@
+"""
+Testy dla Template Method Pattern - cache sekcji (section_cache.py)
+"""
+
+import pytest
+from starter import DocumentGenerator
+from section_cache import CachedSections, SectionCache
+
+
+class VersionedReport(DocumentGenerator):
+    """Dokument testowy liczący wywołania kroków - treść zależy od wersji danych"""
+
+    def __init__(self, title: str, version: int = 1):
+        super().__init__(title)
+        self.version = version
+        self.calls = []
+
+    def create_header(self):
+        self.calls.append("header")
+        return f"HEADER {self.title}"
+
+    def create_body(self):
+        self.calls.append("body")
+        return f"data v{self.version}"
+
+    def create_footer(self):
+        self.calls.append("footer")
+        return "FOOTER"
+
+
+class CachedVersionedReport(CachedSections, VersionedReport):
+    def body_key(self):
+        return self.version
+
+
+class TestSectionCache:
+    """Testy cache sekcji (CachedSections / SectionCache)"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        CachedVersionedReport.section_cache = SectionCache(max_bytes=64 * 1024)
+
+    def test_same_output_as_uncached(self):
+        """Test że cache nie zmienia wyniku template method"""
+        cached = CachedVersionedReport("Q4").generate_document()
+        assert cached == VersionedReport("Q4").generate_document()
+        assert CachedVersionedReport("Q4").generate_document() == cached
+
+    def test_changed_body_reuses_other_sections(self):
+        """Test że przy nowej wersji danych renderowana jest tylko treść"""
+        CachedVersionedReport("Q4", version=1).generate_document()
+        document = CachedVersionedReport("Q4", version=2)
+        text = document.generate_document()
+
+        assert document.calls == ["body"]
+        assert "data v2" in text and "HEADER Q4" in text
+
+    def test_hit_miss_stats_per_step(self):
+        """Test statystyk trafień i chybień"""
+        for version in (1, 1, 2):
+            CachedVersionedReport("Q4", version).generate_document()
+        stats = CachedVersionedReport.section_cache.stats()
+
+        assert stats["steps"]["create_header"] == {"hits": 2, "misses": 1}
+        assert stats["steps"]["create_body"] == {"hits": 1, "misses": 2}
+        assert stats["entries"] == 5
+
+    def test_explicit_invalidation(self):
+        """Test jawnego unieważnienia - kolejne generowanie renderuje sekcje od nowa"""
+        CachedVersionedReport("Q4").generate_document()
+        assert CachedVersionedReport("Q4").invalidate_sections("create_header") == 1
+
+        document = CachedVersionedReport("Q4")
+        document.generate_document()
+        assert document.calls == ["header"]
+        assert CachedVersionedReport.section_cache.invalidate(CachedVersionedReport) == 4
+
+    def test_lru_bounded_by_bytes(self):
+        """Test że rozmiar cache nie przekracza limitu i wypadają najdawniej używane wpisy"""
+        cache = CachedVersionedReport.section_cache = SectionCache(max_bytes=2000)
+        for index in range(100):
+            CachedVersionedReport(f"Report {index}").generate_document()
+        stats = cache.stats()
+
+        assert stats["bytes"] <= 2000 and stats["evictions"] > 0
+        document = CachedVersionedReport("Report 99")
+        document.generate_document()
+        assert document.calls == []
+
+    def test_body_not_cached_by_default(self):
+        """Test że bez body_key() treść jest renderowana za każdym razem"""
+
+        class CachedHeaderOnly(CachedSections, VersionedReport):
+            section_cache = SectionCache()
+
+        CachedHeaderOnly("Q4").generate_document()
+        document = CachedHeaderOnly("Q4")
+        document.generate_document()
+        assert document.calls == ["body"]
@@ -0,0 +1,59 @@
+"""
+Testy dla Template Method Pattern - strumieniowe generate_to() / iter_chunks()
+"""
+
+import gzip
+import io
+import tracemalloc
+from starter import DocumentGenerator, ReportDocument, EmailDocument
+from support import LedgerReport
+
+
+class TestStreaming:
+    """Testy strumieniowego template method (generate_to / iter_chunks)"""
+
+    def test_stream_matches_generate_document(self):
+        """Test że strumień daje dokładnie ten sam tekst co generate_document()"""
+        for document in [ReportDocument("Q4 Sales"), EmailDocument("Meeting"), LedgerReport("Ledger", 5)]:
+            sink = io.StringIO()
+            written = document.generate_to(sink)
+
+            assert sink.getvalue() == document.generate_document()
+            assert written == len(sink.getvalue())
+
+    def test_sections_in_order_with_separators(self):
+        """Test kolejności sekcji: header → body → signature → footer"""
+        chunks = list(EmailDocument("Meeting").iter_chunks())
+        text = "".join(chunks)
+
+        assert text.index("Subject") < text.index("Dear") < text.index("Best regards") < text.index("automated")
+        assert chunks.count(DocumentGenerator.SECTION_SEPARATOR) == 3
+
+    def test_binary_compressed_sink(self, tmp_path):
+        """Test zapisu do kompresora (ujście binarne)"""
+        path = tmp_path / "ledger.txt.gz"
+        document = LedgerReport("Ledger", 1000)
+        with gzip.open(path, "wb") as sink:
+            document.generate_to(sink, encoding="utf-8")
+
+        assert gzip.decompress(path.read_bytes()).decode("utf-8") == document.generate_document()
+
+    def test_document_never_held_in_memory(self):
+        """Test że szczyt pamięci przy strumieniowaniu jest dużo mniejszy niż dokument"""
+
+        class NullSink:
+            def __init__(self):
+                self.size = 0
+
+            def write(self, chunk):
+                self.size += len(chunk)
+
+        document = LedgerReport("Ledger", 50_000)  # ~2.5 MB tekstu
+        sink = NullSink()
+        tracemalloc.start()
+        document.generate_to(sink)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert sink.size > 2_000_000
+        assert peak < sink.size / 20
@@ -0,0 +1,89 @@
+"""
+Benchmark - koszt protokołu iteratora
+
+Porównuje trzy sposoby przejścia przez BookCollection:
+- explicit:  BookIterator z has_next()/next() (dwa wywołania metod na element)
+- native:    for book in collection (natywny iterator Pythona, __iter__)
+- batched:   BookIterator.next_batch(n) (jedno wywołanie na paczkę)
+
+Uruchomienie (po zaimplementowaniu BookIterator):
+    python benchmark.py
+    python benchmark.py --sizes 1000 100000 --batch 256 --repeat 5
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from starter import Book, BookCollection
+
+
+def build_collection(size: int) -> BookCollection:
+    """Kolekcja z size książkami"""
+    collection = BookCollection()
+    for i in range(size):
+        collection.add_book(Book(f"Book {i}", f"Author {i % 100}", 1900 + i % 120))
+    return collection
+
+
+def run_explicit(collection: BookCollection, batch_size: int) -> int:
+    count = 0
+    iterator = collection.create_iterator()
+    while iterator.has_next():
+        iterator.next()
+        count += 1
+    return count
+
+
+def run_native(collection: BookCollection, batch_size: int) -> int:
+    count = 0
+    for _ in collection:
+        count += 1
+    return count
+
+
+def run_batched(collection: BookCollection, batch_size: int) -> int:
+    count = 0
+    iterator = collection.create_iterator()
+    batch = iterator.next_batch(batch_size)
+    while batch:
+        for _ in batch:
+            count += 1
+        batch = iterator.next_batch(batch_size)
+    return count
+
+
+VARIANTS: Dict[str, Callable[[BookCollection, int], int]] = {
+    "explicit": run_explicit,
+    "native": run_native,
+    "batched": run_batched,
+}
+
+
+def measure(collection: BookCollection, variant: str, batch_size: int, repeat: int) -> float:
+    """Najlepszy czas (s) z repeat przebiegów"""
+    run = VARIANTS[variant]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(collection, batch_size)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark iteracji po BookCollection")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--batch", type=int, default=1024, help="rozmiar paczki dla next_batch()")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'size':>10} | " + " | ".join(f"{name + ' ns/el':>16}" for name in VARIANTS))
+    for size in args.sizes:
+        collection = build_collection(size)
+        timings = [measure(collection, name, args.batch, args.repeat) for name in VARIANTS]
+        print(f"{size:>10} | " + " | ".join(f"{t / size * 1e9:>16.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -33,10 +33,27 @@ True
 <Book: "Only One" by Solo (2020)>
 >>> iterator.has_next()
 False
+
+>>> # Test wyszukiwania przez indeks odwrócony
+>>> collection = BookCollection(indexed=True)
+>>> collection.add_book(Book("Animal Farm", "George Orwell", 1945))
+>>> collection.add_book(Book("Brave New World", "Aldous Huxley", 1932))
+>>> collection.add_book(Book("1984", "George Orwell", 1949))
+>>> results = collection.search_iterator("george orwell")
+>>> while results.has_next():
+...     print(results.next())
+"Animal Farm" by George Orwell (1945)
+"1984" by George Orwell (1949)
+>>> results = collection.search_iterator("1984 OR huxley")
+>>> results.next().title
+'Brave New World'
 """
 
+import heapq
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator as PyIterator, List, Optional
 
 
 # Book Class - GOTOWE
@@ -73,6 +90,18 @@ class Iterator(ABC):
         """Zwróć następny element i przesuń wskaźnik"""
         pass
 
+    def next_batch(self, n: int) -> list:
+        """
+        Zwróć do n kolejnych elementów (pusta lista gdy koniec)
+
+        Domyślnie przez has_next()/next() - konkretny iterator może
+        nadpisać szybszą wersją
+        """
+        batch = []
+        while len(batch) < n and self.has_next():
+            batch.append(self.next())
+        return batch
+
 
 # Concrete Iterator - DO IMPLEMENTACJI
 # WZORZEC: Konkretny iterator enkapsulujący sposób przechodzenia przez kolekcję
@@ -88,9 +117,121 @@ class Iterator(ABC):
 # - has_next() -> bool - sprawdź czy self.index < len(self.books)
 # - next() -> Book - zwróć self.books[self.index], zwiększ self.index o 1
 #   (przed zwróceniem sprawdź has_next(), jeśli False - raise StopIteration)
+#
+# next_batch() jest GOTOWE - korzysta z self.books i self.index opisanych wyżej
 
 class BookIterator:
-    pass
+
+    def next_batch(self, n: int) -> List[Book]:
+        """Szybka ścieżka: jeden slice zamiast n wywołań has_next()/next()"""
+        batch = self.books[self.index:self.index + n]
+        self.index += len(batch)
+        return batch
+
+
+# Inverted Index - GOTOWE
+# Indeks odwrócony: token -> posortowana lista id książek (posting list)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Podziel tekst na tokeny (małe litery, same słowa)"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Indeks odwrócony po tytułach i autorach
+
+    KLUCZOWE: id książki to jej pozycja w kolekcji, więc rośnie monotonicznie -
+    dopisywanie na koniec utrzymuje posting listy posortowane bez sortowania
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = {}
+
+    def add(self, book_id: int, book: Book) -> None:
+        """Dodaj książkę do indeksu"""
+        for token in set(tokenize(book.title) + tokenize(book.author)):
+            self._postings.setdefault(token, []).append(book_id)
+
+    def postings(self, token: str) -> List[int]:
+        """Zwróć posting listę tokenu (pusta lista gdy brak)"""
+        return self._postings.get(token, [])
+
+
+def _intersect(postings: List[List[int]]) -> PyIterator[int]:
+    """
+    Leniwe przecięcie posortowanych posting list
+
+    Prowadzi najkrótsza lista, w pozostałych skaczemy bisekcją od ostatniej
+    pozycji - koszt zależy od najrzadszego tokenu, nie od rozmiaru kolekcji
+    """
+    if not postings:
+        return
+    lead, *rest = sorted(postings, key=len)
+    positions = [0] * len(rest)
+    for book_id in lead:
+        for i, plist in enumerate(rest):
+            pos = bisect_left(plist, book_id, positions[i])
+            if pos == len(plist):
+                return
+            positions[i] = pos
+            if plist[pos] != book_id:
+                break
+        else:
+            yield book_id
+
+
+def _union(streams: Iterable[PyIterator[int]]) -> PyIterator[int]:
+    """Leniwa suma posortowanych strumieni id (bez duplikatów)"""
+    last = None
+    for book_id in heapq.merge(*streams):
+        if book_id != last:
+            yield book_id
+            last = book_id
+
+
+def parse_query(query: str) -> List[List[str]]:
+    """
+    Zamień zapytanie na listę grup tokenów
+
+    Tokeny w grupie są łączone przez AND, grupy rozdziela słowo OR:
+    "george orwell OR huxley" -> [["george", "orwell"], ["huxley"]]
+    """
+    groups = []
+    for part in re.split(r"\s+OR\s+", query.strip()):
+        tokens = tokenize(part)
+        if tokens:
+            groups.append(tokens)
+    return groups
+
+
+# Search Iterator - GOTOWE
+# WZORZEC: Kolejny konkretny iterator - ten sam interfejs, inny sposób przechodzenia
+
+class BookSearchIterator(Iterator):
+    """Iterator po książkach pasujących do zapytania (wyniki liczone leniwie)"""
+
+    def __init__(self, books: List[Book], book_ids: PyIterator[int]):
+        self._books = books
+        self._book_ids = book_ids
+        self._next_id: Optional[int] = None
+        self._advance()
+
+    def _advance(self) -> None:
+        self._next_id = next(self._book_ids, None)
+
+    def has_next(self) -> bool:
+        return self._next_id is not None
+
+    def next(self) -> Book:
+        if self._next_id is None:
+            raise StopIteration
+        book = self._books[self._next_id]
+        self._advance()
+        return book
 
 
 # Aggregate (Collection) - CZĘŚCIOWO GOTOWE
@@ -99,13 +240,54 @@ class BookIterator:
 class BookCollection:
     """Kolekcja książek z enkapsulacją wewnętrznej struktury"""
 
-    def __init__(self):
+    def __init__(self, indexed: bool = False):
         # ENKAPSULACJA: prywatna lista (konwencja _ w Pythonie)
         self._books: List[Book] = []
+        # Opcjonalny indeks odwrócony dla search_iterator()
+        self._index: Optional[InvertedIndex] = InvertedIndex() if indexed else None
 
     def add_book(self, book: Book) -> None:
         """Dodaj książkę do kolekcji"""
         self._books.append(book)
+        if self._index is not None:
+            self._index.add(len(self._books) - 1, book)
+
+    def __iter__(self) -> PyIterator[Book]:
+        """
+        Natywny protokół iteratora Pythona - szybka ścieżka dla pętli for
+
+        Ten sam kontrakt co create_iterator(): kolejność dodawania,
+        referencja do kolekcji (nie kopia), niezależny stan każdego iteratora
+        """
+        return iter(self._books)
+
+    def __reversed__(self) -> PyIterator[Book]:
+        """Iteracja od końca - bez kopiowania listy"""
+        return reversed(self._books)
+
+    def search_iterator(self, query: str) -> Iterator:
+        """
+        Tworzy iterator po książkach pasujących do zapytania
+
+        Bez indeksu (indexed=False) przeszukuje kolekcję liniowo,
+        z indeksem przecina i sumuje posting listy
+        """
+        groups = parse_query(query)
+        if self._index is None:
+            book_ids = self._scan(groups)
+        else:
+            book_ids = _union(
+                _intersect([self._index.postings(token) for token in group])
+                for group in groups
+            )
+        return BookSearchIterator(self._books, book_ids)
+
+    def _scan(self, groups: List[List[str]]) -> PyIterator[int]:
+        """Pełny skan kolekcji - ta sama semantyka co zapytanie po indeksie"""
+        for book_id, book in enumerate(self._books):
+            tokens = set(tokenize(book.title) + tokenize(book.author))
+            if any(tokens.issuperset(group) for group in groups):
+                yield book_id
 
     # TODO: Zaimplementuj create_iterator
     # Zwraca nowy BookIterator z self._books
@@ -0,0 +1,74 @@
+"""
+Testy dla Iterator Pattern - natywna iteracja i next_batch()
+"""
+
+from starter import Book, BookCollection
+
+
+class TestFastPaths:
+    """Testy szybkich ścieżek: natywny protokół Pythona i next_batch()"""
+
+    def _collection(self, count=5):
+        collection = BookCollection()
+        for i in range(count):
+            collection.add_book(Book(f"Book {i}", f"Author {i}", 2000 + i))
+        return collection
+
+    def test_native_iteration_matches_explicit_iterator(self):
+        """Test że for/in daje tę samą kolejność co create_iterator()"""
+        collection = self._collection()
+
+        explicit = []
+        iterator = collection.create_iterator()
+        while iterator.has_next():
+            explicit.append(iterator.next())
+
+        assert list(collection) == explicit
+
+    def test_native_iterators_are_independent(self):
+        """Test że każde iter() ma własny stan"""
+        collection = self._collection()
+
+        first = iter(collection)
+        next(first)
+        second = iter(collection)
+
+        assert next(second).title == "Book 0"
+        assert next(first).title == "Book 1"
+
+    def test_native_iteration_sees_added_books(self):
+        """Test że natywny iterator trzyma referencję, nie kopię"""
+        collection = self._collection(1)
+
+        iterator = iter(collection)
+        collection.add_book(Book("Added", "Author", 2024))
+
+        assert [book.title for book in iterator] == ["Book 0", "Added"]
+
+    def test_reversed(self):
+        """Test iteracji od końca"""
+        collection = self._collection(3)
+
+        assert [book.title for book in reversed(collection)] == ["Book 2", "Book 1", "Book 0"]
+
+    def test_next_batch(self):
+        """Test że next_batch() zwraca paczki i pustą listę na końcu"""
+        iterator = self._collection(5).create_iterator()
+
+        assert [book.title for book in iterator.next_batch(2)] == ["Book 0", "Book 1"]
+        assert iterator.next().title == "Book 2"
+        assert [book.title for book in iterator.next_batch(10)] == ["Book 3", "Book 4"]
+        assert iterator.next_batch(10) == []
+        assert iterator.has_next() is False
+
+    def test_default_next_batch_on_search_iterator(self):
+        """Test domyślnego next_batch() z interfejsu Iterator"""
+        collection = BookCollection(indexed=True)
+        for i in range(5):
+            collection.add_book(Book(f"Book {i}", "Same Author", 2000 + i))
+
+        iterator = collection.search_iterator("same author")
+
+        assert len(iterator.next_batch(3)) == 3
+        assert len(iterator.next_batch(3)) == 2
+        assert iterator.next_batch(3) == []
@@ -0,0 +1,110 @@
+"""
+Testy dla Iterator Pattern - indeks odwrócony i BookSearchIterator
+"""
+
+import bisect
+import inspect
+import pytest
+import starter
+from starter import Book, Iterator, BookCollection, BookSearchIterator, InvertedIndex
+
+
+class TestBookSearchIterator:
+    """Testy wyszukiwania przez indeks odwrócony"""
+
+    def _collection(self, indexed=True):
+        collection = BookCollection(indexed=indexed)
+        collection.add_book(Book("Animal Farm", "George Orwell", 1945))
+        collection.add_book(Book("Brave New World", "Aldous Huxley", 1932))
+        collection.add_book(Book("1984", "George Orwell", 1949))
+        collection.add_book(Book("Island", "Aldous Huxley", 1962))
+        return collection
+
+    def _titles(self, iterator):
+        titles = []
+        while iterator.has_next():
+            titles.append(iterator.next().title)
+        return titles
+
+    def test_search_iterator_implements_interface(self):
+        """Test że search_iterator zwraca Iterator"""
+        iterator = self._collection().search_iterator("orwell")
+
+        assert isinstance(iterator, Iterator)
+        assert isinstance(iterator, BookSearchIterator)
+
+    def test_index_updated_on_add_book(self):
+        """Test że książka dodana po zbudowaniu indeksu jest od razu wyszukiwalna"""
+        collection = self._collection()
+
+        assert self._titles(collection.search_iterator("orwell")) == ["Animal Farm", "1984"]
+        collection.add_book(Book("Homage to Catalonia", "George Orwell", 1938))
+        assert self._titles(collection.search_iterator("orwell")) == ["Animal Farm", "1984", "Homage to Catalonia"]
+        assert self._titles(collection.search_iterator("catalonia")) == ["Homage to Catalonia"]
+
+    def test_search_by_title_and_author(self):
+        """Test wyszukiwania po słowie z tytułu i po autorze"""
+        collection = self._collection()
+
+        assert self._titles(collection.search_iterator("farm")) == ["Animal Farm"]
+        assert self._titles(collection.search_iterator("Huxley")) == ["Brave New World", "Island"]
+
+    def test_terms_are_intersected(self):
+        """Test że kilka słów w zapytaniu to AND"""
+        collection = self._collection()
+
+        assert self._titles(collection.search_iterator("huxley island")) == ["Island"]
+        assert self._titles(collection.search_iterator("huxley farm")) == []
+
+    def test_or_groups_are_united_in_collection_order(self):
+        """Test że grupy OR są sumowane bez duplikatów, w kolejności kolekcji"""
+        collection = self._collection()
+
+        titles = self._titles(collection.search_iterator("island OR orwell OR huxley"))
+
+        assert titles == ["Animal Farm", "Brave New World", "1984", "Island"]
+
+    def test_unknown_token_and_exhausted_iterator(self):
+        """Test pustego wyniku i StopIteration na końcu"""
+        iterator = self._collection().search_iterator("tolkien")
+
+        assert iterator.has_next() is False
+        with pytest.raises(StopIteration):
+            iterator.next()
+
+    def test_scan_matches_index(self):
+        """Test że kolekcja bez indeksu zwraca te same wyniki"""
+        for query in ["orwell", "aldous huxley", "1984 OR island", "nothing"]:
+            indexed = self._titles(self._collection(True).search_iterator(query))
+            scanned = self._titles(self._collection(False).search_iterator(query))
+            assert indexed == scanned
+
+    def test_intersection_is_lazy(self, monkeypatch):
+        """Test że wyniki są liczone leniwie, a nie materializowane z góry"""
+        collection = BookCollection(indexed=True)
+        for year in range(1000):
+            collection.add_book(Book(f"Volume {year}", "Same Author", year))
+        calls = []
+
+        def counting_bisect_left(*args):
+            calls.append(args[1])
+            return bisect.bisect_left(*args)
+
+        monkeypatch.setattr(starter, "bisect_left", counting_bisect_left)
+        iterator = collection.search_iterator("same author volume")
+
+        assert iterator.next().year == 0
+        assert iterator.next().year == 1
+        # Generator wciąż zawieszony, a bisekcje tylko dla kilku pierwszych id (nie 2 x 1000)
+        assert inspect.getgeneratorstate(iterator._book_ids) == inspect.GEN_SUSPENDED
+        assert len(calls) <= 2 * 3
+        assert iterator.has_next()
+
+    def test_inverted_index_standalone(self):
+        """Test indeksu odwróconego niezależnie od kolekcji"""
+        index = InvertedIndex()
+        index.add(0, Book("The Hobbit", "J.R.R. Tolkien", 1937))
+
+        assert index.postings("hobbit") == [0]
+        assert index.postings("tolkien") == [0]
+        assert index.postings("missing") == []